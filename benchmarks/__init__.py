@@ -0,0 +1,11 @@
+"""Microbenchmarks for celery-fastapi hot paths.
+
+Run a benchmark as a module from the repository root, e.g.::
+
+    python -m benchmarks.bench_payload_plan
+
+Available benchmarks:
+    - bench_payload_plan: Building send_task options from payloads
+    - bench_http: Requests/sec and latency percentiles of the HTTP endpoints
+    - bench_responses: Encoding listing and worker responses of a large cluster
+"""
@@ -0,0 +1,325 @@
+"""End-to-end HTTP benchmark of a bridged app on an in-memory broker.
+
+Builds a Celery app with N generated tasks on ``memory://`` and
+``cache+memory://``, bridges it, and drives it in-process through httpx's
+ASGI transport (no sockets), measuring requests per second and latency
+percentiles for each scenario, task count and concurrency level:
+
+    submit           POST /bench/task_<i>  (rotating over all tasks)
+    trigger          POST /trigger
+    status           GET  /tasks/{task_id}
+    available_tasks  GET  /available-tasks
+
+Results are printed as a table and can be written as JSON. Passing a previous
+JSON file as ``--baseline`` exits with status 1 if any scenario's throughput
+dropped by more than ``--max-regression``::
+
+    python -m benchmarks.bench_http --output before.json
+    python -m benchmarks.bench_http --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from celery import Celery, states
+
+from celery_fastapi import CeleryFastAPIBridge, __version__
+from celery_fastapi.inspector import ClusterInspector
+
+SCENARIOS = ("submit", "trigger", "status", "available_tasks")
+
+# Request factory: (request index) -> (method, path, JSON body)
+RequestFactory = Callable[[int], tuple[str, str, Any]]
+
+
+def create_celery_app(task_count: int) -> Celery:
+    """Create a Celery app on the in-memory transports with generated tasks."""
+    celery_app = Celery(
+        f"bench_{task_count}", broker="memory://", backend="cache+memory://"
+    )
+
+    def make_task(index: int) -> Callable[..., int]:
+        def task(x: int, y: int = 0) -> int:
+            return x + y + index
+
+        return task
+
+    for index in range(task_count):
+        celery_app.task(name=f"bench.task_{index}")(make_task(index))
+    return celery_app
+
+
+def create_bridge(
+    celery_app: Celery, *, lazy_task_routes: bool, dispatch_task_routes: bool = False
+) -> CeleryFastAPIBridge:
+    """Bridge the app, without the background cluster inspection."""
+    bridge = CeleryFastAPIBridge(
+        celery_app,
+        cluster_inspector=ClusterInspector(celery_app, background=False),
+        lazy_task_routes=lazy_task_routes,
+        dispatch_task_routes=dispatch_task_routes,
+    )
+    bridge.register_routes()
+    return bridge
+
+
+def request_factories(celery_app: Celery, task_count: int) -> dict[str, RequestFactory]:
+    """Return the request factory of each scenario."""
+    task_id = "bench-status"
+    celery_app.backend.store_result(task_id, {"total": 3}, states.SUCCESS)
+    return {
+        "submit": lambda i: (
+            "POST",
+            f"/bench/task_{i % task_count}",
+            {"x": i, "y": 1},
+        ),
+        "trigger": lambda i: (
+            "POST",
+            "/trigger",
+            {"task_name": "bench.task_0", "queue": "celery", "args": [i, 1]},
+        ),
+        "status": lambda _: ("GET", f"/tasks/{task_id}", None),
+        "available_tasks": lambda _: ("GET", "/available-tasks", None),
+    }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return a percentile of sorted values by nearest rank."""
+    index = min(
+        len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    factory: RequestFactory,
+    *,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Issue ``requests`` requests from ``concurrency`` concurrent clients."""
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in counter:
+            method, path, body = factory(index)
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    # Warm up caches (payload models, result fetcher threads) first
+    for index in range(min(10, requests)):
+        method, path, body = factory(index)
+        await client.request(method, path, json=body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": requests / elapsed,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p90": percentile(latencies, 0.90) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": latencies[-1] * 1000,
+        },
+    }
+
+
+async def run_scale(
+    task_count: int,
+    *,
+    scenarios: list[str],
+    concurrency_levels: list[int],
+    requests: int,
+    lazy_task_routes: bool,
+    dispatch_task_routes: bool = False,
+) -> list[dict[str, Any]]:
+    """Benchmark every scenario and concurrency level for one task count."""
+    celery_app = create_celery_app(task_count)
+    started = time.perf_counter()
+    bridge = create_bridge(
+        celery_app,
+        lazy_task_routes=lazy_task_routes,
+        dispatch_task_routes=dispatch_task_routes,
+    )
+    build_seconds = time.perf_counter() - started
+    factories = request_factories(celery_app, task_count)
+
+    results: list[dict[str, Any]] = []
+    await bridge.startup()
+    try:
+        transport = httpx.ASGITransport(app=bridge.fastapi_app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for scenario in scenarios:
+                for concurrency in concurrency_levels:
+                    result = await run_scenario(
+                        client,
+                        factories[scenario],
+                        requests=requests,
+                        concurrency=concurrency,
+                    )
+                    result.update(
+                        scenario=scenario,
+                        tasks=task_count,
+                        concurrency=concurrency,
+                        build_seconds=build_seconds,
+                    )
+                    results.append(result)
+                    _print_result(result)
+    finally:
+        await bridge.shutdown()
+    return results
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    latency = result["latency_ms"]
+    print(
+        f"{result['scenario']:<16} tasks={result['tasks']:<6} "
+        f"c={result['concurrency']:<4} {result['rps']:9.0f} req/s  "
+        f"p50 {latency['p50']:7.2f} ms  p90 {latency['p90']:7.2f} ms  "
+        f"p99 {latency['p99']:7.2f} ms  errors {result['errors']}",
+        flush=True,
+    )
+
+
+def result_key(result: dict[str, Any]) -> tuple[str, int, int]:
+    """Identify a result across runs."""
+    return result["scenario"], result["tasks"], result["concurrency"]
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], max_regression: float
+) -> list[str]:
+    """Return a description of each result slower than its baseline."""
+    previous = {result_key(result): result for result in baseline}
+    regressions: list[str] = []
+    for result in results:
+        before = previous.get(result_key(result))
+        if before is None:
+            continue
+        change = result["rps"] / before["rps"] - 1
+        if change < -max_regression:
+            scenario, tasks, concurrency = result_key(result)
+            regressions.append(
+                f"{scenario} tasks={tasks} c={concurrency}: "
+                f"{before['rps']:.0f} -> {result['rps']:.0f} req/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tasks",
+        type=_int_list,
+        default=[10, 1000, 10000],
+        help="Comma-separated task counts (default: 10,1000,10000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_int_list,
+        default=[1, 10, 100],
+        help="Comma-separated concurrency levels (default: 1,10,100)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Requests per measurement"
+    )
+    parser.add_argument(
+        "--lazy-routes",
+        action="store_true",
+        help="Serve task endpoints from the lazy catch-all route",
+    )
+    parser.add_argument(
+        "--dispatch-routes",
+        action="store_true",
+        help="Serve the per-task routes through the path lookup dispatch route",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed throughput drop against the baseline (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = [name for name in args.scenarios.split(",") if name]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results: list[dict[str, Any]] = []
+    for task_count in args.tasks:
+        results.extend(
+            asyncio.run(
+                run_scale(
+                    task_count,
+                    scenarios=scenarios,
+                    concurrency_levels=args.concurrency,
+                    requests=args.requests,
+                    lazy_task_routes=args.lazy_routes,
+                    dispatch_task_routes=args.dispatch_routes,
+                )
+            )
+        )
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "lazy_routes": args.lazy_routes,
+        "dispatch_routes": args.dispatch_routes,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)["results"]
+        regressions = compare(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
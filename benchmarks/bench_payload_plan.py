@@ -0,0 +1,141 @@
+"""Benchmark building send_task options from task payloads.
+
+Compares the precompiled PayloadPlan used by the task endpoints with the
+per-request field loops and ``if`` chain it replaced.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from pydantic import BaseModel
+
+from celery_fastapi.core import (
+    CELERY_OPTIONS_FIELDS,
+    GenericTaskPayload,
+    PayloadPlan,
+    _create_task_payload_model,
+    _generic_send_options,
+)
+
+
+def legacy_task_send_options(payload: BaseModel, queue: str) -> dict[str, Any]:
+    """Per-request field loops, as done before payload plans."""
+    celery_option_names = set(CELERY_OPTIONS_FIELDS.keys())
+    task_kwargs: dict[str, Any] = {}
+    for field_name in type(payload).model_fields:
+        if field_name not in celery_option_names:
+            value = getattr(payload, field_name, None)
+            if value is not None:
+                task_kwargs[field_name] = value
+    send_options: dict[str, Any] = {"args": [], "kwargs": task_kwargs, "queue": queue}
+    for opt_name in celery_option_names:
+        value = getattr(payload, opt_name, None)
+        if value is not None and opt_name != "queue":
+            send_options[opt_name] = value
+    return send_options
+
+
+def legacy_generic_send_options(payload: GenericTaskPayload) -> dict[str, Any]:
+    """The ``if`` chain over generic options, as done before payload plans."""
+    send_options: dict[str, Any] = {
+        "args": payload.args,
+        "kwargs": payload.kwargs,
+        "queue": payload.queue,
+    }
+    if payload.countdown is not None:
+        send_options["countdown"] = payload.countdown
+    if payload.eta is not None:
+        send_options["eta"] = payload.eta
+    if payload.expires is not None:
+        send_options["expires"] = payload.expires
+    if payload.retry is not None:
+        send_options["retry"] = payload.retry
+    if payload.retry_policy is not None:
+        send_options["retry_policy"] = payload.retry_policy
+    if payload.exchange is not None:
+        send_options["exchange"] = payload.exchange
+    if payload.routing_key is not None:
+        send_options["routing_key"] = payload.routing_key
+    if payload.priority is not None:
+        send_options["priority"] = payload.priority
+    if payload.serializer is not None:
+        send_options["serializer"] = payload.serializer
+    if payload.compression is not None:
+        send_options["compression"] = payload.compression
+    if payload.headers is not None:
+        send_options["headers"] = payload.headers
+    if payload.task_id is not None:
+        send_options["task_id"] = payload.task_id
+    if payload.ignore_result is not None:
+        send_options["ignore_result"] = payload.ignore_result
+    if payload.time_limit is not None:
+        send_options["time_limit"] = payload.time_limit
+    if payload.soft_time_limit is not None:
+        send_options["soft_time_limit"] = payload.soft_time_limit
+    return send_options
+
+
+def add(x: int, y: int, scale: float = 1.0, label: str | None = None) -> str:
+    """Task function whose signature the benchmark payload is built from."""
+    return f"{label or 'sum'}: {(x + y) * scale}"
+
+
+def _report(name: str, legacy: float, planned: float, number: int) -> None:
+    per_call = 1e9 / number
+    print(
+        f"{name:<10} legacy {legacy * per_call:8.0f} ns  "
+        f"plan {planned * per_call:8.0f} ns  "
+        f"speedup {legacy / planned:5.2f}x"
+    )
+
+
+def main(number: int = 200_000, repeat: int = 5) -> None:
+    """Run the benchmark and print the best time per call."""
+    model = _create_task_payload_model("bench.add", add, "celery")
+    plan = PayloadPlan(model)
+    payload = model(x=1, y=2, countdown=10, priority=5)
+    assert plan.send_options(payload, "celery") == legacy_task_send_options(
+        payload, "celery"
+    )
+
+    legacy = min(
+        timeit.repeat(
+            lambda: legacy_task_send_options(payload, "celery"),
+            number=number,
+            repeat=repeat,
+        )
+    )
+    planned = min(
+        timeit.repeat(
+            lambda: plan.send_options(payload, "celery"),
+            number=number,
+            repeat=repeat,
+        )
+    )
+    _report("per-task", legacy, planned, number)
+
+    generic = GenericTaskPayload(
+        task_name="bench.add", queue="celery", args=[1, 2], countdown=10
+    )
+    assert _generic_send_options(generic) == legacy_generic_send_options(generic)
+    legacy = min(
+        timeit.repeat(
+            lambda: legacy_generic_send_options(generic),
+            number=number,
+            repeat=repeat,
+        )
+    )
+    planned = min(
+        timeit.repeat(
+            lambda: _generic_send_options(generic),
+            number=number,
+            repeat=repeat,
+        )
+    )
+    _report("generic", legacy, planned, number)
+
+
+if __name__ == "__main__":
+    main()
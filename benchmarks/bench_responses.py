@@ -0,0 +1,248 @@
+"""Benchmark encoding status, listing and worker responses.
+
+Serves realistic inspect replies of a 100-worker cluster (stats, registered
+tasks, active, reserved and scheduled requests, queues) and compares the
+default responses, validated against their response model and encoded by
+FastAPI, with ``fast_responses=True``, which sends the data the bridge built
+through orjson as is::
+
+    python -m benchmarks.bench_responses
+    python -m benchmarks.bench_responses --workers 500 --requests 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import httpx
+from celery import Celery, states
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.inspector import ClusterInspector
+
+TASK_NAMES = [f"bench.jobs.task_{index}" for index in range(50)]
+ENDPOINTS = ("/tasks", "/workers", "/queues", "/tasks/bench-status")
+
+
+def task_request(worker: str, index: int, *, eta: bool = False) -> dict[str, Any]:
+    """Return a task request as reported by ``inspect active/reserved``."""
+    request: dict[str, Any] = {
+        "id": f"{worker}-{index:08x}-4f1c-9b1e-2d7c5a0e9f31",
+        "name": TASK_NAMES[index % len(TASK_NAMES)],
+        "args": [index, f"customer-{index}", {"region": "eu-west-1"}],
+        "kwargs": {"retries": 3, "dry_run": False, "tags": ["billing", "nightly"]},
+        "type": TASK_NAMES[index % len(TASK_NAMES)],
+        "hostname": worker,
+        "time_start": 1760000000.0 + index,
+        "acknowledged": True,
+        "delivery_info": {
+            "exchange": "",
+            "routing_key": "celery",
+            "priority": 0,
+            "redelivered": False,
+        },
+        "worker_pid": 4000 + index,
+    }
+    if eta:
+        return {"eta": "2026-10-17T12:00:00+00:00", "priority": 6, "request": request}
+    return request
+
+
+def worker_stats(index: int) -> dict[str, Any]:
+    """Return the ``inspect stats`` reply of a worker."""
+    return {
+        "broker": {
+            "hostname": "rabbitmq.internal",
+            "userid": "celery",
+            "virtual_host": "/",
+            "port": 5672,
+            "insist": False,
+            "ssl": False,
+            "transport": "amqp",
+            "connect_timeout": 4,
+            "transport_options": {},
+            "login_method": "PLAIN",
+            "uri_prefix": None,
+            "heartbeat": 120.0,
+            "failover_strategy": "round-robin",
+            "alternates": [],
+        },
+        "clock": str(120000 + index),
+        "uptime": 86400 + index,
+        "pid": 1000 + index,
+        "pool": {
+            "implementation": "celery.concurrency.prefork:TaskPool",
+            "max-concurrency": 16,
+            "processes": list(range(2000, 2016)),
+            "max-tasks-per-child": 1000,
+            "put-guarded-by-semaphore": False,
+            "timeouts": [0, 0],
+            "writes": {
+                "total": 250000,
+                "avg": "6.25%",
+                "all": ", ".join(["6.25%"] * 16),
+                "raw": ", ".join(["15625"] * 16),
+                "strategy": "fair",
+                "inqueues": {"total": 16, "active": 4},
+            },
+        },
+        "prefetch_count": 64,
+        "rusage": {
+            "utime": 12345.6,
+            "stime": 2345.6,
+            "maxrss": 245760,
+            "ixrss": 0,
+            "idrss": 0,
+            "isrss": 0,
+            "minflt": 1234567,
+            "majflt": 12,
+            "nswap": 0,
+            "inblock": 1024,
+            "oublock": 4096,
+            "msgsnd": 0,
+            "msgrcv": 0,
+            "nsignals": 0,
+            "nvcsw": 234567,
+            "nivcsw": 34567,
+        },
+        "total": {name: 1000 + position for position, name in enumerate(TASK_NAMES)},
+    }
+
+
+def cluster_replies(workers: int) -> dict[str, dict[str, Any]]:
+    """Return the replies of every inspect command for a cluster."""
+    names = [f"celery@worker-{index:03d}.internal" for index in range(workers)]
+    queue: dict[str, Any] = {
+        "name": "celery",
+        "exchange": {
+            "name": "celery",
+            "type": "direct",
+            "arguments": None,
+            "durable": True,
+            "passive": False,
+            "auto_delete": False,
+            "delivery_mode": None,
+            "no_declare": False,
+        },
+        "routing_key": "celery",
+        "queue_arguments": None,
+        "binding_arguments": None,
+        "consumer_arguments": None,
+        "durable": True,
+        "exclusive": False,
+        "auto_delete": False,
+        "no_ack": False,
+        "alias": None,
+        "bindings": [],
+        "no_declare": None,
+        "expires": None,
+        "message_ttl": None,
+        "max_length": None,
+        "max_length_bytes": None,
+        "max_priority": None,
+    }
+    return {
+        "active": {name: [task_request(name, i) for i in range(8)] for name in names},
+        "reserved": {
+            name: [task_request(name, i) for i in range(8, 24)] for name in names
+        },
+        "scheduled": {
+            name: [task_request(name, i, eta=True) for i in range(24, 28)]
+            for name in names
+        },
+        "revoked": {name: [] for name in names},
+        "ping": {name: {"ok": "pong"} for name in names},
+        "stats": {name: worker_stats(i) for i, name in enumerate(names)},
+        "registered": {name: list(TASK_NAMES) for name in names},
+        "active_queues": {name: [queue] for name in names},
+    }
+
+
+def noop() -> None:
+    """Body of the benchmark tasks."""
+
+
+class CannedInspect:
+    """Stands in for ``app.control.inspect()``, replying with canned data."""
+
+    def __init__(self, replies: dict[str, dict[str, Any]]) -> None:
+        self.replies = replies
+
+    def __getattr__(self, command: str) -> Any:
+        return lambda: self.replies[command]
+
+
+def create_bridge(workers: int, *, fast_responses: bool) -> CeleryFastAPIBridge:
+    """Bridge an app whose inspect commands return a canned cluster."""
+    celery_app = Celery(
+        "bench_responses", broker="memory://", backend="cache+memory://"
+    )
+    for name in TASK_NAMES:
+        celery_app.task(name=name)(noop)
+    replies = cluster_replies(workers)
+    celery_app.control.inspect = lambda **_: CannedInspect(replies)
+    celery_app.backend.store_result(
+        "bench-status", {"rows": list(range(100))}, states.SUCCESS
+    )
+    bridge = CeleryFastAPIBridge(
+        celery_app,
+        cluster_inspector=ClusterInspector(
+            celery_app, refresh_interval=3600, background=False
+        ),
+        fast_responses=fast_responses,
+    )
+    bridge.register_routes()
+    return bridge
+
+
+async def measure(
+    workers: int, requests: int, *, fast_responses: bool
+) -> dict[str, tuple[float, int]]:
+    """Return the mean latency and body size of each endpoint."""
+    bridge = create_bridge(workers, fast_responses=fast_responses)
+    timings: dict[str, tuple[float, int]] = {}
+    await bridge.startup()
+    try:
+        transport = httpx.ASGITransport(app=bridge.fastapi_app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for path in ENDPOINTS:
+                response = await client.get(path)
+                response.raise_for_status()
+                started = time.perf_counter()
+                for _ in range(requests):
+                    await client.get(path)
+                elapsed = (time.perf_counter() - started) / requests
+                timings[path] = (elapsed, len(response.content))
+    finally:
+        await bridge.shutdown()
+    return timings
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the mean latency per endpoint."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=100, help="Cluster size")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per endpoint"
+    )
+    args = parser.parse_args(argv)
+
+    default = asyncio.run(measure(args.workers, args.requests, fast_responses=False))
+    fast = asyncio.run(measure(args.workers, args.requests, fast_responses=True))
+    for path in ENDPOINTS:
+        (slow_time, size), (fast_time, _) = default[path], fast[path]
+        print(
+            f"{path:<20} {size / 1024:8.0f} KiB  "
+            f"default {slow_time * 1000:8.2f} ms  "
+            f"fast {fast_time * 1000:8.2f} ms  "
+            f"speedup {slow_time / fast_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
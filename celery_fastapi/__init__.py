@@ -13,6 +13,13 @@ from celery_fastapi.core import (
     TaskRevokePayload,
     TaskStatusResponse,
 )
+from celery_fastapi.publisher import (
+    BatchingPublisher,
+    InlinePublisher,
+    ProducerPool,
+    TaskPublisher,
+    ThreadPoolPublisher,
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -23,5 +30,10 @@ __all__ = [
     "TaskResponse",
     "TaskStatusResponse",
     "TaskRevokePayload",
+    "TaskPublisher",
+    "ThreadPoolPublisher",
+    "InlinePublisher",
+    "BatchingPublisher",
+    "ProducerPool",
     "__version__",
 ]
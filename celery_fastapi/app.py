@@ -10,6 +10,7 @@ from celery import Celery
 from fastapi import FastAPI
 
 from celery_fastapi.core import CeleryFastAPIBridge
+from celery_fastapi.publisher import TaskPublisher
 
 
 def load_celery_app(celery_app_path: str) -> Celery:
@@ -84,6 +85,10 @@ def create_app(
     version: str = "1.0.0",
     prefix: str = "",
     include_status_endpoints: bool = True,
+    publisher: TaskPublisher | str = "thread",
+    lazy_task_routes: bool = False,
+    dispatch_task_routes: bool = False,
+    schema_cache: str | None = None,
     fastapi_kwargs: dict[str, Any] | None = None,
 ) -> FastAPI:
     """
@@ -100,6 +105,16 @@ def create_app(
         version: API version string.
         prefix: URL prefix for all endpoints.
         include_status_endpoints: Whether to include /tasks and /tasks/{id} endpoints.
+        publisher: Task submission engine ("thread", "inline", "batch" or a
+                  TaskPublisher).
+        lazy_task_routes: Serve task endpoints from one catch-all route that
+                         builds payload models on first use (faster startup
+                         for apps with many tasks).
+        dispatch_task_routes: Serve the per-task routes through one route that
+                             looks tasks up by path (faster request routing
+                             for apps with many tasks).
+        schema_cache: Directory caching the generated OpenAPI document across
+                     restarts and worker processes.
         fastapi_kwargs: Additional keyword arguments to pass to FastAPI.
 
     Returns:
@@ -143,6 +158,10 @@ def create_app(
         fastapi_app=fastapi_app,
         prefix=prefix,
         include_status_endpoints=include_status_endpoints,
+        publisher=publisher,
+        lazy_task_routes=lazy_task_routes,
+        dispatch_task_routes=dispatch_task_routes,
+        schema_cache=schema_cache,
     )
 
     # Register all routes
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from enum import Enum
 from typing import Annotated, Any
 
@@ -18,6 +19,8 @@ except ImportError:
     )
     sys.exit(1)
 
+from celery_fastapi.server import process_memory
+
 
 class LogLevel(str, Enum):
     """Log level options."""
@@ -84,6 +87,9 @@ def _create_app_from_env() -> Any:
     celery_app = os.environ.get("CELERY_FASTAPI_CELERY_APP")
     prefix = os.environ.get("CELERY_FASTAPI_PREFIX", "")
     root_path = os.environ.get("CELERY_FASTAPI_ROOT_PATH", "")
+    lazy_routes = os.environ.get("CELERY_FASTAPI_LAZY_ROUTES") == "1"
+    dispatch_routes = os.environ.get("CELERY_FASTAPI_DISPATCH_ROUTES") == "1"
+    schema_cache = os.environ.get("CELERY_FASTAPI_SCHEMA_CACHE") or None
 
     if not celery_app:
         raise ValueError("CELERY_FASTAPI_CELERY_APP environment variable not set")
@@ -92,10 +98,22 @@ def _create_app_from_env() -> Any:
         celery_app,
         title="Celery FastAPI",
         prefix=prefix,
+        lazy_task_routes=lazy_routes,
+        dispatch_task_routes=dispatch_routes,
+        schema_cache=schema_cache,
         fastapi_kwargs={"root_path": root_path} if root_path else None,
     )
 
 
+def _print_build_time(started: float) -> None:
+    """Print how long building the app took."""
+    memory = process_memory()
+    message = f"[green]✓[/] Built app in {time.perf_counter() - started:.2f}s"
+    if "rss" in memory:
+        message += f", RSS {memory['rss'] / 2**20:.1f} MiB"
+    console.print(message)
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -258,6 +276,33 @@ def serve(
         str,
         typer.Option("--root-path", help="ASGI root_path for apps behind proxies"),
     ] = "",
+    lazy_routes: Annotated[
+        bool,
+        typer.Option(
+            "--lazy-routes/--no-lazy-routes",
+            help="Build task payload models on first request instead of at startup",
+        ),
+    ] = False,
+    dispatch_routes: Annotated[
+        bool,
+        typer.Option(
+            "--dispatch-routes/--no-dispatch-routes",
+            help="Route task requests by a path lookup instead of a route scan",
+        ),
+    ] = False,
+    schema_cache: Annotated[
+        str | None,
+        typer.Option(
+            "--schema-cache", help="Directory caching the generated OpenAPI document"
+        ),
+    ] = None,
+    prefork: Annotated[
+        bool,
+        typer.Option(
+            "--prefork/--no-prefork",
+            help="Build the app once and fork workers sharing its memory",
+        ),
+    ] = True,
     # H11 max incomplete event size
     h11_max_incomplete_event_size: Annotated[
         int | None,
@@ -311,12 +356,17 @@ def serve(
     console.print(f"[green]✓[/] Loaded Celery app: [bold]{celery_instance.main}[/]")
 
     # Create the FastAPI app
+    build_started = time.perf_counter()
     fastapi_app = create_app(
         celery_instance,
         title=f"Celery FastAPI - {celery_instance.main}",
         prefix=prefix,
+        lazy_task_routes=lazy_routes,
+        dispatch_task_routes=dispatch_routes,
+        schema_cache=schema_cache,
         fastapi_kwargs={"root_path": root_path} if root_path else None,
     )
+    _print_build_time(build_started)
 
     # Show registered routes
     bridge = fastapi_app.state.celery_bridge
@@ -398,11 +448,27 @@ def serve(
     console.print("[dim]Press CTRL+C to stop[/]\n")
 
     # Run the server
+    if workers > 1 and prefork and not reload and hasattr(os, "fork"):
+        # Fork workers sharing the app built above
+        from celery_fastapi.server import PreforkServer
+
+        prefork_config = {
+            key: value
+            for key, value in uvicorn_config.items()
+            if key != "workers" and not key.startswith("reload")
+        }
+        PreforkServer(fastapi_app, workers, **prefork_config).run()
     # When using workers > 1 or reload, we need to use an import string
-    if workers > 1 or reload:
+    elif workers > 1 or reload:
         # Set environment variables for the factory to use
         os.environ["CELERY_FASTAPI_CELERY_APP"] = celery_app
         os.environ["CELERY_FASTAPI_PREFIX"] = prefix
+        if lazy_routes:
+            os.environ["CELERY_FASTAPI_LAZY_ROUTES"] = "1"
+        if dispatch_routes:
+            os.environ["CELERY_FASTAPI_DISPATCH_ROUTES"] = "1"
+        if schema_cache:
+            os.environ["CELERY_FASTAPI_SCHEMA_CACHE"] = schema_cache
         if root_path:
             os.environ["CELERY_FASTAPI_ROOT_PATH"] = root_path
 
@@ -544,11 +610,39 @@ def serve_gunicorn(
         str | None,
         typer.Option("--chdir", help="Change to this directory before loading app"),
     ] = None,
+    # Pre-fork options
+    prefork: Annotated[
+        bool,
+        typer.Option(
+            "--prefork/--no-prefork",
+            help="Build the app once and fork workers sharing its memory",
+        ),
+    ] = True,
     # FastAPI options
     prefix: Annotated[
         str,
         typer.Option("--prefix", help="URL prefix for all endpoints"),
     ] = "",
+    lazy_routes: Annotated[
+        bool,
+        typer.Option(
+            "--lazy-routes/--no-lazy-routes",
+            help="Build task payload models on first request instead of at startup",
+        ),
+    ] = False,
+    dispatch_routes: Annotated[
+        bool,
+        typer.Option(
+            "--dispatch-routes/--no-dispatch-routes",
+            help="Route task requests by a path lookup instead of a route scan",
+        ),
+    ] = False,
+    schema_cache: Annotated[
+        str | None,
+        typer.Option(
+            "--schema-cache", help="Directory caching the generated OpenAPI document"
+        ),
+    ] = None,
 ) -> None:
     """
     Start the FastAPI server using Gunicorn with uvicorn workers.
@@ -589,11 +683,16 @@ def serve_gunicorn(
     console.print(f"[green]✓[/] Loaded Celery app: [bold]{celery_instance.main}[/]")
 
     # Create the FastAPI app
+    build_started = time.perf_counter()
     fastapi_app = create_app(
         celery_instance,
         title=f"Celery FastAPI - {celery_instance.main}",
         prefix=prefix,
+        lazy_task_routes=lazy_routes,
+        dispatch_task_routes=dispatch_routes,
+        schema_cache=schema_cache,
     )
+    _print_build_time(build_started)
 
     # Show registered routes
     bridge = fastapi_app.state.celery_bridge
@@ -648,6 +747,11 @@ def serve_gunicorn(
     if chdir:
         options["chdir"] = chdir
 
+    if prefork:
+        from celery_fastapi.server import prefork_hooks
+
+        options.update(prefork_hooks())
+
     console.print(f"\n[bold green]Starting Gunicorn server at {bind}[/]")
     console.print("[dim]Press CTRL+C to stop[/]\n")
 
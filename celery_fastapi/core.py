@@ -1,14 +1,69 @@
 """Core functionality for Celery FastAPI."""
 
+import asyncio
+import hashlib
 import inspect
-from collections.abc import Callable
+import json
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
 from datetime import datetime
-from typing import Any, get_type_hints
-
-from celery import Celery
-from celery.result import AsyncResult
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field, create_model
+from typing import Any, TypeVar, get_type_hints
+
+from celery import Celery, states
+from fastapi import (
+    Body,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+from starlette.background import BackgroundTask
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+from starlette.websockets import WebSocketDisconnect
+
+from celery_fastapi.events import ClusterEventMonitor
+from celery_fastapi.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyStore,
+    MemoryIdempotencyStore,
+    idempotent_task_id,
+)
+from celery_fastapi.inspector import ClusterInspector
+from celery_fastapi.limits import QueueDepthGuard, RateLimiter, SubmissionRejected
+from celery_fastapi.metrics import BridgeMetrics
+from celery_fastapi.publisher import (
+    ProducerPool,
+    PublisherBusyError,
+    TaskMessage,
+    TaskPublisher,
+    create_publisher,
+)
+from celery_fastapi.responses import FastJSONResponse, require_orjson
+from celery_fastapi.results import (
+    ResultFetcher,
+    TaskMeta,
+    meta_date_done,
+    meta_is_ready,
+)
+from celery_fastapi.schema_cache import SchemaCache, registry_fingerprint
+from celery_fastapi.tracing import BridgeTracer
+from celery_fastapi.watcher import Subscription, TaskWatcher
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
 
 # Celery execution options - shared fields for all task payloads
 CELERY_OPTIONS_FIELDS: dict[str, Any] = {
@@ -233,6 +288,314 @@ def _create_task_payload_model(
     return model
 
 
+class PayloadPlan:
+    """
+    Precompiled split of a payload model into ``send_task`` options.
+
+    The task argument and Celery option field names of the model are
+    resolved once at registration time, so building the options of a
+    request is a single pass over fixed tuples of the payload's values.
+    """
+
+    __slots__ = ("kwarg_fields", "option_fields")
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        """
+        Compile the plan of a payload model.
+
+        Args:
+            model: The payload model. Fields that are not Celery options are
+                  passed as task keyword arguments.
+        """
+        fields = model.model_fields
+        self.kwarg_fields = tuple(
+            name for name in fields if name not in CELERY_OPTIONS_FIELDS
+        )
+        # queue is resolved by the caller
+        self.option_fields = tuple(
+            name for name in fields if name in CELERY_OPTIONS_FIELDS and name != "queue"
+        )
+
+    def send_options(
+        self,
+        payload: BaseModel,
+        queue: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build ``send_task`` options from a payload, skipping unset values.
+
+        Args:
+            payload: A validated instance of the plan's model.
+            queue: The queue to send the task to.
+            args: Positional task arguments.
+            kwargs: Task keyword arguments, instead of the payload's fields.
+        """
+        values = payload.__dict__
+        if kwargs is None:
+            kwargs = {}
+            for name in self.kwarg_fields:
+                value = values[name]
+                if value is not None:
+                    kwargs[name] = value
+        send_options: dict[str, Any] = {
+            "args": [] if args is None else args,
+            "kwargs": kwargs,
+            "queue": queue,
+        }
+        for name in self.option_fields:
+            value = values[name]
+            if value is not None:
+                send_options[name] = value
+        return send_options
+
+
+_GENERIC_PLAN = PayloadPlan(GenericTaskPayload)
+
+
+class _TaskSpec:
+    """Payload model, plan and default queue of a task endpoint."""
+
+    __slots__ = ("task_name", "queue_name", "model", "plan")
+
+    def __init__(self, task_name: str, queue_name: str, model: type[BaseModel]) -> None:
+        self.task_name = task_name
+        self.queue_name = queue_name
+        self.model = model
+        self.plan = PayloadPlan(model)
+
+    def message(
+        self,
+        payload: BaseModel,
+        task_name_override: str | None,
+        queue_override: str | None,
+    ) -> TaskMessage:
+        """Return the task message of a validated payload."""
+        actual_queue = (
+            queue_override or getattr(payload, "queue", None) or self.queue_name
+        )
+        return (
+            task_name_override or self.task_name,
+            self.plan.send_options(payload, actual_queue),
+        )
+
+    def prepare(
+        self, task_name_override: str | None, queue_override: str | None
+    ) -> Callable[[Any], TaskMessage]:
+        """Return a function validating raw payloads into task messages."""
+
+        def prepare(raw: Any) -> TaskMessage:
+            payload = self.model.model_validate(raw)
+            return self.message(payload, task_name_override, queue_override)
+
+        return prepare
+
+
+def _prepare_generic(raw: Any) -> TaskMessage:
+    """Validate a raw generic payload and return its task message."""
+    payload = GenericTaskPayload.model_validate(raw)
+    return payload.task_name, _generic_send_options(payload)
+
+
+def _generic_send_options(payload: GenericTaskPayload) -> dict[str, Any]:
+    """Build ``send_task`` options from a generic task payload."""
+    # Queue is required in GenericTaskPayload
+    return _GENERIC_PLAN.send_options(
+        payload, payload.queue, args=payload.args, kwargs=payload.kwargs
+    )
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Response header set when an Idempotency-Key matched an earlier submission
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def _idempotency_key_header() -> Any:
+    """Return the ``Idempotency-Key`` header parameter of submission endpoints."""
+    return Header(
+        default=None,
+        alias=IDEMPOTENCY_HEADER,
+        max_length=255,
+        description="Repeated submissions with the same key return the original "
+        "task ID instead of publishing the task again",
+    )
+
+
+# Task states seen in events before a worker starts executing the task
+QUEUED_STATES = frozenset({states.PENDING, states.RECEIVED, states.RETRY})
+
+# OpenAPI description of a raw NDJSON request body
+_NDJSON_REQUEST_BODY: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            NDJSON_MEDIA_TYPE: {
+                "schema": {"type": "string", "description": "One JSON payload per line"}
+            }
+        },
+    }
+}
+
+
+class _NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response for NDJSON ingestion endpoints.
+
+    The content iterator itself consumes the request body, so the response
+    must not read from ``receive`` concurrently to watch for disconnects (as
+    StreamingResponse does on older ASGI servers) or it would swallow body
+    chunks. A disconnect surfaces as ``ClientDisconnect`` from the body stream.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG002
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _route_path(scope: Scope) -> str:
+    """Return the path of a request relative to the application's root path."""
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    # Older Starlette versions strip the root path from the path themselves
+    if root_path and path.startswith(root_path + "/"):
+        return path[len(root_path) :]
+    return path
+
+
+class _TaskDispatchRoute(BaseRoute):
+    """
+    Route serving many task routes through one hash table lookup.
+
+    Starlette tries the routes of an application in order, so with one route
+    per task endpoint every request pays a regex match per task before it
+    reaches a later route. The task routes have static paths, so this route
+    finds the one matching a request by its path instead, in constant time.
+    """
+
+    def __init__(self, routes: list[BaseRoute]) -> None:
+        self.routes = routes
+        self._by_path: dict[str, BaseRoute] = {
+            getattr(route, "path", ""): route for route in routes
+        }
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+        route = self._by_path.get(_route_path(scope))
+        if route is None:
+            return Match.NONE, {}
+        return route.matches(scope)
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> Any:
+        for route in self.routes:
+            try:
+                return route.url_path_for(name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self._by_path[_route_path(scope)].handle(scope, receive, send)
+
+
+# Size of the chunks raw results are streamed in
+_RAW_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_raw_result(body: bytes, compress: bool) -> Iterator[bytes]:
+    """Yield a raw result in chunks, gzip-compressed if ``compress`` is set."""
+    view = memoryview(body)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for start in range(0, len(view), _RAW_CHUNK_SIZE):
+        chunk = view[start : start + _RAW_CHUNK_SIZE]
+        if not compress:
+            yield bytes(chunk)
+        elif data := compressor.compress(chunk):
+            yield data
+    if compress:
+        yield compressor.flush()
+
+
+async def _iter_ndjson_lines(
+    request: Request, max_line_size: int
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Yield ``(line_number, line)`` for each non-blank line of the request body.
+
+    Lines longer than ``max_line_size`` bytes are dropped as they arrive
+    instead of being buffered, and yielded as ``None``.
+    """
+    buffer = bytearray()
+    line_number = 0
+    oversized = False
+    async for chunk in request.stream():
+        # Only the new bytes can hold a newline, the pending ones have none
+        search = len(buffer)
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", search)) != -1:
+            line_number += 1
+            if oversized or end - start > max_line_size:
+                yield line_number, None
+            elif line := bytes(buffer[start:end]).strip():
+                yield line_number, line
+            oversized = False
+            start = search = end + 1
+        del buffer[:start]
+        if len(buffer) > max_line_size:
+            oversized = True
+            buffer.clear()
+    if oversized:
+        yield line_number + 1, None
+    elif line := bytes(buffer).strip():
+        yield line_number + 1, line
+
+
+# Validates the body of lazily dispatched batch requests
+_BATCH_BODY: TypeAdapter[list[dict[str, Any]]] = TypeAdapter(list[dict[str, Any]])
+
+
+def _body_errors(exc: ValidationError) -> list[dict[str, Any]]:
+    """Return validation errors located in the request body, as FastAPI does."""
+    return [
+        {**error, "loc": ("body", *error["loc"])}
+        for error in exc.errors(include_url=False)
+    ]
+
+
+async def _json_body(request: Request) -> Any:
+    """
+    Parse a JSON request body.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON.
+    """
+    try:
+        return await request.json()
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", exc.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": exc.msg},
+                }
+            ]
+        )
+
+
+def _ndjson_line(data: dict[str, Any]) -> bytes:
+    """Encode a dict as one NDJSON line."""
+    return json.dumps(data, default=str).encode() + b"\n"
+
+
 class TaskResponse(BaseModel):
     """Response model for task submission."""
 
@@ -240,6 +603,25 @@ class TaskResponse(BaseModel):
     status: str = Field(default="PENDING", description="Initial task status")
 
 
+class BatchItemResult(BaseModel):
+    """Outcome of a single item in a batch submission."""
+
+    index: int = Field(description="Position of the item in the request body")
+    task_id: str | None = Field(default=None, description="ID of the submitted task")
+    status: str = Field(description="PENDING if submitted, ERROR otherwise")
+    error: str | list[dict[str, Any]] | None = Field(
+        default=None, description="Validation errors or publish failure message"
+    )
+
+
+class BatchTaskResponse(BaseModel):
+    """Response model for batch task submission."""
+
+    submitted: int = Field(description="Number of tasks published")
+    failed: int = Field(description="Number of items that were rejected or failed")
+    items: list[BatchItemResult]
+
+
 class TaskStatusResponse(BaseModel):
     """Response model for task status."""
 
@@ -251,6 +633,87 @@ class TaskStatusResponse(BaseModel):
     info: dict[str, Any] | None = None
 
 
+def _status_from_meta(task_id: str, meta: TaskMeta) -> TaskStatusResponse:
+    """Build a status response from an already fetched task meta."""
+    task_result = meta.get("result")
+
+    # Build info dict with additional metadata
+    info: dict[str, Any] = {}
+    if task_result:
+        if isinstance(task_result, dict):
+            info = task_result
+        elif isinstance(task_result, Exception):
+            info = {"error": str(task_result)}
+
+    # Exceptions are reported through info, they cannot be serialized as results
+    ready = meta_is_ready(meta) and not isinstance(task_result, Exception)
+
+    return TaskStatusResponse(
+        task_id=task_id,
+        state=meta["status"],
+        result=task_result if ready else None,
+        traceback=meta.get("traceback"),
+        date_done=meta_date_done(meta),
+        info=info if info else None,
+    )
+
+
+# Suffix marking the ETag of a gzip-compressed raw result
+_GZIP_ETAG_SUFFIX = '-gzip"'
+
+
+def _etag(*parts: Any) -> str:
+    """Return a strong entity tag for a representation derived from ``parts``."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _status_etag(statuses: Iterable[TaskStatusResponse]) -> str:
+    """
+    Return the entity tag of one or more task statuses.
+
+    A finished task is identified by its state and ``date_done``, which never
+    change afterwards. The progress ``info`` of a running task can change
+    without a state change, so it is part of the tag until the task is done.
+    """
+    parts: list[tuple[Any, ...]] = []
+    for status in statuses:
+        if status.state in states.READY_STATES:
+            parts.append((status.task_id, status.state, status.date_done))
+        else:
+            parts.append((status.task_id, status.state, status.date_done, status.info))
+    return _etag(*parts)
+
+
+def _validator_headers(response: Response) -> dict[str, str]:
+    """Return the ``ETag`` and ``Cache-Control`` headers set on a response."""
+    return {
+        name: value
+        for name, value in response.headers.items()
+        if name in ("etag", "cache-control")
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the ``If-None-Match`` header of a request matches an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison; gzip variants share validity
+    return any(
+        tag.strip().removeprefix("W/").replace(_GZIP_ETAG_SUFFIX, '"') == etag
+        for tag in header.split(",")
+    )
+
+
+class TaskStatusQuery(BaseModel):
+    """Payload for looking up the status of many tasks."""
+
+    task_ids: list[str] = Field(description="IDs of the tasks to look up")
+
+
 class TaskListResponse(BaseModel):
     """Response model for listing all tasks."""
 
@@ -258,6 +721,9 @@ class TaskListResponse(BaseModel):
     scheduled: dict[str, list[dict[str, Any]]]
     reserved: dict[str, list[dict[str, Any]]]
     revoked: dict[str, list[str]]
+    snapshot_age: float | None = Field(
+        default=None, description="Age in seconds of the cluster snapshot served"
+    )
 
 
 class TaskRevokePayload(BaseModel):
@@ -303,6 +769,28 @@ class CeleryFastAPIBridge:
         prefix: str = "",
         include_status_endpoints: bool = True,
         task_filter: Callable[[str], bool] | None = None,
+        publisher: TaskPublisher | str = "thread",
+        include_batch_endpoints: bool = True,
+        max_batch_size: int = 1000,
+        stream_batch_size: int = 100,
+        max_line_size: int = 1024 * 1024,
+        result_fetcher: ResultFetcher | None = None,
+        cluster_inspector: ClusterInspector | None = None,
+        event_monitor: ClusterEventMonitor | None = None,
+        task_watcher: TaskWatcher | None = None,
+        lazy_task_routes: bool = False,
+        dispatch_task_routes: bool = False,
+        schema_cache: SchemaCache | str | None = None,
+        producer_pool: ProducerPool | None = None,
+        idempotency_store: IdempotencyStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        queue_depth_guard: QueueDepthGuard | None = None,
+        metrics: BridgeMetrics | None = None,
+        tracer: BridgeTracer | None = None,
+        terminal_cache_control: str | None = "max-age=3600, immutable",
+        raw_result_min_size: int | None = None,
+        compress_raw_results: bool = True,
+        fast_responses: bool = False,
     ) -> None:
         """
         Initialize the Celery FastAPI Bridge.
@@ -315,13 +803,139 @@ class CeleryFastAPIBridge:
             include_status_endpoints: Whether to include task status and listing endpoints.
             task_filter: Optional callable to filter which tasks to expose.
                         Takes task name, returns True to include, False to exclude.
+            publisher: Task submission engine. Either a TaskPublisher instance or
+                      the name of a built-in engine: "thread" (default) publishes
+                      on a bounded thread pool so the event loop never blocks on
+                      the broker; "inline" calls send_task on the event loop;
+                      "batch" coalesces concurrent submissions into batches.
+            include_batch_endpoints: Whether to add ``/batch`` and ``/stream``
+                                    endpoints per task, plus ``/trigger/batch`` and
+                                    ``/trigger/stream``, for bulk submission.
+            max_batch_size: Maximum number of items accepted by batch endpoints
+                           and bulk status lookups.
+            stream_batch_size: Number of NDJSON lines published together by the
+                              streaming ingestion endpoints.
+            max_line_size: Maximum size in bytes of one NDJSON line. Longer
+                          lines are rejected with an error item without being
+                          buffered.
+            result_fetcher: Optional ResultFetcher used for non-blocking result
+                           backend reads. A default one is created if omitted.
+            cluster_inspector: Optional ClusterInspector serving /tasks, /workers
+                              and /queues from a periodically refreshed snapshot.
+                              A default one is created if omitted.
+            event_monitor: Optional ClusterEventMonitor. When set, /tasks, the
+                          worker liveness in /workers and the status of queued
+                          tasks are answered from the live event model.
+            task_watcher: Optional TaskWatcher multiplexing the SSE and WebSocket
+                         progress streams over one backend polling loop.
+                         A default one is created if omitted.
+            lazy_task_routes: Serve all task endpoints from one catch-all route
+                             that builds the payload model of a task on its
+                             first request, instead of one route per task
+                             built at startup. Startup time then no longer
+                             depends on the number of tasks, but the per-task
+                             payload schemas are not in the OpenAPI document.
+            dispatch_task_routes: Build one route per task at startup as usual,
+                                 but serve them from a single route that looks
+                                 the task up from the path in a dict, so
+                                 matching a request no longer tries every task
+                                 route in turn. The per-task payload schemas
+                                 stay in the OpenAPI document. Ignored with
+                                 ``lazy_task_routes``.
+            schema_cache: Optional SchemaCache, or a directory for one, persisting
+                         the generated OpenAPI document across restarts and
+                         worker processes. It is regenerated only when the
+                         fingerprint of the routes and tasks changes.
+            producer_pool: Optional ProducerPool the publisher checks broker
+                          producers out of. Its connections are opened on
+                          application startup. A default one, sized to the
+                          publisher's threads, is created if omitted and the
+                          publisher has none.
+            idempotency_store: Optional IdempotencyStore deduplicating
+                              submissions that carry an ``Idempotency-Key``
+                              header. An in-process LRU store is created if
+                              omitted.
+            rate_limiter: Optional RateLimiter applying token-bucket limits per
+                         task, queue and client. Submissions over a limit are
+                         rejected with 429.
+            queue_depth_guard: Optional QueueDepthGuard rejecting submissions
+                              with 503 while the target queue's cached broker
+                              backlog is at its limit.
+            metrics: Optional BridgeMetrics recording validation, publish,
+                    result backend and inspect latencies and submission
+                    outcomes, served at ``/metrics``.
+            tracer: Optional BridgeTracer opening OpenTelemetry spans around
+                   body parsing, validation, publishing and result backend
+                   reads, and propagating the trace context to workers
+                   through the task headers.
+            terminal_cache_control: ``Cache-Control`` of status and result
+                                   responses for tasks in a terminal state,
+                                   whose representation never changes. Other
+                                   responses carrying an ETag are sent with
+                                   ``no-cache`` so clients revalidate them.
+            raw_result_min_size: Stream successful results whose stored meta
+                                is at least this many bytes from the JSON
+                                stored in the result backend, instead of
+                                decoding and re-encoding them. Only applies
+                                to key-value backends using the JSON
+                                serializer; results holding values kombu
+                                encodes as typed objects (datetimes, UUIDs,
+                                ...) are still decoded. Disabled if None.
+            compress_raw_results: Whether raw results are gzip-compressed for
+                                 clients accepting it.
+            fast_responses: Encode status, result, listing and worker responses
+                           with orjson and skip FastAPI's response model
+                           validation, which only re-checks data the bridge
+                           built itself. Requires orjson.
+
+        Raises:
+            ImportError: If ``fast_responses`` is set and orjson is missing.
         """
         self.celery_app = celery_app
         self.fastapi_app = fastapi_app or FastAPI()
         self.prefix = prefix.rstrip("/")
         self.include_status_endpoints = include_status_endpoints
         self.task_filter = task_filter or (lambda name: not name.startswith("celery."))
+        self.publisher = create_publisher(celery_app, publisher)
+        if self.publisher.producer_pool is None:
+            self.publisher.producer_pool = producer_pool or ProducerPool(
+                celery_app, size=getattr(self.publisher, "max_workers", 8)
+            )
+        self.producer_pool = self.publisher.producer_pool
+        self.idempotency_store = idempotency_store or MemoryIdempotencyStore()
+        self.rate_limiter = rate_limiter
+        self.queue_depth_guard = queue_depth_guard
+        self.metrics = metrics
+        self.tracer = tracer
+        self.terminal_cache_control = terminal_cache_control
+        self.raw_result_min_size = raw_result_min_size
+        self.compress_raw_results = compress_raw_results
+        if fast_responses:
+            require_orjson()
+        self.fast_responses = fast_responses
+        self.include_batch_endpoints = include_batch_endpoints
+        self.max_batch_size = max_batch_size
+        self.stream_batch_size = stream_batch_size
+        self.max_line_size = max_line_size
+        self.results = result_fetcher or ResultFetcher(celery_app)
+        self.inspector = cluster_inspector or ClusterInspector(celery_app)
+        self.event_monitor = event_monitor
+        self.watcher = task_watcher or TaskWatcher(self.results)
+        if metrics is not None:
+            self.results.metrics = metrics
+            self.inspector.metrics = metrics
+            if self.producer_pool is not None:
+                self.producer_pool.metrics = metrics
+        if tracer is not None:
+            self.results.tracer = tracer
+        self.lazy_task_routes = lazy_task_routes
+        self.dispatch_task_routes = dispatch_task_routes
+        if isinstance(schema_cache, str):
+            schema_cache = SchemaCache(schema_cache)
+        self.schema_cache = schema_cache
         self._registered = False
+        self._task_specs: dict[str, _TaskSpec] = {}
+        self._registry_etag: str | None = None
 
         # Store the registered task names from THIS app only
         self._app_task_names: set[str] = set()
@@ -344,13 +958,435 @@ class CeleryFastAPIBridge:
         if self.include_status_endpoints:
             self._register_status_endpoints()
 
+        if self.metrics is not None:
+            self._register_metrics_endpoint()
+
+        self._install_lifespan()
+        if self.schema_cache is not None:
+            self.schema_cache.install(self.fastapi_app, self.schema_fingerprint)
         self._registered = True
         return self.fastapi_app
 
+    def schema_fingerprint(self) -> str:
+        """Return the fingerprint keying the cached OpenAPI document."""
+        return registry_fingerprint(
+            self.fastapi_app, self.celery_app, self._app_task_names
+        )
+
+    def _install_lifespan(self) -> None:
+        """Wrap the FastAPI lifespan to start and stop bridge resources."""
+        original_lifespan = self.fastapi_app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app: Any) -> AsyncIterator[Any]:
+            await self.startup()
+            try:
+                async with original_lifespan(app) as state:
+                    yield state
+            finally:
+                await self.shutdown()
+
+        self.fastapi_app.router.lifespan_context = lifespan
+
+    async def startup(self) -> None:
+        """Start bridge resources. Called automatically on application startup."""
+        await self.publisher.start()
+        await self._warm_producers()
+        await self.results.start()
+        if self.queue_depth_guard is not None:
+            await self.queue_depth_guard.start()
+        if self.include_status_endpoints:
+            await self.inspector.start()
+            if self.event_monitor is not None:
+                await self.event_monitor.start()
+
+    async def shutdown(self) -> None:
+        """Release bridge resources. Called automatically on application shutdown."""
+        await self.publisher.close()
+        if self.producer_pool is not None:
+            self.producer_pool.close()
+        await self.idempotency_store.close()
+        if self.queue_depth_guard is not None:
+            await self.queue_depth_guard.close()
+        await self.watcher.close()
+        await self.results.close()
+        await self.inspector.close()
+        if self.event_monitor is not None:
+            await self.event_monitor.close()
+
+    async def _warm_producers(self) -> None:
+        """Open the broker connections of the producer pool off the event loop."""
+        pool = self.producer_pool
+        if pool is None:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, pool.warm)
+        except Exception:  # noqa: BLE001
+            # Connections are opened on demand once the broker is reachable
+            logger.warning("Could not connect to the broker on startup", exc_info=True)
+
+    async def _send_task(
+        self,
+        task_name: str,
+        send_options: dict[str, Any],
+        idempotency_key: str | None = None,
+        response: Response | None = None,
+        request: Request | None = None,
+    ) -> str:
+        """
+        Publish a task through the configured publisher.
+
+        With an idempotency key, the task ID is derived from the key (unless
+        the payload sets one) and claimed in the idempotency store first; a
+        key that was already claimed returns the recorded task ID without
+        publishing, flagged with an ``Idempotent-Replayed`` response header.
+
+        Raises:
+            HTTPException: 429 or 503 if the submission is rejected by the
+                          rate limiter or queue depth guard, 503 if the
+                          publisher is saturated.
+        """
+        if idempotency_key is None:
+            return await self._publish(task_name, send_options, request)
+
+        key = f"{task_name}:{idempotency_key}"
+        task_id = send_options.get("task_id") or idempotent_task_id(
+            task_name, idempotency_key
+        )
+        existing = await self.idempotency_store.claim(key, task_id)
+        if existing is not None:
+            if response is not None:
+                response.headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+            self._count(task_name, send_options, "replayed")
+            return existing
+        try:
+            return await self._publish(
+                task_name, {**send_options, "task_id": task_id}, request
+            )
+        except BaseException:
+            # Let the client retry a submission that never reached the broker
+            await self.idempotency_store.release(key, task_id)
+            raise
+
+    async def _admit(self, message: TaskMessage, request: Request | None) -> None:
+        """
+        Apply the queue depth guard and rate limits to a task message.
+
+        Raises:
+            SubmissionRejected: If the message must not be published now.
+        """
+        task_name, send_options = message
+        queue = send_options.get("queue")
+        try:
+            if self.queue_depth_guard is not None:
+                await self.queue_depth_guard.check(queue)
+            if self.rate_limiter is not None:
+                client = self.rate_limiter.client_key(request) if request else None
+                self.rate_limiter.check(task_name, queue, client)
+        except SubmissionRejected:
+            self._count(task_name, send_options, "rejected")
+            raise
+
+    def _count(
+        self, task_name: str, send_options: dict[str, Any], outcome: str
+    ) -> None:
+        """Count a submission outcome if metrics are enabled."""
+        if self.metrics is not None:
+            self.metrics.count_submission(task_name, send_options.get("queue"), outcome)
+
+    def _count_invalid(
+        self, raw: Any, task_name: str | None, queue: str | None
+    ) -> None:
+        """Count a batch or stream item that failed validation."""
+        if self.metrics is None:
+            return
+        if task_name is None and isinstance(raw, dict):
+            # Generic submissions name their task and queue in the payload
+            task_name, queue = raw.get("task_name"), raw.get("queue")
+        self.metrics.count_submission(
+            task_name if isinstance(task_name, str) else "",
+            queue if isinstance(queue, str) else None,
+            "invalid",
+        )
+
+    def _span(self, name: str) -> AbstractContextManager[Any]:
+        """Open a tracing span if tracing is enabled."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name)
+
+    def _instrumented(
+        self, prepare: Callable[[Any], TaskMessage]
+    ) -> Callable[[Any], TaskMessage]:
+        """Wrap a payload preparation function to record and trace validation."""
+        metrics = self.metrics
+        if metrics is None and self.tracer is None:
+            return prepare
+
+        def instrumented(raw: Any) -> TaskMessage:
+            started = time.perf_counter()
+            with self._span("celery_fastapi.validate"):
+                try:
+                    return prepare(raw)
+                finally:
+                    if metrics is not None:
+                        metrics.observe_validation(started)
+
+        return instrumented
+
+    async def _publish(
+        self,
+        task_name: str,
+        send_options: dict[str, Any],
+        request: Request | None = None,
+    ) -> str:
+        """Admit and publish a task, mapping rejections to 429/503."""
+        try:
+            await self._admit((task_name, send_options), request)
+        except SubmissionRejected as exc:
+            raise HTTPException(
+                status_code=exc.status_code,
+                detail=str(exc),
+                headers={"Retry-After": exc.retry_after_header},
+            )
+        tracer = self.tracer
+        publish_span = (
+            tracer.publish_span(task_name, send_options.get("queue"))
+            if tracer is not None
+            else nullcontext()
+        )
+        started = time.perf_counter()
+        try:
+            with publish_span as span:
+                if tracer is not None:
+                    send_options = tracer.inject(send_options)
+                task_id = await self.publisher.send(task_name, **send_options)
+                if span is not None and span.is_recording():
+                    span.set_attribute("messaging.message.id", task_id)
+        except PublisherBusyError as exc:
+            self._count(task_name, send_options, "busy")
+            raise HTTPException(
+                status_code=503, detail=str(exc), headers={"Retry-After": "1"}
+            )
+        except Exception:
+            self._count(task_name, send_options, "error")
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_publish("single", started)
+            self._count(task_name, send_options, "published")
+        return task_id
+
+    async def _publish_many(self, messages: list[TaskMessage]) -> list[str | Exception]:
+        """
+        Publish several task messages over a single producer.
+
+        Raises:
+            PublisherBusyError: If the publisher is saturated.
+        """
+        tracer = self.tracer
+        publish_span = (
+            tracer.publish_span("batch", None, batch_size=len(messages))
+            if tracer is not None
+            else nullcontext()
+        )
+        started = time.perf_counter()
+        try:
+            with publish_span:
+                if tracer is not None:
+                    messages = [
+                        (task_name, tracer.inject(send_options))
+                        for task_name, send_options in messages
+                    ]
+                outcomes = await self.publisher.send_many(messages)
+        except PublisherBusyError:
+            for task_name, send_options in messages:
+                self._count(task_name, send_options, "busy")
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_publish("batch", started)
+            for (task_name, send_options), outcome in zip(
+                messages, outcomes, strict=True
+            ):
+                outcome_name = (
+                    "error" if isinstance(outcome, Exception) else "published"
+                )
+                self._count(task_name, send_options, outcome_name)
+        return outcomes
+
+    async def _submit_batch(
+        self,
+        raw_items: list[Any],
+        prepare: Callable[[Any], TaskMessage],
+        request: Request | None = None,
+        *,
+        task_name: str | None = None,
+        queue: str | None = None,
+    ) -> BatchTaskResponse:
+        """
+        Validate and publish a batch of payloads over a single producer.
+
+        Items that fail validation, are rejected by the rate limiter or queue
+        depth guard, or fail publishing are reported individually; the
+        remaining items are still submitted.
+
+        Args:
+            raw_items: Unvalidated payloads from the request body.
+            prepare: Validates one payload and returns its task message.
+            request: The incoming request, identifying the client.
+            task_name: Task the items are submitted to, labelling invalid
+                      items in the metrics. Generic items name their own.
+            queue: Default queue of the task, labelling invalid items.
+
+        Raises:
+            HTTPException: 413 if the batch is too large, 503 if the publisher
+                          is saturated.
+        """
+        if len(raw_items) > self.max_batch_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch of {len(raw_items)} items exceeds the limit of "
+                f"{self.max_batch_size}",
+            )
+
+        prepare = self._instrumented(prepare)
+        items: list[BatchItemResult | None] = [None] * len(raw_items)
+        messages: list[TaskMessage] = []
+        positions: list[int] = []
+        for index, raw in enumerate(raw_items):
+            try:
+                message = prepare(raw)
+                await self._admit(message, request)
+            except ValidationError as exc:
+                self._count_invalid(raw, task_name, queue)
+                items[index] = BatchItemResult(
+                    index=index,
+                    status="ERROR",
+                    error=jsonable_encoder(exc.errors(include_url=False)),
+                )
+            except SubmissionRejected as exc:
+                items[index] = BatchItemResult(
+                    index=index, status="ERROR", error=str(exc)
+                )
+            else:
+                messages.append(message)
+                positions.append(index)
+
+        if messages:
+            try:
+                outcomes = await self._publish_many(messages)
+            except PublisherBusyError as exc:
+                raise HTTPException(
+                    status_code=503, detail=str(exc), headers={"Retry-After": "1"}
+                )
+            for index, outcome in zip(positions, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    items[index] = BatchItemResult(
+                        index=index, status="ERROR", error=str(outcome)
+                    )
+                else:
+                    items[index] = BatchItemResult(
+                        index=index, task_id=outcome, status="PENDING"
+                    )
+
+        results = [item for item in items if item is not None]
+        submitted = sum(1 for item in results if item.task_id is not None)
+        return BatchTaskResponse(
+            submitted=submitted, failed=len(results) - submitted, items=results
+        )
+
+    async def _publish_stream_batch(
+        self, pending: list[tuple[int, TaskMessage]]
+    ) -> list[bytes]:
+        """Publish one micro-batch of an NDJSON stream and encode the outcomes."""
+        try:
+            outcomes: list[str | Exception] = await self._publish_many(
+                [message for _, message in pending]
+            )
+        except PublisherBusyError as exc:
+            outcomes = [exc] * len(pending)
+
+        lines: list[bytes] = []
+        for (line_number, _), outcome in zip(pending, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                lines.append(_ndjson_line({"line": line_number, "error": str(outcome)}))
+            else:
+                lines.append(_ndjson_line({"line": line_number, "task_id": outcome}))
+        return lines
+
+    async def _stream_ingest(
+        self,
+        request: Request,
+        prepare: Callable[[Any], TaskMessage],
+        *,
+        task_name: str | None = None,
+        queue: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Validate and publish an NDJSON request body in micro-batches.
+
+        Lines are read incrementally and results are streamed back as soon as
+        each micro-batch is published, so memory use does not depend on the
+        size of the upload.
+
+        Args:
+            request: The incoming request with an NDJSON body.
+            prepare: Validates one payload and returns its task message.
+            task_name: Task the lines are submitted to, labelling invalid
+                      lines in the metrics. Generic lines name their own.
+            queue: Default queue of the task, labelling invalid lines.
+
+        Yields:
+            NDJSON-encoded ``{"line": n, "task_id": ...}`` or
+            ``{"line": n, "error": ...}`` results.
+        """
+        prepare = self._instrumented(prepare)
+        pending: list[tuple[int, TaskMessage]] = []
+        output: list[bytes] = []
+        async for line_number, line in _iter_ndjson_lines(request, self.max_line_size):
+            raw = None
+            try:
+                if line is None:
+                    raise ValueError(
+                        f"Line exceeds the maximum size of {self.max_line_size} bytes"
+                    )
+                raw = json.loads(line)
+                message = prepare(raw)
+                await self._admit(message, request)
+            except ValidationError as exc:
+                self._count_invalid(raw, task_name, queue)
+                errors = jsonable_encoder(exc.errors(include_url=False))
+                output.append(_ndjson_line({"line": line_number, "error": errors}))
+            except SubmissionRejected as exc:
+                output.append(_ndjson_line({"line": line_number, "error": str(exc)}))
+            except ValueError as exc:
+                # Not JSON, or a line over max_line_size
+                self._count_invalid(raw, task_name, queue)
+                output.append(_ndjson_line({"line": line_number, "error": str(exc)}))
+            else:
+                pending.append((line_number, message))
+
+            if len(pending) + len(output) >= self.stream_batch_size:
+                if pending:
+                    output.extend(await self._publish_stream_batch(pending))
+                    pending = []
+                yield b"".join(output)
+                output = []
+
+        if pending:
+            output.extend(await self._publish_stream_batch(pending))
+        if output:
+            yield b"".join(output)
+
     def _register_task_endpoints(self) -> None:
         """Register POST endpoints for each Celery task."""
+        if self.lazy_task_routes:
+            self._register_lazy_task_endpoint()
+            return
+
         # Get the default queue name from Celery config (defaults to 'celery')
         default_queue = self.celery_app.conf.task_default_queue or "celery"
+        first_route = len(self.fastapi_app.router.routes)
 
         for name, task in self.celery_app.tasks.items():
             if not self.task_filter(name):
@@ -363,24 +1399,176 @@ class CeleryFastAPIBridge:
             # Create endpoint handler with proper closure
             self._create_task_endpoint(name, queue_name, route_path)
 
-    def _create_task_endpoint(
-        self, task_name: str, queue_name: str, route_path: str
-    ) -> None:
-        """Create a POST endpoint for a specific task with custom payload model."""
+        if self.dispatch_task_routes:
+            self._install_task_dispatch(first_route)
+
+    def _install_task_dispatch(self, first_route: int) -> None:
+        """
+        Move the task routes registered from ``first_route`` on behind one route.
+
+        The OpenAPI document is generated with the task routes back in place
+        of the dispatch route, so it still lists every task endpoint.
+        """
+        routes = self.fastapi_app.router.routes
+        dispatcher = _TaskDispatchRoute(routes[first_route:])
+        routes[first_route:] = [dispatcher]
+
+        fastapi_app = self.fastapi_app
+        generate = fastapi_app.openapi
+
+        def openapi() -> dict[str, Any]:
+            if fastapi_app.openapi_schema is not None:
+                return fastapi_app.openapi_schema
+            routes = fastapi_app.router.routes
+            expanded: list[BaseRoute] = []
+            for route in routes:
+                if route is dispatcher:
+                    expanded.extend(dispatcher.routes)
+                else:
+                    expanded.append(route)
+            fastapi_app.router.routes = expanded
+            try:
+                return generate()
+            finally:
+                fastapi_app.router.routes = routes
+
+        fastapi_app.openapi = openapi  # type: ignore[method-assign]
+
+    def _resolve_task_path(self, task_path: str) -> tuple[str, str] | None:
+        """
+        Map a task endpoint path to its task name and endpoint kind.
+
+        Returns:
+            ``(task_name, kind)`` where kind is ``""``, ``"batch"`` or
+            ``"stream"``, or None if the path is not a task endpoint.
+        """
+        task_name = task_path.replace("/", ".")
+        if task_name in self._app_task_names:
+            return task_name, ""
+        if self.include_batch_endpoints:
+            head, _, kind = task_path.rpartition("/")
+            task_name = head.replace("/", ".")
+            if kind in ("batch", "stream") and task_name in self._app_task_names:
+                return task_name, kind
+        return None
+
+    def _lazy_task_spec(self, task_name: str) -> _TaskSpec:
+        """Return the cached spec of a task, building it on first use."""
+        spec = self._task_specs.get(task_name)
+        if spec is None:
+            task = self.celery_app.tasks.get(task_name)
+            default_queue = self.celery_app.conf.task_default_queue or "celery"
+            queue_name = getattr(task, "queue", None) or default_queue
+            spec = self._task_spec(task_name, queue_name)
+            self._task_specs[task_name] = spec
+        return spec
+
+    def _register_lazy_task_endpoint(self) -> None:
+        """Register one POST route dispatching to every task by path."""
+        bridge = self
+
+        class LazyTaskRoute(APIRoute):
+            """Catch-all route matching only the paths of known tasks."""
+
+            def matches(self, scope: Scope) -> tuple[Match, Scope]:
+                match, child_scope = super().matches(scope)
+                if match is not Match.NONE:
+                    task_path = child_scope["path_params"]["task_path"]
+                    if bridge._resolve_task_path(task_path) is None:
+                        return Match.NONE, {}
+                return match, child_scope
+
+        async def run_task_lazy(
+            request: Request,
+            response: Response,
+            task_path: str,
+            task_name_override: str | None = Query(
+                default=None, alias="_task_name", description="Override task name"
+            ),
+            queue_override: str | None = Query(
+                default=None, alias="_queue", description="Override queue"
+            ),
+            idempotency_key: str | None = _idempotency_key_header(),
+        ) -> Any:
+            """Execute the task, batch or stream named by the path."""
+            resolved = self._resolve_task_path(task_path)
+            if resolved is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            task_name, kind = resolved
+            spec = self._lazy_task_spec(task_name)
+            prepare = self._instrumented(
+                spec.prepare(task_name_override, queue_override)
+            )
+            labels = {
+                "task_name": task_name_override or task_name,
+                "queue": queue_override or spec.queue_name,
+            }
+
+            if kind == "stream":
+                return _NDJSONStreamingResponse(
+                    self._stream_ingest(request, prepare, **labels)
+                )
+
+            with self._span("celery_fastapi.parse"):
+                body = await _json_body(request)
+            try:
+                if kind == "batch":
+                    return await self._submit_batch(
+                        _BATCH_BODY.validate_python(body), prepare, request, **labels
+                    )
+                actual_task_name, send_options = prepare(body)
+            except ValidationError as exc:
+                raise RequestValidationError(_body_errors(exc))
+            task_id = await self._send_task(
+                actual_task_name, send_options, idempotency_key, response, request
+            )
+            return TaskResponse(task_id=task_id, status="PENDING")
+
+        self.fastapi_app.router.add_api_route(
+            f"{self.prefix}/{{task_path:path}}",
+            run_task_lazy,
+            methods=["POST"],
+            tags=["tasks"],
+            summary="Run a task",
+            description="Submit the task whose name is the path, with dots as slashes "
+            "(e.g. `myapp/tasks/add` for `myapp.tasks.add`). Append `/batch` or "
+            "`/stream` for bulk submission.\n\nThe payload is validated against the "
+            "task signature; the model is built on the first request for the task.",
+            route_class_override=LazyTaskRoute,
+            openapi_extra={
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": {"type": "object"}}},
+                }
+            },
+        )
+
+    def _task_spec(self, task_name: str, queue_name: str) -> _TaskSpec:
+        """Build the payload model and plan of a task from its signature."""
         # Get the task function to inspect its signature
         task = self.celery_app.tasks.get(task_name)
         task_func = getattr(task, "run", None) if task else None
 
         # Create a custom payload model for this task
         if task_func:
-            PayloadModel = _create_task_payload_model(task_name, task_func, queue_name)
+            model = _create_task_payload_model(task_name, task_func, queue_name)
         else:
             # Fallback to generic model if we can't inspect the task
-            PayloadModel = GenericTaskPayload
+            model = GenericTaskPayload
+        return _TaskSpec(task_name, queue_name, model)
+
+    def _create_task_endpoint(
+        self, task_name: str, queue_name: str, route_path: str
+    ) -> None:
+        """Create a POST endpoint for a specific task with custom payload model."""
+        spec = self._task_spec(task_name, queue_name)
+        PayloadModel = spec.model
 
         # Create the endpoint handler
         async def run_task(
             payload: PayloadModel,  # type: ignore[valid-type]
+            request: Request,
+            response: Response,
             task_name_override: str | None = Query(
                 default=None,
                 alias="_task_name",
@@ -391,42 +1579,20 @@ class CeleryFastAPIBridge:
                 alias="_queue",
                 description=f"Override queue (default: {queue_name})",
             ),
+            idempotency_key: str | None = _idempotency_key_header(),
         ) -> TaskResponse:
             """Execute a Celery task asynchronously."""
-            # Determine actual task name and queue
-            actual_task_name = task_name_override or task_name
-            actual_queue = (
-                queue_override or getattr(payload, "queue", None) or queue_name
+            started = time.perf_counter()
+            with self._span("celery_fastapi.build_message"):
+                actual_task_name, send_options = spec.message(
+                    payload, task_name_override, queue_override
+                )
+            if self.metrics is not None:
+                self.metrics.observe_message_build(started)
+            task_id = await self._send_task(
+                actual_task_name, send_options, idempotency_key, response, request
             )
-
-            # Extract task arguments from payload
-            # Get all field names that are task parameters (not Celery options)
-            celery_option_names = set(CELERY_OPTIONS_FIELDS.keys())
-            task_kwargs: dict[str, Any] = {}
-
-            # Access model_fields from the class, not the instance (Pydantic V2.11+)
-            payload_fields = type(payload).model_fields  # type: ignore[attr-defined]
-            for field_name in payload_fields:
-                if field_name not in celery_option_names:
-                    value = getattr(payload, field_name, None)
-                    if value is not None:
-                        task_kwargs[field_name] = value
-
-            # Build send_task options
-            send_options: dict[str, Any] = {
-                "args": [],
-                "kwargs": task_kwargs,
-                "queue": actual_queue,
-            }
-
-            # Add Celery options if set
-            for opt_name in celery_option_names:
-                value = getattr(payload, opt_name, None)
-                if value is not None and opt_name != "queue":  # queue handled above
-                    send_options[opt_name] = value
-
-            result = self.celery_app.send_task(actual_task_name, **send_options)
-            return TaskResponse(task_id=result.id, status="PENDING")
+            return TaskResponse(task_id=task_id, status="PENDING")
 
         # Set a descriptive name for the endpoint
         run_task.__name__ = f"run_{task_name.replace('.', '_')}"
@@ -440,48 +1606,370 @@ class CeleryFastAPIBridge:
             description=f"Submit '{task_name}' task for async execution.\n\nDefault queue: `{queue_name}`\n\nUse `_task_name` and `_queue` query params to override.",
         )(run_task)
 
+        if not self.include_batch_endpoints:
+            return
+
+        async def run_task_batch(
+            request: Request,
+            payloads: list[dict[str, Any]] = Body(
+                description=f"Array of {PayloadModel.__name__} objects"
+            ),
+            task_name_override: str | None = Query(
+                default=None,
+                alias="_task_name",
+                description=f"Override task name (default: {task_name})",
+            ),
+            queue_override: str | None = Query(
+                default=None,
+                alias="_queue",
+                description=f"Override queue (default: {queue_name})",
+            ),
+        ) -> BatchTaskResponse:
+            """Execute a batch of Celery tasks asynchronously."""
+            prepare = spec.prepare(task_name_override, queue_override)
+            return await self._submit_batch(
+                payloads,
+                prepare,
+                request,
+                task_name=task_name_override or task_name,
+                queue=queue_override or queue_name,
+            )
+
+        run_task_batch.__name__ = f"run_{task_name.replace('.', '_')}_batch"
+
+        self.fastapi_app.post(
+            f"{route_path}/batch",
+            response_model=BatchTaskResponse,
+            tags=["tasks"],
+            summary=f"Run a batch of {task_name}",
+            description=f"Submit many '{task_name}' tasks in one request, published over a single broker connection.\n\nEach item is validated and reported individually.",
+        )(run_task_batch)
+
+        async def run_task_stream(
+            request: Request,
+            task_name_override: str | None = Query(
+                default=None,
+                alias="_task_name",
+                description=f"Override task name (default: {task_name})",
+            ),
+            queue_override: str | None = Query(
+                default=None,
+                alias="_queue",
+                description=f"Override queue (default: {queue_name})",
+            ),
+        ) -> StreamingResponse:
+            """Execute Celery tasks from a streamed NDJSON body."""
+            prepare = spec.prepare(task_name_override, queue_override)
+            return _NDJSONStreamingResponse(
+                self._stream_ingest(
+                    request,
+                    prepare,
+                    task_name=task_name_override or task_name,
+                    queue=queue_override or queue_name,
+                )
+            )
+
+        run_task_stream.__name__ = f"run_{task_name.replace('.', '_')}_stream"
+
+        self.fastapi_app.post(
+            f"{route_path}/stream",
+            tags=["tasks"],
+            summary=f"Stream {task_name} submissions",
+            description=f"Submit '{task_name}' tasks from an `{NDJSON_MEDIA_TYPE}` body, one {PayloadModel.__name__} per line.\n\nLines are published in micro-batches and results are streamed back as NDJSON `{{line, task_id | error}}` objects.",
+            response_class=_NDJSONStreamingResponse,
+            openapi_extra=_NDJSON_REQUEST_BODY,
+        )(run_task_stream)
+
+    def _subscribe(self, task_id: str) -> Subscription:
+        """
+        Subscribe to the state changes of a task.
+
+        Raises:
+            HTTPException: 503 if the watcher has too many subscriptions.
+        """
+        try:
+            return self.watcher.subscribe(task_id)
+        except OverflowError as exc:
+            raise HTTPException(
+                status_code=503, detail=str(exc), headers={"Retry-After": "5"}
+            )
+
+    async def _wait_for_task(self, task_id: str, timeout: float) -> TaskMeta | None:
+        """
+        Long-poll a task until it is ready or the timeout expires.
+
+        Raises:
+            HTTPException: 503 if the watcher has too many subscriptions.
+        """
+        try:
+            return await self.watcher.wait(task_id, timeout)
+        except OverflowError as exc:
+            raise HTTPException(
+                status_code=503, detail=str(exc), headers={"Retry-After": "5"}
+            )
+
+    async def _watch_task(
+        self,
+        subscription: Subscription,
+        timeout: float,
+        keepalive: float,
+    ) -> AsyncIterator[TaskStatusResponse | None]:
+        """
+        Yield the status of a task each time it changes.
+
+        Ends after a terminal state or once ``timeout`` seconds have passed.
+        Yields None every ``keepalive`` seconds without a change.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            while (remaining := deadline - loop.time()) > 0:
+                meta = await subscription.get(min(keepalive, remaining))
+                if meta is None:
+                    yield None
+                    continue
+                yield _status_from_meta(subscription.task_id, meta)
+                if meta_is_ready(meta):
+                    return
+        finally:
+            subscription.close()
+
+    async def _sse_task_events(
+        self, subscription: Subscription, timeout: float
+    ) -> AsyncIterator[bytes]:
+        """Encode task status changes as Server-Sent Events."""
+        async for status in self._watch_task(subscription, timeout, keepalive=15.0):
+            if status is None:
+                yield b": keepalive\n\n"
+            else:
+                yield f"event: status\ndata: {status.model_dump_json()}\n\n".encode()
+
+    def _conditional(
+        self, request: Request, response: Response, etag: str, ready: bool
+    ) -> Response | None:
+        """
+        Validate a conditional GET against the ETag of the representation.
+
+        Returns:
+            A 304 response if the client's ``If-None-Match`` matches, else
+            None after adding the ``ETag`` and ``Cache-Control`` headers to
+            ``response``.
+        """
+        cache_control = (ready and self.terminal_cache_control) or "no-cache"
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return None
+
+    def _respond(self, content: _T, response: Response | None = None) -> _T | Response:
+        """
+        Return endpoint content, as a FastJSONResponse with ``fast_responses``.
+
+        Headers set on the endpoint's ``response`` are carried over, since
+        FastAPI only applies them to content it serializes itself.
+        """
+        if not self.fast_responses:
+            return content
+        headers = _validator_headers(response) if response is not None else None
+        return FastJSONResponse(content, headers=headers)
+
+    def _raw_result_response(
+        self, body: bytes, request: Request, response: Response
+    ) -> StreamingResponse:
+        """Stream a result from its stored JSON, compressed if accepted."""
+        headers = _validator_headers(response)
+        compress = False
+        if self.compress_raw_results:
+            headers["Vary"] = "Accept-Encoding"
+            compress = "gzip" in request.headers.get("accept-encoding", "")
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+            # A strong ETag must differ between encodings of a representation
+            if "etag" in headers:
+                headers["etag"] = headers["etag"][:-1] + _GZIP_ETAG_SUFFIX
+        else:
+            headers["Content-Length"] = str(len(body))
+        return StreamingResponse(
+            _iter_raw_result(body, compress),
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def _bulk_task_status(self, task_ids: list[str]) -> list[TaskStatusResponse]:
+        """
+        Resolve the status of many tasks with as few backend calls as possible.
+
+        Raises:
+            HTTPException: 413 if more than ``max_batch_size`` IDs are requested.
+        """
+        unique_ids = list(dict.fromkeys(task_ids))
+        if len(unique_ids) > self.max_batch_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Lookup of {len(unique_ids)} tasks exceeds the limit of "
+                f"{self.max_batch_size}",
+            )
+        metas = await self.results.get_many_meta(unique_ids)
+        return [_status_from_meta(task_id, metas[task_id]) for task_id in unique_ids]
+
     def _register_status_endpoints(self) -> None:
         """Register task status, listing, and control endpoints."""
 
+        # Registered before /tasks/{task_id} so "status" is not taken as an ID
+        @self.fastapi_app.get(
+            f"{self.prefix}/tasks/status",
+            response_model=list[TaskStatusResponse],
+            tags=["task-status"],
+            summary="Get the status of many tasks",
+        )
+        async def get_many_task_status(
+            request: Request,
+            response: Response,
+            task_ids: list[str] = Query(
+                default_factory=list,
+                alias="task_id",
+                description="Task ID to look up (repeat for several tasks)",
+            ),
+        ) -> list[TaskStatusResponse] | Response:
+            """
+            Get the status of many tasks in one request.
+
+            Unknown tasks are reported with state PENDING instead of 404.
+            Key-value result backends are queried with a single round-trip.
+            """
+            statuses = await self._bulk_task_status(task_ids)
+            ready = all(status.state in states.READY_STATES for status in statuses)
+            not_modified = self._conditional(
+                request, response, _status_etag(statuses), ready
+            )
+            if not_modified is not None:
+                return not_modified
+            return self._respond(statuses, response)
+
+        @self.fastapi_app.post(
+            f"{self.prefix}/tasks/status",
+            response_model=list[TaskStatusResponse],
+            tags=["task-status"],
+            summary="Get the status of many tasks",
+        )
+        async def post_many_task_status(
+            payload: TaskStatusQuery,
+        ) -> list[TaskStatusResponse] | Response:
+            """
+            Get the status of many tasks in one request.
+
+            Same as the GET variant, for ID lists too long for a query string.
+            """
+            return self._respond(await self._bulk_task_status(payload.task_ids))
+
         @self.fastapi_app.get(
             f"{self.prefix}/tasks/{{task_id}}",
             response_model=TaskStatusResponse,
             tags=["task-status"],
             summary="Get task status",
         )
-        async def get_task_status(task_id: str) -> TaskStatusResponse:
+        async def get_task_status(
+            task_id: str, request: Request, response: Response
+        ) -> TaskStatusResponse | Response:
             """
             Get the status of a specific task by its ID.
 
             Returns detailed information including state, result, and traceback.
+            The response carries an ETag; a matching ``If-None-Match`` gets an
+            empty 304 response.
 
             Raises:
                 HTTPException: 404 if the task is not found.
             """
-            result = AsyncResult(task_id, app=self.celery_app)
+            # Queued tasks are unknown to the result backend (it would report
+            # PENDING), so answer them from the event model when available.
+            # Running and finished tasks are read from the backend, which
+            # holds progress meta and the real results.
+            status: TaskStatusResponse | None = None
+            if self.event_monitor is not None:
+                record = self.event_monitor.get_task(task_id)
+                if record is not None and record["state"] in QUEUED_STATES:
+                    status = TaskStatusResponse(task_id=task_id, state=record["state"])
+
+            if status is None:
+                meta = await self.results.get_meta(task_id)
+
+                if meta["status"] == states.PENDING:
+                    raise HTTPException(
+                        status_code=404, detail=f"Task '{task_id}' not found"
+                    )
+                status = _status_from_meta(task_id, meta)
 
-            if result.state == "PENDING":
-                raise HTTPException(
-                    status_code=404, detail=f"Task '{task_id}' not found"
-                )
+            ready = status.state in states.READY_STATES
+            not_modified = self._conditional(
+                request, response, _status_etag([status]), ready
+            )
+            if not_modified is not None:
+                return not_modified
+            return self._respond(status, response)
 
-            # Build info dict with additional metadata
-            info: dict[str, Any] = {}
-            if hasattr(result, "info") and result.info:
-                if isinstance(result.info, dict):
-                    info = result.info
-                elif isinstance(result.info, Exception):
-                    info = {"error": str(result.info)}
-
-            return TaskStatusResponse(
-                task_id=task_id,
-                state=result.state,
-                result=result.result if result.ready() else None,
-                traceback=result.traceback,
-                date_done=result.date_done,
-                info=info if info else None,
+        @self.fastapi_app.get(
+            f"{self.prefix}/tasks/{{task_id}}/events",
+            tags=["task-status"],
+            summary="Stream task progress (SSE)",
+            response_class=StreamingResponse,
+        )
+        async def stream_task_events(
+            task_id: str,
+            timeout: float = Query(
+                default=300.0,
+                gt=0,
+                le=3600,
+                description="Close after this many seconds",
+            ),
+        ) -> StreamingResponse:
+            """
+            Stream the status of a task as Server-Sent Events.
+
+            An ``event: status`` message carrying a TaskStatusResponse is sent
+            for the current state and for every change (state or progress
+            ``info``). The stream ends after a terminal state or the timeout.
+            All subscribers of all tasks share one backend polling loop.
+            """
+            subscription = self._subscribe(task_id)
+            return StreamingResponse(
+                self._sse_task_events(subscription, timeout),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                background=BackgroundTask(subscription.close),
             )
 
+        @self.fastapi_app.websocket(f"{self.prefix}/tasks/{{task_id}}/ws")
+        async def watch_task_ws(
+            websocket: WebSocket,
+            task_id: str,
+            timeout: float = 300.0,
+        ) -> None:
+            """
+            Push the status of a task over a WebSocket.
+
+            Sends a TaskStatusResponse JSON message for the current state and
+            every change, then closes after a terminal state or the timeout.
+            """
+            await websocket.accept()
+            try:
+                subscription = self.watcher.subscribe(task_id)
+            except OverflowError as exc:
+                await websocket.close(code=1013, reason=str(exc))
+                return
+            try:
+                async for status in self._watch_task(
+                    subscription, min(timeout, 3600.0), keepalive=15.0
+                ):
+                    if status is not None:
+                        await websocket.send_text(status.model_dump_json())
+            except WebSocketDisconnect:
+                return
+            finally:
+                subscription.close()
+            await websocket.close()
+
         @self.fastapi_app.delete(
             f"{self.prefix}/tasks/{{task_id}}",
             tags=["task-status"],
@@ -514,10 +2002,20 @@ class CeleryFastAPIBridge:
             tags=["task-status"],
             summary="Get task result",
         )
-        async def get_task_result(task_id: str, timeout: float | None = None) -> Any:
+        async def get_task_result(
+            task_id: str,
+            request: Request,
+            response: Response,
+            timeout: float | None = None,
+        ) -> Any:
             """
             Get the result of a completed task.
 
+            With a timeout this is a long-poll: the request waits on the shared
+            task watcher, so concurrent waiters do not each poll the backend.
+            Results carry an ETag; a matching ``If-None-Match`` gets an empty
+            304 response.
+
             Args:
                 task_id: The task ID.
                 timeout: Optional timeout in seconds to wait for result.
@@ -526,36 +2024,51 @@ class CeleryFastAPIBridge:
                 The task result.
 
             Raises:
-                HTTPException: 404 if not found, 202 if not ready, 500 on failure.
+                HTTPException: 404 if not found, 202 if not ready, 500 on failure,
+                    503 if too many requests are already waiting.
             """
-            result = AsyncResult(task_id, app=self.celery_app)
+            raw: bytes | None = None
+            if self.raw_result_min_size is None:
+                meta = await self.results.get_meta(task_id)
+            else:
+                meta, raw = await self.results.get_raw_result(
+                    task_id, self.raw_result_min_size
+                )
 
-            if result.state == "PENDING":
+            if meta["status"] == states.PENDING:
                 raise HTTPException(
                     status_code=404, detail=f"Task '{task_id}' not found"
                 )
 
-            if not result.ready():
+            if not meta_is_ready(meta):
                 if timeout:
-                    try:
-                        return result.get(timeout=timeout)
-                    except TimeoutError as exc:
+                    meta = await self._wait_for_task(task_id, timeout) or meta
+                    if not meta_is_ready(meta):
                         raise HTTPException(
                             status_code=202,
                             detail=f"Task '{task_id}' not ready within timeout",
-                        ) from exc
-                raise HTTPException(
-                    status_code=202,
-                    detail=f"Task '{task_id}' is still {result.state}",
-                )
+                        )
+                else:
+                    raise HTTPException(
+                        status_code=202,
+                        detail=f"Task '{task_id}' is still {meta['status']}",
+                    )
 
-            if result.failed():
+            if meta["status"] == states.FAILURE:
                 raise HTTPException(
                     status_code=500,
-                    detail=f"Task '{task_id}' failed: {result.traceback}",
+                    detail=f"Task '{task_id}' failed: {meta.get('traceback')}",
                 )
 
-            return result.result
+            # The stored JSON and the re-encoded result differ byte for byte
+            representation = "decoded" if raw is None else "raw"
+            etag = _etag(task_id, meta["status"], meta_date_done(meta), representation)
+            not_modified = self._conditional(request, response, etag, ready=True)
+            if not_modified is not None:
+                return not_modified
+            if raw is not None:
+                return self._raw_result_response(raw, request, response)
+            return self._respond(meta.get("result"), response)
 
         @self.fastapi_app.get(
             f"{self.prefix}/tasks",
@@ -563,14 +2076,13 @@ class CeleryFastAPIBridge:
             tags=["task-status"],
             summary="List all tasks",
         )
-        async def list_all_tasks() -> TaskListResponse:
+        async def list_all_tasks() -> TaskListResponse | Response:
             """
             List active, scheduled, reserved, and revoked tasks for THIS app only.
 
             Only shows tasks that are registered in this Celery application,
             filtering out tasks from other apps in the cluster.
             """
-            inspector = self.celery_app.control.inspect()
 
             # Helper to filter tasks by this app's registered task names
             def filter_tasks(
@@ -587,12 +2099,36 @@ class CeleryFastAPIBridge:
                         filtered[worker] = filtered_list
                 return filtered
 
-            return TaskListResponse(
-                active=filter_tasks(inspector.active()),
-                scheduled=filter_tasks(inspector.scheduled()),
-                reserved=filter_tasks(inspector.reserved()),
-                revoked=inspector.revoked()
-                or {},  # Revoked is just task IDs, can't filter
+            if self.event_monitor is not None:
+                monitor = self.event_monitor
+                queued = monitor.tasks_by_worker(states.RECEIVED, states.RETRY)
+                scheduled = {
+                    worker: [t for t in tasks if t.get("eta")]
+                    for worker, tasks in queued.items()
+                }
+                reserved = {
+                    worker: [t for t in tasks if not t.get("eta")]
+                    for worker, tasks in queued.items()
+                }
+                return self._respond(
+                    TaskListResponse(
+                        active=filter_tasks(monitor.tasks_by_worker(states.STARTED)),
+                        scheduled=filter_tasks(scheduled),
+                        reserved=filter_tasks(reserved),
+                        revoked=monitor.revoked(),
+                    )
+                )
+
+            snapshot = await self.inspector.get_snapshot()
+            # Validated here: fast responses skip the response_model check
+            return self._respond(
+                TaskListResponse(
+                    active=filter_tasks(snapshot.active),
+                    scheduled=filter_tasks(snapshot.scheduled),
+                    reserved=filter_tasks(snapshot.reserved),
+                    revoked=snapshot.revoked,  # Revoked is just task IDs, can't filter
+                    snapshot_age=snapshot.age,
+                )
             )
 
         @self.fastapi_app.get(
@@ -600,41 +2136,68 @@ class CeleryFastAPIBridge:
             tags=["workers"],
             summary="List workers",
         )
-        async def list_workers() -> dict[str, Any]:
+        async def list_workers() -> Any:
             """
             Get information about Celery workers that can execute THIS app's tasks.
 
             Filters registered tasks to only show tasks from this application.
             """
-            inspector = self.celery_app.control.inspect()
+            snapshot = await self.inspector.get_snapshot()
 
             # Filter registered tasks to only show this app's tasks
-            registered = inspector.registered() or {}
+            registered = snapshot.registered
             filtered_registered: dict[str, list[str]] = {}
             for worker, tasks in registered.items():
                 filtered_tasks = [t for t in tasks if t in self._app_task_names]
                 if filtered_tasks:
                     filtered_registered[worker] = filtered_tasks
 
-            return {
-                "ping": inspector.ping() or {},
-                "stats": inspector.stats() or {},
-                "registered": filtered_registered,
-                "active_queues": inspector.active_queues() or {},
-            }
+            if self.event_monitor is not None:
+                # Liveness and load come from heartbeats; registered tasks
+                # and queues are not part of the event stream.
+                live_workers = self.event_monitor.workers()
+                return self._respond(
+                    {
+                        "ping": {worker: {"ok": "pong"} for worker in live_workers},
+                        "stats": live_workers,
+                        "registered": filtered_registered,
+                        "active_queues": snapshot.active_queues,
+                        "snapshot_age": snapshot.age,
+                    }
+                )
+
+            return self._respond(
+                {
+                    "ping": snapshot.ping,
+                    "stats": snapshot.stats,
+                    "registered": filtered_registered,
+                    "active_queues": snapshot.active_queues,
+                    "snapshot_age": snapshot.age,
+                }
+            )
 
         @self.fastapi_app.get(
             f"{self.prefix}/available-tasks",
             tags=["tasks"],
             summary="List available tasks",
         )
-        async def list_available_tasks() -> dict[str, Any]:
+        async def list_available_tasks(request: Request, response: Response) -> Any:
             """
             List all tasks available in THIS Celery application.
 
             Returns the task names and their configuration (queue, etc.)
-            that are registered in this specific app instance.
+            that are registered in this specific app instance. The ETag is
+            the registry fingerprint, so clients revalidating an unchanged
+            registry get an empty 304 response.
             """
+            if self._registry_etag is None:
+                self._registry_etag = f'"{self.schema_fingerprint()}"'
+            not_modified = self._conditional(
+                request, response, self._registry_etag, ready=False
+            )
+            if not_modified is not None:
+                return not_modified
+
             # Get the default queue name from Celery config
             default_queue = self.celery_app.conf.task_default_queue or "celery"
 
@@ -656,21 +2219,26 @@ class CeleryFastAPIBridge:
                         }
                     )
 
-            return {
-                "app_name": self.celery_app.main,
-                "task_count": len(tasks_info),
-                "tasks": tasks_info,
-            }
+            return self._respond(
+                {
+                    "app_name": self.celery_app.main,
+                    "task_count": len(tasks_info),
+                    "tasks": tasks_info,
+                },
+                response,
+            )
 
         @self.fastapi_app.get(
             f"{self.prefix}/queues",
             tags=["workers"],
             summary="List active queues",
         )
-        async def list_queues() -> dict[str, Any]:
+        async def list_queues() -> Any:
             """Get information about active queues."""
-            inspector = self.celery_app.control.inspect()
-            return {"queues": inspector.active_queues() or {}}
+            snapshot = await self.inspector.get_snapshot()
+            return self._respond(
+                {"queues": snapshot.active_queues, "snapshot_age": snapshot.age}
+            )
 
         @self.fastapi_app.post(
             f"{self.prefix}/purge",
@@ -688,7 +2256,12 @@ class CeleryFastAPIBridge:
             tags=["tasks"],
             summary="Trigger any task",
         )
-        async def trigger_generic_task(payload: GenericTaskPayload) -> TaskResponse:
+        async def trigger_generic_task(
+            payload: GenericTaskPayload,
+            request: Request,
+            response: Response,
+            idempotency_key: str | None = _idempotency_key_header(),
+        ) -> TaskResponse:
             """
             Trigger any Celery task by name.
 
@@ -702,47 +2275,81 @@ class CeleryFastAPIBridge:
 
             Note: queue is required - you must specify which queue to send the task to.
             """
-            # Build send_task options - queue is required in GenericTaskPayload
-            send_options: dict[str, Any] = {
-                "args": payload.args,
-                "kwargs": payload.kwargs,
-                "queue": payload.queue,
-            }
+            started = time.perf_counter()
+            with self._span("celery_fastapi.build_message"):
+                send_options = _generic_send_options(payload)
+            if self.metrics is not None:
+                self.metrics.observe_message_build(started)
+            task_id = await self._send_task(
+                payload.task_name, send_options, idempotency_key, response, request
+            )
+            return TaskResponse(task_id=task_id, status="PENDING")
+
+        if self.include_batch_endpoints:
 
-            # Add optional Celery parameters
-            if payload.countdown is not None:
-                send_options["countdown"] = payload.countdown
-            if payload.eta is not None:
-                send_options["eta"] = payload.eta
-            if payload.expires is not None:
-                send_options["expires"] = payload.expires
-            if payload.retry is not None:
-                send_options["retry"] = payload.retry
-            if payload.retry_policy is not None:
-                send_options["retry_policy"] = payload.retry_policy
-            if payload.exchange is not None:
-                send_options["exchange"] = payload.exchange
-            if payload.routing_key is not None:
-                send_options["routing_key"] = payload.routing_key
-            if payload.priority is not None:
-                send_options["priority"] = payload.priority
-            if payload.serializer is not None:
-                send_options["serializer"] = payload.serializer
-            if payload.compression is not None:
-                send_options["compression"] = payload.compression
-            if payload.headers is not None:
-                send_options["headers"] = payload.headers
-            if payload.task_id is not None:
-                send_options["task_id"] = payload.task_id
-            if payload.ignore_result is not None:
-                send_options["ignore_result"] = payload.ignore_result
-            if payload.time_limit is not None:
-                send_options["time_limit"] = payload.time_limit
-            if payload.soft_time_limit is not None:
-                send_options["soft_time_limit"] = payload.soft_time_limit
-
-            result = self.celery_app.send_task(payload.task_name, **send_options)
-            return TaskResponse(task_id=result.id, status="PENDING")
+            @self.fastapi_app.post(
+                f"{self.prefix}/trigger/batch",
+                response_model=BatchTaskResponse,
+                tags=["tasks"],
+                summary="Trigger a batch of tasks",
+            )
+            async def trigger_generic_task_batch(
+                request: Request,
+                payloads: list[dict[str, Any]] = Body(
+                    description="Array of GenericTaskPayload objects"
+                ),
+            ) -> BatchTaskResponse:
+                """
+                Trigger many Celery tasks by name in one request.
+
+                All valid items are published over a single broker connection.
+                Items that fail validation or publishing are reported per item.
+                """
+
+                return await self._submit_batch(payloads, _prepare_generic, request)
+
+            @self.fastapi_app.post(
+                f"{self.prefix}/trigger/stream",
+                tags=["tasks"],
+                summary="Stream task submissions",
+                response_class=_NDJSONStreamingResponse,
+                openapi_extra=_NDJSON_REQUEST_BODY,
+            )
+            async def trigger_generic_task_stream(
+                request: Request,
+            ) -> StreamingResponse:
+                """
+                Trigger Celery tasks from a streamed NDJSON body.
+
+                Each line is a GenericTaskPayload. Lines are published in
+                micro-batches and results are streamed back as NDJSON
+                ``{line, task_id | error}`` objects.
+                """
+                return _NDJSONStreamingResponse(
+                    self._stream_ingest(request, _prepare_generic)
+                )
+
+    def _register_metrics_endpoint(self) -> None:
+        """Register the Prometheus metrics endpoint."""
+        metrics = self.metrics
+        assert metrics is not None
+
+        @self.fastapi_app.get(
+            f"{self.prefix}/metrics",
+            tags=["monitoring"],
+            summary="Prometheus metrics",
+            response_class=Response,
+        )
+        async def get_metrics() -> Response:
+            """
+            Expose the bridge metrics in the Prometheus text format.
+
+            Latency histograms cover payload validation, broker publishes,
+            result backend reads and inspect broadcasts; submissions are
+            counted by task name, queue and outcome.
+            """
+            body, content_type = metrics.render()
+            return Response(content=body, media_type=content_type)
 
     def get_registered_routes(self) -> list[dict[str, str]]:
         """
@@ -751,8 +2358,15 @@ class CeleryFastAPIBridge:
         Returns:
             List of dictionaries containing path and method for each route.
         """
-        routes: list[dict[str, str]] = []
+        app_routes: list[BaseRoute] = []
         for route in self.fastapi_app.routes:
+            if isinstance(route, _TaskDispatchRoute):
+                app_routes.extend(route.routes)
+            else:
+                app_routes.append(route)
+
+        routes: list[dict[str, str]] = []
+        for route in app_routes:
             if hasattr(route, "path") and hasattr(route, "methods"):
                 path = route.path
                 methods = route.methods
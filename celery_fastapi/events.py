@@ -0,0 +1,265 @@
+"""Live cluster state built from the Celery event stream."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from celery import Celery, states
+from celery.events.state import TASK_EVENT_TO_STATE
+
+# Seconds close() waits for the receiver thread to exit
+_JOIN_TIMEOUT = 5.0
+
+# Task event fields kept in the model
+TASK_FIELDS: tuple[str, ...] = (
+    "name",
+    "args",
+    "kwargs",
+    "eta",
+    "expires",
+    "retries",
+    "queue",
+    "result",
+    "exception",
+    "traceback",
+    "runtime",
+    "pid",
+)
+
+# Worker heartbeat fields kept in the model
+WORKER_FIELDS: tuple[str, ...] = (
+    "freq",
+    "active",
+    "processed",
+    "loadavg",
+    "sw_ident",
+    "sw_ver",
+    "sw_sys",
+)
+
+
+class ClusterEventMonitor:
+    """
+    Maintains an in-memory model of tasks and workers from Celery events.
+
+    A background thread consumes the event stream (workers must send events,
+    e.g. ``celery worker -E``; enable ``task_send_sent_event`` to also track
+    queued tasks). Task records are kept in an ordered dict by last update,
+    so the model is bounded both by size (``max_tasks``, least recently
+    updated first) and by age (``task_ttl``). Non-terminal tasks are also
+    indexed by worker, so listing running tasks does not scan the model.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        max_tasks: int = 10000,
+        task_ttl: float = 3600.0,
+        max_workers: int = 1000,
+        worker_expiry: float = 60.0,
+        reconnect_interval: float = 5.0,
+    ) -> None:
+        """
+        Initialize the event monitor.
+
+        Args:
+            celery_app: The Celery application whose event stream is consumed.
+            max_tasks: Maximum number of task records kept in memory.
+            task_ttl: Seconds after its last event a task record is evicted.
+            max_workers: Maximum number of worker records kept in memory.
+            worker_expiry: Seconds without a heartbeat after which a worker is
+                          considered offline.
+            reconnect_interval: Seconds to wait before reconnecting to the broker.
+        """
+        self.celery_app = celery_app
+        self.max_tasks = max_tasks
+        self.task_ttl = task_ttl
+        self.max_workers = max_workers
+        self.worker_expiry = worker_expiry
+        self.reconnect_interval = reconnect_interval
+        self._tasks: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._tasks_by_worker: dict[str, set[str]] = {}
+        self._workers: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._receiver: Any = None
+
+    def on_event(self, event: dict[str, Any]) -> None:
+        """Apply a single Celery event to the model."""
+        group, _, kind = event.get("type", "").partition("-")
+        with self._lock:
+            if group == "task":
+                self._on_task_event(kind, event)
+            elif group == "worker":
+                self._on_worker_event(kind, event)
+
+    def _on_task_event(self, kind: str, event: dict[str, Any]) -> None:
+        task_id = event.get("uuid")
+        new_state = TASK_EVENT_TO_STATE.get(kind)
+        if not task_id or new_state is None:
+            return
+
+        record = self._tasks.pop(task_id, None) or {"id": task_id}
+        self._unindex(record)
+        for field in TASK_FIELDS:
+            if event.get(field) is not None:
+                record[field] = event[field]
+        if event.get("hostname"):
+            record["hostname"] = event["hostname"]
+        if kind == "started":
+            record["time_start"] = event.get("timestamp")
+        record["state"] = new_state
+        record["timestamp"] = event.get("timestamp") or time.time()
+        record["updated_at"] = time.monotonic()
+
+        # Re-inserted at the end: the dict stays ordered by last update
+        self._tasks[task_id] = record
+        if new_state not in states.READY_STATES and record.get("hostname"):
+            self._tasks_by_worker.setdefault(record["hostname"], set()).add(task_id)
+        self._evict_tasks()
+
+    def _unindex(self, record: dict[str, Any]) -> None:
+        hostname = record.get("hostname")
+        if hostname is None:
+            return
+        worker_tasks = self._tasks_by_worker.get(hostname)
+        if worker_tasks is not None:
+            worker_tasks.discard(record["id"])
+            if not worker_tasks:
+                del self._tasks_by_worker[hostname]
+
+    def _evict_tasks(self) -> None:
+        deadline = time.monotonic() - self.task_ttl
+        while self._tasks:
+            task_id, oldest = next(iter(self._tasks.items()))
+            if len(self._tasks) <= self.max_tasks and oldest["updated_at"] > deadline:
+                break
+            del self._tasks[task_id]
+            self._unindex(oldest)
+
+    def _on_worker_event(self, kind: str, event: dict[str, Any]) -> None:
+        hostname = event.get("hostname")
+        if not hostname:
+            return
+        if kind == "offline":
+            self._workers.pop(hostname, None)
+            return
+
+        record = self._workers.pop(hostname, None) or {"hostname": hostname}
+        for field in WORKER_FIELDS:
+            if event.get(field) is not None:
+                record[field] = event[field]
+        record["heartbeat"] = time.monotonic()
+        self._workers[hostname] = record
+        while len(self._workers) > self.max_workers:
+            self._workers.popitem(last=False)
+
+    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        """Return a copy of the record of a task, if known and not expired."""
+        with self._lock:
+            self._evict_tasks()
+            record = self._tasks.get(task_id)
+            return dict(record) if record is not None else None
+
+    def tasks_by_worker(self, *task_states: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Return running or queued tasks grouped by worker.
+
+        Args:
+            *task_states: Only include tasks in these (non-terminal) states.
+
+        Returns:
+            Mapping of worker hostname to task records, like inspect replies.
+        """
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        with self._lock:
+            self._evict_tasks()
+            for hostname, task_ids in self._tasks_by_worker.items():
+                records = [
+                    dict(self._tasks[task_id])
+                    for task_id in task_ids
+                    if self._tasks[task_id]["state"] in task_states
+                ]
+                if records:
+                    grouped[hostname] = records
+        return grouped
+
+    def revoked(self) -> dict[str, list[str]]:
+        """Return IDs of revoked tasks grouped by worker."""
+        grouped: dict[str, list[str]] = {}
+        with self._lock:
+            self._evict_tasks()
+            for task_id, record in self._tasks.items():
+                if record["state"] == states.REVOKED:
+                    hostname = record.get("hostname") or "unknown"
+                    grouped.setdefault(hostname, []).append(task_id)
+        return grouped
+
+    def workers(self) -> dict[str, dict[str, Any]]:
+        """Return records of workers that sent a heartbeat recently."""
+        deadline = time.monotonic() - self.worker_expiry
+        with self._lock:
+            return {
+                hostname: dict(record)
+                for hostname, record in self._workers.items()
+                if record["heartbeat"] > deadline
+            }
+
+    def _capture(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with self.celery_app.connection_for_read() as connection:
+                    receiver = self.celery_app.events.Receiver(
+                        connection, handlers={"*": self.on_event}
+                    )
+                    self._receiver = receiver
+                    if self._stop.is_set():
+                        return
+                    receiver.capture(limit=None, timeout=None, wakeup=True)
+            except Exception:  # noqa: BLE001
+                self._stop.wait(self.reconnect_interval)
+            finally:
+                self._receiver = None
+
+    async def start(self) -> None:
+        """
+        Start consuming events on a background thread.
+
+        Raises:
+            RuntimeError: If the receiver thread of a previous run is still
+                         shutting down.
+        """
+        if self._thread is not None:
+            if not self._stop.is_set():
+                return
+            # close() timed out waiting for the previous receiver thread
+            await self._join()
+            if self._thread is not None:
+                raise RuntimeError("The previous event receiver is still running")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._capture, name="celery-fastapi-events", daemon=True
+        )
+        self._thread.start()
+
+    async def close(self) -> None:
+        """Stop consuming events and wait for the receiver thread to exit."""
+        self._stop.set()
+        receiver = self._receiver
+        if receiver is not None:
+            receiver.should_stop = True
+        await self._join()
+
+    async def _join(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        await asyncio.to_thread(thread.join, _JOIN_TIMEOUT)
+        if not thread.is_alive():
+            self._thread = None
@@ -0,0 +1,168 @@
+"""Deduplication of task submissions by ``Idempotency-Key``."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Namespace of the task IDs derived from idempotency keys
+_TASK_ID_NAMESPACE = uuid.UUID("6f1c0a52-3d0e-4f43-9a55-1b8f3c2d7e90")
+
+
+def idempotent_task_id(task_name: str, key: str) -> str:
+    """
+    Return the deterministic task ID of an idempotency key.
+
+    The same key always maps to the same task ID for a given task, so a
+    submission that is replayed after its store entry expired still reuses
+    the original ID.
+    """
+    return str(uuid.uuid5(_TASK_ID_NAMESPACE, f"{task_name}\0{key}"))
+
+
+class IdempotencyStore(ABC):
+    """
+    Base class for stores remembering which task each idempotency key created.
+
+    Stores only need an atomic "set if absent": the first submission of a key
+    claims it with its task ID, and every later submission reads that ID back
+    instead of publishing again.
+    """
+
+    @abstractmethod
+    async def claim(self, key: str, task_id: str) -> str | None:
+        """
+        Record ``task_id`` under ``key`` unless the key is already recorded.
+
+        Args:
+            key: The idempotency key, scoped to the task name.
+            task_id: The ID of the task about to be published.
+
+        Returns:
+            None if the key was claimed, or the task ID already recorded
+            under it.
+        """
+
+    @abstractmethod
+    async def release(self, key: str, task_id: str) -> None:
+        """
+        Forget a claim whose task could not be published.
+
+        Only removes the entry if it still records ``task_id``.
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release store resources (called on application shutdown)."""
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    In-process idempotency store with LRU eviction and a TTL.
+
+    Entries are only shared by the requests served by one process; use a
+    shared store such as :class:`RedisIdempotencyStore` behind a load
+    balancer or with several workers.
+    """
+
+    def __init__(self, *, max_size: int = 10000, ttl: float = 86400.0) -> None:
+        """
+        Initialize the memory store.
+
+        Args:
+            max_size: Maximum number of keys kept. The least recently used
+                     key is evicted beyond it.
+            ttl: Seconds a key is remembered after it was claimed.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def claim(self, key: str, task_id: str) -> str | None:
+        """Record ``task_id`` under ``key`` unless a live entry exists."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                self._entries.move_to_end(key)
+                return entry[0]
+            del self._entries[key]
+        self._entries[key] = (task_id, now + self.ttl)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return None
+
+    async def release(self, key: str, task_id: str) -> None:
+        """Forget the claim of ``key`` if it still records ``task_id``."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == task_id:
+            del self._entries[key]
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency store shared through Redis.
+
+    Claims use ``SET NX EX``, so concurrent submissions of a key from any
+    process agree on a single task.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        ttl: float = 86400.0,
+        prefix: str = "celery-fastapi:idempotency:",
+    ) -> None:
+        """
+        Initialize the Redis store.
+
+        Args:
+            client: An asyncio Redis client, e.g. ``redis.asyncio.Redis``.
+            ttl: Seconds a key is remembered after it was claimed.
+            prefix: Prefix of the Redis keys.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def claim(self, key: str, task_id: str) -> str | None:
+        """Record ``task_id`` under ``key`` unless it is already set."""
+        name = self.prefix + key
+        ttl = max(1, int(self.ttl))
+        while True:
+            if await self.client.set(name, task_id, nx=True, ex=ttl):
+                return None
+            existing = await self.client.get(name)
+            if existing is not None:
+                return (
+                    existing.decode() if isinstance(existing, bytes) else str(existing)
+                )
+            # Expired between the two calls: race for it again with SET NX,
+            # as another submission may be claiming it too
+
+    async def release(self, key: str, task_id: str) -> None:
+        """Delete the claim of ``key`` if it still records ``task_id``."""
+        name = self.prefix + key
+        existing = await self.client.get(name)
+        if isinstance(existing, bytes):
+            existing = existing.decode()
+        if existing == task_id:
+            await self.client.delete(name)
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        close = getattr(self.client, "aclose", None) or getattr(
+            self.client, "close", None
+        )
+        if close is not None:
+            await close()
@@ -0,0 +1,148 @@
+"""Cached cluster inspection for Celery FastAPI."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from celery import Celery
+from pydantic import BaseModel
+
+from celery_fastapi.refresh import LazyExecutor, PeriodicRefresher, SingleFlight
+
+if TYPE_CHECKING:
+    from celery_fastapi.metrics import BridgeMetrics
+
+# Inspect commands gathered into every snapshot
+INSPECT_COMMANDS: tuple[str, ...] = (
+    "active",
+    "scheduled",
+    "reserved",
+    "revoked",
+    "ping",
+    "stats",
+    "registered",
+    "active_queues",
+)
+
+
+class ClusterSnapshot(BaseModel):
+    """Replies of all workers to the inspect commands, taken at one point in time."""
+
+    active: dict[str, Any] = {}
+    scheduled: dict[str, Any] = {}
+    reserved: dict[str, Any] = {}
+    revoked: dict[str, Any] = {}
+    ping: dict[str, Any] = {}
+    stats: dict[str, Any] = {}
+    registered: dict[str, Any] = {}
+    active_queues: dict[str, Any] = {}
+    taken_at: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was taken."""
+        return time.monotonic() - self.taken_at
+
+
+class ClusterInspector:
+    """
+    Serves cluster inspection data from an in-memory snapshot.
+
+    A snapshot gathers all inspect commands in parallel, so it costs one
+    reply timeout instead of one per command. Concurrent refreshes are
+    coalesced into a single set of broadcasts. By default the snapshot is
+    refreshed on demand once it is older than ``refresh_interval`` seconds,
+    so no broadcasts are sent while nobody reads it. With ``background``, a
+    task started with the app refreshes it every ``refresh_interval``
+    seconds instead; every server process then broadcasts to the whole
+    cluster at that rate.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        refresh_interval: float = 5.0,
+        timeout: float = 1.0,
+        background: bool = False,
+    ) -> None:
+        """
+        Initialize the cluster inspector.
+
+        Args:
+            celery_app: The Celery application used to broadcast inspect commands.
+            refresh_interval: Seconds between refreshes (and maximum snapshot age
+                             when refreshing on demand).
+            timeout: Seconds to wait for worker replies to each command.
+            background: Whether ``start`` launches the background refresh task.
+        """
+        self.celery_app = celery_app
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+        self.background = background
+        self.metrics: BridgeMetrics | None = None
+        self._snapshot: ClusterSnapshot | None = None
+        self._flight: SingleFlight[ClusterSnapshot] = SingleFlight()
+        self._refresher = PeriodicRefresher(self.refresh, refresh_interval)
+        self._executor = LazyExecutor(len(INSPECT_COMMANDS), "celery-fastapi-inspect")
+
+    @property
+    def snapshot(self) -> ClusterSnapshot | None:
+        """The latest snapshot, if any."""
+        return self._snapshot
+
+    async def get_snapshot(self) -> ClusterSnapshot:
+        """
+        Return the current snapshot, refreshing it if missing or stale.
+
+        While the background task is running, the cached snapshot is always
+        served as-is.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and (
+            self._refresher.running or snapshot.age <= self.refresh_interval
+        ):
+            return snapshot
+        return await self.refresh()
+
+    async def refresh(self) -> ClusterSnapshot:
+        """Take a new snapshot, joining a refresh already in progress."""
+        return await self._flight.run(None, self._take_snapshot)
+
+    async def _take_snapshot(self) -> ClusterSnapshot:
+        inspector = self.celery_app.control.inspect(timeout=self.timeout)
+        metrics = self.metrics
+
+        def broadcast(command: str) -> Any:
+            started = time.perf_counter()
+            try:
+                return getattr(inspector, command)()
+            finally:
+                if metrics is not None:
+                    metrics.observe_inspect(command, started)
+
+        replies = await asyncio.gather(
+            *(self._executor.run(broadcast, command) for command in INSPECT_COMMANDS),
+            return_exceptions=True,
+        )
+        data: dict[str, Any] = {
+            command: reply if isinstance(reply, dict) else {}
+            for command, reply in zip(INSPECT_COMMANDS, replies, strict=True)
+        }
+        # Built by us from worker replies, no need to validate
+        snapshot = ClusterSnapshot.model_construct(taken_at=time.monotonic(), **data)
+        self._snapshot = snapshot
+        return snapshot
+
+    async def start(self) -> None:
+        """Start the background refresh task if enabled."""
+        if self.background:
+            self._refresher.start()
+
+    async def close(self) -> None:
+        """Stop the background refresh task and the thread pool."""
+        await self._refresher.stop()
+        self._executor.shutdown()
+        self._flight.clear()
@@ -0,0 +1,303 @@
+"""Admission control for task submissions: rate limits and queue depth."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from celery import Celery
+from celery.utils.time import rate as parse_rate
+from kombu.utils.limits import TokenBucket
+from starlette.requests import Request
+
+from celery_fastapi.refresh import LazyExecutor, PeriodicRefresher, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# A rate limit: a Celery-style "N/s", "N/m" or "N/h" string, or tasks per second
+RateSpec = str | float
+
+
+class SubmissionRejected(Exception):
+    """Raised when a submission is refused before it is published."""
+
+    status_code = 429
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """The ``Retry-After`` header value: whole seconds, at least 1."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class RateLimitExceeded(SubmissionRejected):
+    """Raised when a task, queue or client exceeds its rate limit."""
+
+    status_code = 429
+
+
+class QueueBacklogged(SubmissionRejected):
+    """Raised when the target queue holds more messages than allowed."""
+
+    status_code = 503
+
+
+def client_address(request: Request) -> str | None:
+    """Return the client IP address of a request, the default client key."""
+    return request.client.host if request.client else None
+
+
+def _bucket(spec: RateSpec, burst: float) -> TokenBucket | None:
+    """Return a token bucket for a rate, or None if the rate is unlimited."""
+    per_second = parse_rate(spec)
+    if not per_second:
+        return None
+    return TokenBucket(per_second, capacity=max(1.0, per_second * burst))
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limits per task name, per queue and per client.
+
+    A submission consumes one token from each bucket that applies to it, and
+    only if all of them have one, so a rejected submission never uses up
+    another limit. Buckets refill continuously at their rate and hold up to
+    ``burst`` seconds worth of tokens.
+    """
+
+    def __init__(
+        self,
+        *,
+        task_limits: dict[str, RateSpec] | None = None,
+        queue_limits: dict[str, RateSpec] | None = None,
+        client_limit: RateSpec | None = None,
+        client_key: Callable[[Request], str | None] = client_address,
+        burst: float = 1.0,
+        max_clients: int = 10000,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            task_limits: Rate limit per task name, e.g. ``{"app.send": "10/s"}``.
+            queue_limits: Rate limit per queue, shared by all tasks sent to it.
+            client_limit: Rate limit applied to each client key separately.
+            client_key: Returns the key identifying the client of a request,
+                       e.g. an API key header. Defaults to the client address.
+            burst: Seconds worth of tokens a bucket holds, i.e. how long an
+                  idle client can save up submissions for.
+            max_clients: Maximum number of client buckets kept. The least
+                        recently used one is dropped beyond it.
+        """
+        self.burst = burst
+        self.max_clients = max_clients
+        self.client_limit = client_limit
+        self.client_key = client_key
+        self._task_buckets = self._buckets(task_limits or {})
+        self._queue_buckets = self._buckets(queue_limits or {})
+        self._client_buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def _buckets(self, limits: dict[str, RateSpec]) -> dict[str, TokenBucket]:
+        buckets = {name: _bucket(spec, self.burst) for name, spec in limits.items()}
+        return {name: bucket for name, bucket in buckets.items() if bucket is not None}
+
+    def _client_bucket(self, client: str) -> TokenBucket | None:
+        bucket = self._client_buckets.get(client)
+        if bucket is not None:
+            self._client_buckets.move_to_end(client)
+            return bucket
+        if self.client_limit is None:
+            return None
+        bucket = _bucket(self.client_limit, self.burst)
+        if bucket is None:
+            return None
+        self._client_buckets[client] = bucket
+        while len(self._client_buckets) > self.max_clients:
+            self._client_buckets.popitem(last=False)
+        return bucket
+
+    def check(self, task_name: str, queue: str | None, client: str | None) -> None:
+        """
+        Take a token for a submission.
+
+        Args:
+            task_name: Name of the submitted task.
+            queue: Queue the task is sent to.
+            client: Key identifying the client, if known.
+
+        Raises:
+            RateLimitExceeded: If any applicable bucket is empty.
+        """
+        limited: list[tuple[str, TokenBucket]] = []
+        bucket = self._task_buckets.get(task_name)
+        if bucket is not None:
+            limited.append((f"task '{task_name}'", bucket))
+        bucket = self._queue_buckets.get(queue) if queue is not None else None
+        if bucket is not None:
+            limited.append((f"queue '{queue}'", bucket))
+        bucket = self._client_bucket(client) if client is not None else None
+        if bucket is not None:
+            limited.append(("client", bucket))
+
+        waits = [(bucket.expected_time(1), scope) for scope, bucket in limited]
+        wait, scope = max(waits, default=(0.0, ""))
+        if wait > 0:
+            raise RateLimitExceeded(f"Rate limit exceeded for {scope}", wait)
+        for _, bucket in limited:
+            bucket.can_consume(1)
+
+
+class QueueDepthGuard:
+    """
+    Rejects submissions to queues whose broker backlog is too long.
+
+    Only the queues the application knows are guarded: the keys of a
+    ``max_depth`` dict, or with one limit for every queue, the default queue,
+    ``task_queues`` and the queues set on tasks. Queue names a client makes
+    up are never read from the broker. Lengths are read with a passive
+    ``queue_declare`` on a dedicated thread and cached. When started, a
+    background task refreshes the lengths of all guarded queues right away
+    and then every ``refresh_interval`` seconds; otherwise they are
+    refreshed on demand once older than that.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        max_depth: int | dict[str, int],
+        refresh_interval: float = 5.0,
+        background: bool = True,
+    ) -> None:
+        """
+        Initialize the queue depth guard.
+
+        Args:
+            celery_app: The Celery application whose broker is queried.
+            max_depth: Maximum number of ready messages in a queue, either for
+                      every queue known to the app or per queue name. Queues
+                      missing from the dict are not guarded.
+            refresh_interval: Seconds between queue length refreshes. Also
+                             the ``Retry-After`` of rejected submissions.
+            background: Whether ``start`` launches the background refresh task.
+        """
+        self.celery_app = celery_app
+        self.max_depth = max_depth
+        self.refresh_interval = refresh_interval
+        self.background = background
+        self._depths: dict[str, int] = {}
+        self._queues: frozenset[str] | None = None
+        self._refreshed_at = 0.0
+        self._flight: SingleFlight[dict[str, int]] = SingleFlight()
+        self._refresher = PeriodicRefresher(self.refresh, refresh_interval)
+        self._executor = LazyExecutor(1, "celery-fastapi-queue-depth")
+
+    @property
+    def depths(self) -> dict[str, int]:
+        """The cached length of each queue seen so far."""
+        return dict(self._depths)
+
+    @property
+    def queues(self) -> frozenset[str]:
+        """The names of the guarded queues."""
+        if self._queues is None:
+            self._queues = frozenset(self._known_queues())
+        return self._queues
+
+    def _known_queues(self) -> set[str]:
+        if isinstance(self.max_depth, dict):
+            return set(self.max_depth)
+        conf = self.celery_app.conf
+        queues = {conf.task_default_queue or "celery"}
+        # task_queues holds kombu Queues, or queue names as dict keys
+        for queue in conf.task_queues or ():
+            queues.add(queue if isinstance(queue, str) else queue.name)
+        for task in self.celery_app.tasks.values():
+            if isinstance(getattr(task, "queue", None), str):
+                queues.add(task.queue)
+        return queues
+
+    def limit_for(self, queue: str) -> int | None:
+        """Return the maximum depth of a queue, or None if it is not guarded."""
+        if queue not in self.queues:
+            return None
+        if isinstance(self.max_depth, dict):
+            return self.max_depth[queue]
+        return self.max_depth
+
+    async def check(self, queue: str | None) -> None:
+        """
+        Check the cached backlog of a queue.
+
+        Raises:
+            QueueBacklogged: If the queue holds ``max_depth`` messages or more.
+        """
+        if queue is None:
+            return
+        limit = self.limit_for(queue)
+        if limit is None:
+            return
+        if (
+            not self._refresher.running
+            and time.monotonic() - self._refreshed_at > self.refresh_interval
+        ):
+            await self._refresh_quietly()
+        depth = self._depths.get(queue, 0)
+        if depth >= limit:
+            raise QueueBacklogged(
+                f"Queue '{queue}' has {depth} pending messages (limit {limit})",
+                self.refresh_interval,
+            )
+
+    async def refresh(self) -> dict[str, int]:
+        """Read the length of every guarded queue, joining a refresh in progress."""
+        return await self._flight.run(None, self._read_depths)
+
+    async def _refresh_quietly(self) -> None:
+        """Refresh the queue lengths, keeping the cached ones if the broker fails."""
+        try:
+            await self.refresh()
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not read queue lengths", exc_info=True)
+
+    async def _read_depths(self) -> dict[str, int]:
+        depths = await self._executor.run(self._read_sync, sorted(self.queues))
+        self._depths.update(depths)
+        self._refreshed_at = time.monotonic()
+        return depths
+
+    def _read_sync(self, queues: Iterable[str]) -> dict[str, int]:
+        depths: dict[str, int] = {}
+        with self.celery_app.connection_for_read() as connection:
+            for queue in queues:
+                # A failed passive declare closes the channel, so use one each
+                channel = connection.channel()
+                try:
+                    ok = channel.queue_declare(queue=queue, passive=True)
+                    depths[queue] = int(ok.message_count)
+                except Exception:  # noqa: BLE001
+                    # Missing queue, or a transport without message counts
+                    logger.debug("Could not read the length of %s", queue)
+                    depths[queue] = 0
+                finally:
+                    with contextlib.suppress(Exception):
+                        channel.close()
+        return depths
+
+    async def start(self) -> None:
+        """Start the background refresh task if enabled and any queue is guarded."""
+        if self.background and self.queues:
+            self._refresher.start()
+
+    async def close(self) -> None:
+        """Stop the background refresh task and the thread pool."""
+        await self._refresher.stop()
+        self._executor.shutdown()
+        self._flight.clear()
@@ -0,0 +1,266 @@
+"""Prometheus metrics for the hot paths of Celery FastAPI."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+# Latency buckets in seconds, from a fast in-process path to a slow broker
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Label value used once a label has seen ``max_label_values`` distinct values
+OTHER_LABEL = "other"
+
+
+class BridgeMetrics:
+    """
+    Prometheus metrics of a bridge: latencies of the hot paths and submissions.
+
+    Histograms cover payload validation, broker publishes, result backend
+    reads and inspect broadcasts; counters track submissions by task name,
+    queue and outcome, and result lookups by cache outcome. Bodies FastAPI
+    validates before the bridge sees them (per-task endpoints and
+    ``/tasks/trigger``) only have their task message building recorded, in
+    a histogram of its own. Labelled children are cached in plain dicts, so
+    the hot path does not take the lock of ``labels()`` on every observation.
+
+    When the ``PROMETHEUS_MULTIPROC_DIR`` environment variable is set before
+    the app is imported, ``prometheus_client`` stores values in memory-mapped
+    files and :meth:`render` aggregates the files of all worker processes, so
+    any gunicorn or pre-fork worker serves the metrics of the whole server.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: CollectorRegistry | None = None,
+        namespace: str = "celery_fastapi",
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        max_label_values: int = 1000,
+    ) -> None:
+        """
+        Initialize the bridge metrics.
+
+        Args:
+            registry: Registry the metrics are registered in. A new one is
+                     created if omitted; pass ``prometheus_client.REGISTRY``
+                     to expose them next to your own metrics.
+            namespace: Prefix of the metric names.
+            buckets: Upper bounds of the latency histogram buckets, in seconds.
+            max_label_values: Maximum number of distinct task names and queues
+                             counted separately. Further values are counted
+                             as ``"other"``, so clients triggering arbitrary
+                             task names cannot explode the label cardinality.
+
+        Raises:
+            ImportError: If prometheus_client is not installed.
+        """
+        try:
+            from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+        except ImportError as exc:
+            raise ImportError(
+                "prometheus_client is required for metrics. "
+                "Install it with: pip install celery-fastapi[prometheus]"
+            ) from exc
+
+        self.registry = registry if registry is not None else CollectorRegistry()
+        self.max_label_values = max_label_values
+        self.validation_seconds = Histogram(
+            "validation_seconds",
+            "Time spent validating a payload and building its task message",
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.message_build_seconds = Histogram(
+            "message_build_seconds",
+            "Time spent building the task message of a payload FastAPI validated",
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.publish_seconds = Histogram(
+            "publish_seconds",
+            "Time spent publishing a task message, or a batch of them",
+            ["mode"],
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.backend_seconds = Histogram(
+            "backend_seconds",
+            "Time spent reading the result backend",
+            ["operation"],
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.inspect_seconds = Histogram(
+            "inspect_seconds",
+            "Time spent waiting for the replies to an inspect broadcast",
+            ["command"],
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.submissions = Counter(
+            "submissions",
+            "Task submissions by task name, queue and outcome",
+            ["task", "queue", "outcome"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.result_lookups = Counter(
+            "result_lookups",
+            "Task meta lookups by outcome: cache hit, backend read (miss) or "
+            "joined a read in progress (coalesced)",
+            ["outcome"],
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self.producers_in_use = Gauge(
+            "producers_in_use",
+            "Broker producers checked out of the bridge's producer pool",
+            namespace=namespace,
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.producer_waiters = Gauge(
+            "producer_waiters",
+            "Submissions waiting for a free producer of an exhausted pool",
+            namespace=namespace,
+            registry=self.registry,
+            multiprocess_mode="livesum",
+        )
+        self.producer_wait_seconds = Histogram(
+            "producer_wait_seconds",
+            "Time spent waiting for a producer while the pool was exhausted",
+            namespace=namespace,
+            buckets=buckets,
+            registry=self.registry,
+        )
+        self.producer_timeouts = Counter(
+            "producer_timeouts",
+            "Producer checkouts that gave up after acquire_timeout",
+            namespace=namespace,
+            registry=self.registry,
+        )
+        self._children: dict[tuple[Any, ...], Any] = {}
+        self._label_values: dict[str, set[str]] = {"task": set(), "queue": set()}
+
+    def _child(self, metric: Any, *labels: str) -> Any:
+        """Return the labelled child of a metric, cached without locking."""
+        key = (id(metric), *labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*labels)
+        return child
+
+    def _bounded(self, label: str, value: str | None) -> str:
+        """Return a label value, or ``"other"`` once the label is full."""
+        if not value:
+            return ""
+        seen = self._label_values[label]
+        if value in seen:
+            return value
+        if len(seen) >= self.max_label_values:
+            return OTHER_LABEL
+        seen.add(value)
+        return value
+
+    def observe_validation(self, started: float) -> None:
+        """Record a validation that started at ``started`` (``perf_counter``)."""
+        self.validation_seconds.observe(time.perf_counter() - started)
+
+    def observe_message_build(self, started: float) -> None:
+        """Record building the message of a payload validated by FastAPI."""
+        self.message_build_seconds.observe(time.perf_counter() - started)
+
+    def observe_publish(self, mode: str, started: float) -> None:
+        """Record a ``"single"`` or ``"batch"`` publish."""
+        self._child(self.publish_seconds, mode).observe(time.perf_counter() - started)
+
+    def observe_backend(self, operation: str, started: float) -> None:
+        """Record a result backend read."""
+        self._child(self.backend_seconds, operation).observe(
+            time.perf_counter() - started
+        )
+
+    def observe_inspect(self, command: str, started: float) -> None:
+        """Record the round-trip of an inspect broadcast."""
+        self._child(self.inspect_seconds, command).observe(
+            time.perf_counter() - started
+        )
+
+    def count_submission(
+        self, task_name: str, queue: str | None, outcome: str, amount: int = 1
+    ) -> None:
+        """
+        Count submissions of a task.
+
+        Args:
+            task_name: Name of the submitted task.
+            queue: Queue the task was sent to.
+            outcome: ``published``, ``replayed``, ``invalid``, ``rejected``,
+                    ``busy`` or ``error``.
+            amount: Number of submissions.
+        """
+        task = self._bounded("task", task_name)
+        queue_label = self._bounded("queue", queue)
+        self._child(self.submissions, task, queue_label, outcome).inc(amount)
+
+    def observe_producer_pool(self, in_use: int, waiting: int) -> None:
+        """Record the occupancy of the producer pool."""
+        self.producers_in_use.set(in_use)
+        self.producer_waiters.set(waiting)
+
+    def observe_producer_wait(self, seconds: float, *, timed_out: bool) -> None:
+        """Record a wait for a producer of an exhausted pool."""
+        self.producer_wait_seconds.observe(seconds)
+        if timed_out:
+            self.producer_timeouts.inc()
+
+    def count_result_lookup(self, outcome: str, amount: int = 1) -> None:
+        """Count ``hit``, ``miss`` or ``coalesced`` task meta lookups."""
+        self._child(self.result_lookups, outcome).inc(amount)
+
+    def render(self) -> tuple[bytes, str]:
+        """
+        Return the metrics in the Prometheus text format.
+
+        Returns:
+            The exposition body and its content type.
+        """
+        from prometheus_client import (
+            CONTENT_TYPE_LATEST,
+            CollectorRegistry,
+            generate_latest,
+            multiprocess,
+        )
+
+        registry = self.registry
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,617 @@
+"""Task submission engines for Celery FastAPI."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from typing import TYPE_CHECKING, Any
+
+from celery import Celery
+from kombu import Producer
+
+if TYPE_CHECKING:
+    from celery_fastapi.metrics import BridgeMetrics
+
+logger = logging.getLogger(__name__)
+
+# A task name and its ``send_task`` options
+TaskMessage = tuple[str, dict[str, Any]]
+
+
+class PublisherBusyError(Exception):
+    """Raised when a publisher cannot accept more submissions in time."""
+
+
+class ProducerPool:
+    """
+    Pool of broker connections and producers owned by the bridge.
+
+    Publisher threads check out a producer for each submission (or batch)
+    and return it afterwards. The pool grows up to ``size`` producers, each
+    with its own connection, so concurrent submitters never share one; when
+    all are in use, callers wait up to ``acquire_timeout`` seconds and the
+    wait is counted in the exhaustion metrics, also reported to ``metrics``
+    when the bridge has them. ``warm`` opens the connections
+    ahead of the first request. A producer idle for longer than
+    ``health_check_interval`` has its connection verified before reuse, and
+    one whose use raised is discarded with its connection.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        size: int = 8,
+        acquire_timeout: float | None = 10.0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        """
+        Initialize the producer pool.
+
+        Args:
+            celery_app: The Celery application whose broker is published to.
+            size: Maximum number of producers (and connections).
+            acquire_timeout: Seconds to wait for a free producer before raising
+                            :class:`PublisherBusyError`. ``None`` waits forever.
+            health_check_interval: Seconds a producer may stay idle before its
+                                  connection is verified on checkout.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.celery_app = celery_app
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._idle: list[tuple[Any, float]] = []
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.metrics: BridgeMetrics | None = None
+        self._waiting = 0
+        self.acquired = 0
+        self.exhausted = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+        self.discarded = 0
+        self.health_check_failures = 0
+
+    @property
+    def in_use(self) -> int:
+        """Number of producers currently checked out."""
+        return self._created - len(self._idle)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the pool size and exhaustion metrics."""
+        with self._condition:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self.in_use,
+                "waiting": self._waiting,
+                "acquired": self.acquired,
+                "exhausted": self.exhausted,
+                "wait_seconds": self.wait_seconds,
+                "timeouts": self.timeouts,
+                "discarded": self.discarded,
+                "health_check_failures": self.health_check_failures,
+            }
+
+    def _report(self) -> None:
+        """Report the pool occupancy to the metrics. Called with the lock held."""
+        if self.metrics is not None:
+            self.metrics.observe_producer_pool(self.in_use, self._waiting)
+
+    def _create(self) -> Any:
+        connection = self.celery_app.connection_for_write()
+        try:
+            connection.ensure_connection(max_retries=1)
+            return Producer(connection.default_channel)
+        except BaseException:
+            connection.release()
+            raise
+
+    def _destroy(self, producer: Any) -> None:
+        try:
+            producer.connection.release()
+        except Exception:  # noqa: BLE001
+            logger.debug("Error closing a pooled broker connection", exc_info=True)
+
+    def _healthy(self, producer: Any) -> bool:
+        try:
+            connection = producer.connection
+            if not connection.connected:
+                return False
+            connection.heartbeat_check()
+        except Exception:  # noqa: BLE001
+            return False
+        return True
+
+    def warm(self) -> int:
+        """
+        Open connections until the pool holds ``size`` producers.
+
+        Also reopens the pool after :meth:`close`.
+
+        Returns:
+            The number of producers opened.
+        """
+        opened = 0
+        with self._condition:
+            self._closed = False
+        while True:
+            with self._condition:
+                if self._closed or self._created >= self.size:
+                    return opened
+                self._created += 1
+            try:
+                producer = self._create()
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                raise
+            self._checkin(producer)
+            opened += 1
+
+    def _checkout(self) -> Any:
+        with self._condition:
+            self.acquired += 1
+            if not self._idle and self._created >= self.size:
+                self.exhausted += 1
+                self._waiting += 1
+                self._report()
+                started = time.monotonic()
+                try:
+                    available = self._condition.wait_for(
+                        lambda: self._idle or self._created < self.size,
+                        timeout=self.acquire_timeout,
+                    )
+                finally:
+                    self._waiting -= 1
+                waited = time.monotonic() - started
+                self.wait_seconds += waited
+                if self.metrics is not None:
+                    self.metrics.observe_producer_wait(waited, timed_out=not available)
+                if not available:
+                    self.timeouts += 1
+                    self._report()
+                    raise PublisherBusyError(
+                        f"No broker producer available ({self.size} in use)"
+                    )
+            if self._idle:
+                producer, released_at = self._idle.pop()
+                stale = time.monotonic() - released_at > self.health_check_interval
+            else:
+                producer, stale = None, False
+                self._created += 1
+            self._report()
+
+        if producer is not None and stale and not self._healthy(producer):
+            with self._condition:
+                self.health_check_failures += 1
+                self.discarded += 1
+            self._destroy(producer)
+            producer = None
+        if producer is None:
+            try:
+                producer = self._create()
+            except BaseException:
+                with self._condition:
+                    self._created -= 1
+                    self._condition.notify()
+                    self._report()
+                raise
+        return producer
+
+    def _checkin(self, producer: Any) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.append((producer, time.monotonic()))
+                self._condition.notify()
+                self._report()
+                return
+            self._created -= 1
+            self._report()
+        self._destroy(producer)
+
+    def _discard(self, producer: Any) -> None:
+        with self._condition:
+            self._created -= 1
+            self.discarded += 1
+            self._condition.notify()
+            self._report()
+        self._destroy(producer)
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """
+        Check out a producer for the duration of a ``with`` block.
+
+        Raises:
+            PublisherBusyError: If no producer is available in time.
+        """
+        producer = self._checkout()
+        try:
+            yield producer
+        except BaseException:
+            self._discard(producer)
+            raise
+        self._checkin(producer)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed on return."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for producer, _ in idle:
+            self._destroy(producer)
+
+
+class TaskPublisher(ABC):
+    """
+    Base class for task submission engines.
+
+    A publisher turns a task name and ``send_task`` options into a published
+    message and returns the task ID. Subclasses decide where the (blocking)
+    broker round-trip happens.
+    """
+
+    def __init__(
+        self, celery_app: Celery, *, producer_pool: ProducerPool | None = None
+    ) -> None:
+        """
+        Initialize the publisher.
+
+        Args:
+            celery_app: The Celery application used to publish tasks.
+            producer_pool: Optional ProducerPool to publish with. Celery's
+                          default producer pool is used if omitted.
+        """
+        self.celery_app = celery_app
+        self.producer_pool = producer_pool
+
+    @abstractmethod
+    async def send(self, task_name: str, **options: Any) -> str:
+        """
+        Publish a task and return its ID.
+
+        Args:
+            task_name: Name of the task to publish.
+            **options: Keyword arguments forwarded to ``Celery.send_task``.
+
+        Returns:
+            The ID of the published task.
+        """
+
+    @abstractmethod
+    async def send_many(self, messages: Sequence[TaskMessage]) -> list[str | Exception]:
+        """
+        Publish several tasks over a single producer.
+
+        Args:
+            messages: Sequence of ``(task_name, send_options)`` pairs.
+
+        Returns:
+            One entry per message, in order: the task ID, or the exception
+            raised while publishing that message.
+        """
+
+    async def start(self) -> None:  # noqa: B027
+        """Prepare the publisher (called on application startup)."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release publisher resources (called on application shutdown)."""
+
+    def _producer(self) -> AbstractContextManager[Any]:
+        """Check out a producer from the bridge pool or Celery's default pool."""
+        if self.producer_pool is not None:
+            return self.producer_pool.acquire()
+        default: AbstractContextManager[Any] = self.celery_app.producer_or_acquire()
+        return default
+
+    def _send_sync(self, task_name: str, options: dict[str, Any]) -> str:
+        """Publish a task on the calling thread."""
+        if self.producer_pool is not None and "producer" not in options:
+            with self.producer_pool.acquire() as producer:
+                result = self.celery_app.send_task(
+                    task_name, producer=producer, **options
+                )
+        else:
+            result = self.celery_app.send_task(task_name, **options)
+        return str(result.id)
+
+    def _send_many_sync(self, messages: Sequence[TaskMessage]) -> list[str | Exception]:
+        """Publish tasks on the calling thread, sharing one pooled producer."""
+        results: list[str | Exception] = []
+        try:
+            with self._producer() as producer:
+                for task_name, options in messages:
+                    try:
+                        results.append(
+                            self._send_sync(
+                                task_name, {**options, "producer": producer}
+                            )
+                        )
+                    except Exception as exc:  # noqa: BLE001
+                        results.append(exc)
+        except Exception as exc:  # noqa: BLE001
+            # Acquiring (or releasing) the producer failed: the remaining
+            # messages were never published.
+            results.extend(exc for _ in range(len(messages) - len(results)))
+        return results
+
+
+class InlinePublisher(TaskPublisher):
+    """
+    Publisher that calls ``send_task`` directly on the event loop.
+
+    This matches the historical behaviour and is only suitable for in-memory
+    transports or tests, since a slow broker blocks every request.
+    """
+
+    async def send(self, task_name: str, **options: Any) -> str:
+        """Publish a task on the event loop thread."""
+        return self._send_sync(task_name, options)
+
+    async def send_many(self, messages: Sequence[TaskMessage]) -> list[str | Exception]:
+        """Publish tasks on the event loop thread."""
+        return self._send_many_sync(messages)
+
+
+class ThreadPoolPublisher(TaskPublisher):
+    """
+    Publisher that runs broker round-trips on a bounded thread pool.
+
+    The event loop only awaits a future, so broker latency or reconnect
+    stalls never freeze other requests. At most ``max_pending`` submissions
+    may be queued or in flight; further callers wait for a slot, and if
+    ``acquire_timeout`` is set they fail with :class:`PublisherBusyError`
+    instead of waiting forever.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        max_workers: int = 8,
+        max_pending: int = 1024,
+        acquire_timeout: float | None = None,
+        producer_pool: ProducerPool | None = None,
+    ) -> None:
+        """
+        Initialize the thread pool publisher.
+
+        Args:
+            celery_app: The Celery application used to publish tasks.
+            max_workers: Number of publisher threads.
+            max_pending: Maximum number of queued or in-flight submissions.
+            acquire_timeout: Seconds to wait for a free slot before raising
+                            :class:`PublisherBusyError`. ``None`` waits forever.
+            producer_pool: Optional ProducerPool to publish with.
+        """
+        super().__init__(celery_app, producer_pool=producer_pool)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < max_workers:
+            raise ValueError("max_pending must be at least max_workers")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.acquire_timeout = acquire_timeout
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._slots_loop: asyncio.AbstractEventLoop | None = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of submissions currently queued or in flight."""
+        return self._pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="celery-fastapi-publisher",
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _acquire(self, slots: asyncio.Semaphore) -> None:
+        if self.acquire_timeout is None:
+            await slots.acquire()
+            return
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.acquire_timeout)
+        except TimeoutError:
+            raise PublisherBusyError(
+                f"Publisher queue is full ({self.max_pending} pending submissions)"
+            )
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run ``func`` on the publisher pool while holding a slot."""
+        slots = self._get_slots()
+        await self._acquire(slots)
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), functools.partial(func, *args)
+            )
+        finally:
+            self._pending -= 1
+            slots.release()
+
+    async def send(self, task_name: str, **options: Any) -> str:
+        """Publish a task on the publisher thread pool."""
+        task_id: str = await self._run(self._send_sync, task_name, options)
+        return task_id
+
+    async def send_many(self, messages: Sequence[TaskMessage]) -> list[str | Exception]:
+        """Publish tasks on one publisher thread, holding a single slot."""
+        results: list[str | Exception] = await self._run(self._send_many_sync, messages)
+        return results
+
+    async def start(self) -> None:
+        """Create the thread pool ahead of the first request."""
+        self._get_executor()
+
+    async def close(self) -> None:
+        """Wait for in-flight submissions and stop the thread pool."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=True)
+            )
+
+
+class BatchingPublisher(ThreadPoolPublisher):
+    """
+    Publisher that coalesces concurrent submissions into batches.
+
+    Submissions are collected for up to ``max_delay`` seconds or until
+    ``max_batch`` are waiting, then published together on one publisher
+    thread over a single producer (one channel), and each caller gets its
+    own task ID or exception. Under bursty load this trades a small bounded
+    delay for far fewer thread hand-offs and producer checkouts per message.
+    Each batch holds one slot of the thread pool backpressure.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        max_batch: int = 100,
+        max_delay: float = 0.002,
+        max_workers: int = 8,
+        max_pending: int = 1024,
+        acquire_timeout: float | None = None,
+        producer_pool: ProducerPool | None = None,
+    ) -> None:
+        """
+        Initialize the batching publisher.
+
+        Args:
+            celery_app: The Celery application used to publish tasks.
+            max_batch: Number of waiting submissions that triggers a publish.
+            max_delay: Maximum seconds a submission waits for others to join
+                      its batch.
+            max_workers: Number of publisher threads.
+            max_pending: Maximum number of queued or in-flight batches.
+            acquire_timeout: Seconds to wait for a free slot before raising
+                            :class:`PublisherBusyError`. ``None`` waits forever.
+            producer_pool: Optional ProducerPool to publish with.
+        """
+        super().__init__(
+            celery_app,
+            max_workers=max_workers,
+            max_pending=max_pending,
+            acquire_timeout=acquire_timeout,
+            producer_pool=producer_pool,
+        )
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches_sent = 0
+        self.messages_sent = 0
+        self._batch: list[tuple[TaskMessage, asyncio.Future[str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    async def send(self, task_name: str, **options: Any) -> str:
+        """Queue a task for the next batch and wait for its ID."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._batch.append(((task_name, options), future))
+        if len(self._batch) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Publish the waiting submissions as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._publish(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _publish(
+        self, batch: list[tuple[TaskMessage, asyncio.Future[str]]]
+    ) -> None:
+        messages = [message for message, _ in batch]
+        try:
+            results = await self.send_many(messages)
+        except Exception as exc:  # noqa: BLE001
+            results = [exc] * len(batch)
+        self.batches_sent += 1
+        self.messages_sent += len(batch)
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Publish waiting submissions, then stop the thread pool."""
+        if self._batch:
+            self._flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await super().close()
+
+
+PUBLISHERS: dict[str, type[TaskPublisher]] = {
+    "thread": ThreadPoolPublisher,
+    "inline": InlinePublisher,
+    "batch": BatchingPublisher,
+}
+
+
+def create_publisher(
+    celery_app: Celery, publisher: TaskPublisher | str = "thread"
+) -> TaskPublisher:
+    """
+    Resolve a publisher specification to a publisher instance.
+
+    Args:
+        celery_app: The Celery application used to publish tasks.
+        publisher: A :class:`TaskPublisher` instance, or the name of a
+                  built-in engine (``"thread"``, ``"inline"`` or ``"batch"``).
+
+    Returns:
+        The publisher instance.
+
+    Raises:
+        ValueError: If the publisher name is unknown.
+    """
+    if isinstance(publisher, TaskPublisher):
+        return publisher
+    try:
+        publisher_cls = PUBLISHERS[publisher]
+    except KeyError:
+        raise ValueError(
+            f"Unknown publisher '{publisher}'. "
+            f"Choose one of: {', '.join(sorted(PUBLISHERS))}"
+        )
+    return publisher_cls(celery_app)
@@ -0,0 +1,114 @@
+"""Shared helpers for coalesced and periodic refreshes of cached data."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class SingleFlight(Generic[_T]):
+    """
+    Coalesces concurrent calls for the same key into one running call.
+
+    The first caller of a key starts the call and later callers await the
+    same future until it completes, so any number of concurrent readers cost
+    one backend round-trip.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[_T]] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[_T]]) -> _T:
+        """Await the call running for ``key``, starting ``call()`` if there is none."""
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(call())
+            self._inflight[key] = inflight
+
+            def clear(_: Any) -> None:
+                if self._inflight.get(key) is inflight:
+                    del self._inflight[key]
+
+            inflight.add_done_callback(clear)
+        # Shielded so a cancelled request does not abort the shared call
+        return await asyncio.shield(inflight)
+
+    def clear(self) -> None:
+        """Forget the running calls; their callers still get their results."""
+        self._inflight.clear()
+
+
+class PeriodicRefresher:
+    """
+    Background task calling ``refresh`` every ``interval`` seconds.
+
+    The first refresh runs as soon as the task starts. Errors are ignored, so
+    a broker outage only leaves the cached data stale until the next round.
+    """
+
+    def __init__(self, refresh: Callable[[], Awaitable[Any]], interval: float) -> None:
+        self.refresh = refresh
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(Exception):
+                await self.refresh()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start the background task unless it is running."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it to finish."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+class LazyExecutor:
+    """Thread pool created on first use, so idle components start no threads."""
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get(self) -> ThreadPoolExecutor:
+        """Return the thread pool, creating it if needed."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking call on the thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.get(), functools.partial(func, *args))
+
+    def shutdown(self) -> None:
+        """Stop the thread pool without waiting for running calls."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,62 @@
+"""Fast JSON responses for data built by the bridge itself."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def require_orjson() -> None:
+    """
+    Check that orjson is available for fast responses.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+    if orjson is None:
+        raise ImportError(
+            "orjson is required for fast responses. "
+            "Install it with: pip install celery-fastapi[orjson]"
+        )
+
+
+def _default(obj: Any) -> Any:
+    """Encode the values orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        # Shallow: orjson encodes the field values, calling back for models
+        return dict(obj)
+    return jsonable_encoder(obj)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    Returned directly by an endpoint, it bypasses FastAPI's response model
+    validation and ``jsonable_encoder`` pass, so the bridge only uses it for
+    data it built itself. Models are encoded field by field without a
+    ``model_dump`` copy; values orjson does not support natively (decimals,
+    sets, custom classes, ...) fall back to ``jsonable_encoder``. Datetimes
+    are encoded as RFC 3339 with ``Z`` for UTC, as Pydantic does. Content
+    orjson cannot encode at all, such as integers wider than 64 bits, is
+    rendered by ``JSONResponse`` instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            data: bytes = orjson.dumps(
+                content,
+                default=_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(jsonable_encoder(content))
+        return data
@@ -0,0 +1,374 @@
+"""Non-blocking access to the Celery result backend."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from celery import Celery, states
+from celery.backends.base import KeyValueStoreBackend
+from celery.utils.iso8601 import parse_iso8601
+
+from celery_fastapi.refresh import LazyExecutor, SingleFlight
+
+if TYPE_CHECKING:
+    from celery_fastapi.metrics import BridgeMetrics
+    from celery_fastapi.tracing import BridgeTracer
+
+# Task meta as returned by ``Backend.get_task_meta``
+TaskMeta = dict[str, Any]
+
+
+def meta_date_done(meta: TaskMeta) -> datetime | None:
+    """Return the ``date_done`` of a task meta as a datetime."""
+    date_done = meta.get("date_done")
+    if date_done and not isinstance(date_done, datetime):
+        parsed: datetime = parse_iso8601(date_done)
+        return parsed
+    return date_done or None
+
+
+def meta_is_ready(meta: TaskMeta) -> bool:
+    """Return True if the task meta is in a ready (terminal) state."""
+    return meta.get("status") in states.READY_STATES
+
+
+# Layout of a successful meta as encoded by the JSON serializer of key-value
+# backends: the result is the second key, followed by keys Celery controls
+_RAW_SUCCESS_HEAD = b'{"status": "SUCCESS", "result": '
+_RAW_SUCCESS_TAIL = b', "traceback": null, "children": '
+# Marker of values kombu's JSON serializer encodes as typed objects
+_RAW_TYPE_MARKER = b'"__type__"'
+# Non-standard tokens Python's JSON encoder writes for non-finite floats
+_RAW_NON_FINITE = (b"NaN", b"Infinity")
+
+
+def split_raw_meta(value: bytes) -> tuple[TaskMeta, bytes] | None:
+    """
+    Split an encoded successful task meta into its meta and raw result JSON.
+
+    Only the small part after the result is decoded. The result is returned
+    as the stored JSON bytes, which serialize the same way as the decoded
+    result would unless it holds values kombu encodes as typed objects
+    (datetimes, UUIDs, decimals, ...) or non-finite floats, which the stored
+    JSON holds as the invalid ``NaN`` and ``Infinity`` tokens. The checks
+    look for these markers anywhere in the result, strings included, so a
+    few plain results are decoded needlessly, but none is served invalid.
+
+    Returns:
+        The meta without its ``result`` and the result JSON, or None if the
+        value is not a successful meta in the expected layout or its result
+        is not plain, strict JSON.
+    """
+    if not value.startswith(_RAW_SUCCESS_HEAD):
+        return None
+    end = value.rfind(_RAW_SUCCESS_TAIL)
+    if end < 0:
+        return None
+    body = value[len(_RAW_SUCCESS_HEAD) : end]
+    if _RAW_TYPE_MARKER in body or any(token in body for token in _RAW_NON_FINITE):
+        return None
+    try:
+        meta: TaskMeta = json.loads(b"{" + value[end + 2 :])
+    except ValueError:
+        return None
+    meta["status"] = states.SUCCESS
+    return meta, body
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of the meta of tasks in a terminal state.
+
+    Once a task is ``SUCCESS``, ``FAILURE`` or ``REVOKED`` its meta never
+    changes, so it can be served without another backend read. The cache
+    holds at most ``max_entries`` metas and about ``max_bytes`` of them,
+    evicting the least recently used first. Sizes are estimated from the
+    ``repr`` of each meta once, when it is stored; a meta larger than
+    ``max_bytes`` on its own is never cached.
+
+    Cached metas are shared by every caller and must not be modified.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached metas. 0 disables the cache.
+            max_bytes: Approximate upper bound of the total size of the metas.
+            ttl: Seconds a meta stays cached, e.g. the backend's
+                ``result_expires`` so forgotten results do not outlive it.
+                Metas are kept until evicted if omitted.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[TaskMeta, int, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, task_id: str) -> TaskMeta | None:
+        """Return the cached meta of a task, counting a hit or a miss."""
+        entry = self._entries.get(task_id)
+        if entry is not None:
+            meta, _, expires = entry
+            if self.ttl is None or time.monotonic() < expires:
+                self._entries.move_to_end(task_id)
+                self.hits += 1
+                return meta
+            self._remove(task_id)
+        self.misses += 1
+        return None
+
+    def put(self, task_id: str, meta: TaskMeta) -> None:
+        """Cache the meta of a task if it is in a terminal state and fits."""
+        if not self.max_entries or not meta_is_ready(meta):
+            return
+        size = len(repr(meta))
+        if size > self.max_bytes:
+            return
+        self._remove(task_id)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[task_id] = (meta, size, expires)
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, task_id: str) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every cached meta."""
+        self._entries.clear()
+        self.size = 0
+
+
+class ResultFetcher:
+    """
+    Reads task meta from the result backend without blocking the event loop.
+
+    Each lookup fetches the backend meta exactly once on a dedicated thread
+    pool and returns the raw meta dict, so callers can read state, result,
+    traceback and ``date_done`` without triggering further backend calls
+    (as the lazy ``AsyncResult`` properties do). Waiting for a result is left
+    to the TaskWatcher, which polls every watched task through this fetcher
+    in one loop.
+
+    Metas in a terminal state are served from a ResultCache, and concurrent
+    lookups of the same task share one backend read, so any number of
+    clients polling a task cost one read per round.
+    """
+
+    def __init__(
+        self,
+        celery_app: Celery,
+        *,
+        max_workers: int = 8,
+        cache: ResultCache | None = None,
+    ) -> None:
+        """
+        Initialize the result fetcher.
+
+        Args:
+            celery_app: The Celery application whose backend is queried.
+            max_workers: Number of threads used for backend reads.
+            cache: ResultCache of terminal metas. A default one is created
+                  if omitted; pass ``ResultCache(max_entries=0)`` to read
+                  every lookup from the backend.
+        """
+        self.celery_app = celery_app
+        self.max_workers = max_workers
+        self.metrics: BridgeMetrics | None = None
+        self.tracer: BridgeTracer | None = None
+        self.cache = cache if cache is not None else ResultCache()
+        self.coalesced = 0
+        self._flight: SingleFlight[TaskMeta] = SingleFlight()
+        self._executor = LazyExecutor(max_workers, "celery-fastapi-results")
+
+    async def run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking backend call on the fetcher thread pool."""
+        if self.metrics is None and self.tracer is None:
+            return await self._executor.run(func, *args)
+
+        operation = getattr(func, "__name__", "call").lstrip("_")
+        span = (
+            self.tracer.backend_span(operation)
+            if self.tracer is not None
+            else contextlib.nullcontext()
+        )
+        started = time.perf_counter()
+        with span:
+            try:
+                return await self._executor.run(func, *args)
+            finally:
+                if self.metrics is not None:
+                    self.metrics.observe_backend(operation, started)
+
+    async def get_meta(self, task_id: str) -> TaskMeta:
+        """
+        Fetch the meta of a task with a single backend round-trip.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            The task meta dict (``status``, ``result``, ``traceback``, ...).
+        """
+        meta = self.cache.get(task_id)
+        if meta is not None:
+            self._count("hit")
+            return meta
+
+        if task_id in self._flight:
+            self.coalesced += 1
+            self._count("coalesced")
+        else:
+            self._count("miss")
+        return await self._flight.run(task_id, lambda: self._fetch_meta(task_id))
+
+    async def _fetch_meta(self, task_id: str) -> TaskMeta:
+        meta: TaskMeta = await self.run(self.celery_app.backend.get_task_meta, task_id)
+        self.cache.put(task_id, meta)
+        return meta
+
+    def _count(self, outcome: str, amount: int = 1) -> None:
+        if self.metrics is not None and amount:
+            self.metrics.count_result_lookup(outcome, amount)
+
+    async def get_raw_result(
+        self, task_id: str, min_size: int = 0
+    ) -> tuple[TaskMeta, bytes | None]:
+        """
+        Fetch the meta of a task, keeping a large result as stored JSON bytes.
+
+        On key-value backends using the JSON serializer, without result
+        compression or extended results, a successful result of at least
+        ``min_size`` bytes is not decoded: it is returned as the JSON stored
+        in the backend, ready to be sent as is. Any other meta is decoded as
+        by :meth:`get_meta`, with the same single backend read.
+
+        Args:
+            task_id: The task ID.
+            min_size: Smallest stored meta, in bytes, whose result is kept raw.
+
+        Returns:
+            ``(meta, None)`` with a decoded meta, or ``(meta, result_json)``
+            where the meta has no ``result``.
+        """
+        backend = self.celery_app.backend
+        conf = self.celery_app.conf
+        if (
+            not isinstance(backend, KeyValueStoreBackend)
+            or backend.serializer != "json"
+            or conf.result_compression
+            or conf.result_extended
+        ):
+            return await self.get_meta(task_id), None
+        meta = self.cache.get(task_id)
+        if meta is not None:
+            self._count("hit")
+            return meta, None
+        self._count("miss")
+        meta, body = await self.run(self._get_raw_meta, task_id, min_size)
+        if body is None:
+            self.cache.put(task_id, meta)
+        return meta, body
+
+    def _get_raw_meta(
+        self, task_id: str, min_size: int
+    ) -> tuple[TaskMeta, bytes | None]:
+        """Read a task meta, splitting off the result JSON if it is large."""
+        backend = self.celery_app.backend
+        value = backend.get(backend.get_key_for_task(task_id))
+        if not value:
+            return {"status": states.PENDING, "result": None}, None
+        if isinstance(value, str):
+            value = value.encode()
+        if len(value) >= min_size:
+            split = split_raw_meta(value)
+            if split is not None:
+                return split
+        meta: TaskMeta = backend.decode_result(value)
+        return meta, None
+
+    async def get_many_meta(self, task_ids: list[str]) -> dict[str, TaskMeta]:
+        """
+        Fetch the meta of many tasks at once.
+
+        Key-value backends (Redis, memcached, ...) are queried with a single
+        ``mget`` round-trip; other backends are queried in parallel.
+
+        Args:
+            task_ids: The task IDs.
+
+        Returns:
+            Mapping of task ID to task meta. Unknown tasks are ``PENDING``.
+        """
+        if not task_ids:
+            return {}
+        if not isinstance(self.celery_app.backend, KeyValueStoreBackend):
+            fetched = await asyncio.gather(*(self.get_meta(t) for t in task_ids))
+            return dict(zip(task_ids, fetched, strict=True))
+
+        metas: dict[str, TaskMeta] = {}
+        missing: list[str] = []
+        for task_id in task_ids:
+            meta = self.cache.get(task_id)
+            if meta is not None:
+                metas[task_id] = meta
+            else:
+                missing.append(task_id)
+        self._count("hit", len(metas))
+        self._count("miss", len(missing))
+        if missing:
+            fetched_metas: dict[str, TaskMeta] = await self.run(
+                self._mget_metas, missing
+            )
+            for task_id, meta in fetched_metas.items():
+                self.cache.put(task_id, meta)
+            metas.update(fetched_metas)
+        return {task_id: metas[task_id] for task_id in task_ids}
+
+    def _mget_metas(self, task_ids: list[str]) -> dict[str, TaskMeta]:
+        """Fetch and decode many task metas with one ``mget`` call."""
+        backend = self.celery_app.backend
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        values = backend.mget(keys)
+        if hasattr(values, "items"):
+            # Some clients return a mapping of key to value
+            values = [values.get(key) for key in keys]
+
+        metas: dict[str, TaskMeta] = {}
+        for task_id, value in zip(task_ids, values, strict=True):
+            if value:
+                metas[task_id] = backend.decode_result(value)
+            else:
+                metas[task_id] = {"status": states.PENDING, "result": None}
+        return metas
+
+    async def start(self) -> None:
+        """Create the thread pool ahead of the first request."""
+        self._executor.get()
+
+    async def close(self) -> None:
+        """Stop the thread pool."""
+        self._flight.clear()
+        self._executor.shutdown()
@@ -0,0 +1,179 @@
+"""On-disk cache of the generated OpenAPI document."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import fastapi
+import pydantic
+from celery import Celery
+from fastapi import FastAPI
+
+
+def _module_mtime(obj: Any) -> int | None:
+    """Return the modification time of the source file defining ``obj``."""
+    module = sys.modules.get(getattr(obj, "__module__", None) or "")
+    filename = getattr(module, "__file__", None)
+    if not filename:
+        return None
+    try:
+        return os.stat(filename).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _signature(func: Any) -> str:
+    try:
+        return str(inspect.signature(func))
+    except (TypeError, ValueError):
+        return ""
+
+
+def registry_fingerprint(
+    fastapi_app: FastAPI,
+    celery_app: Celery,
+    task_names: Iterable[str],
+) -> str:
+    """
+    Fingerprint everything the OpenAPI document of a bridged app depends on.
+
+    Covers the library versions, the FastAPI app metadata, every route
+    (path, methods, endpoint) and every exposed task (name, queue,
+    signature), plus the modification time of each module defining an
+    endpoint or a task, so any code change invalidates the fingerprint.
+
+    Returns:
+        A hex digest.
+    """
+    from celery_fastapi import __version__
+
+    digest = hashlib.sha256()
+
+    def update(*parts: Any) -> None:
+        digest.update(repr(parts).encode())
+        digest.update(b"\0")
+
+    update(__version__, fastapi.__version__, pydantic.VERSION)
+    update(
+        fastapi_app.title,
+        fastapi_app.version,
+        fastapi_app.openapi_version,
+        fastapi_app.description,
+        fastapi_app.servers,
+        fastapi_app.root_path,
+    )
+
+    modules: dict[str, int | None] = {}
+    for route in fastapi_app.routes:
+        endpoint = getattr(route, "endpoint", None)
+        update(
+            getattr(route, "path", None),
+            sorted(getattr(route, "methods", None) or ()),
+            getattr(endpoint, "__module__", None),
+            getattr(endpoint, "__qualname__", None),
+            getattr(route, "include_in_schema", None),
+        )
+        if endpoint is not None:
+            modules.setdefault(endpoint.__module__, _module_mtime(endpoint))
+
+    default_queue = celery_app.conf.task_default_queue or "celery"
+    for name in sorted(task_names):
+        task = celery_app.tasks.get(name)
+        run = getattr(task, "run", None)
+        update(name, getattr(task, "queue", None) or default_queue, _signature(run))
+        if run is not None:
+            modules.setdefault(run.__module__, _module_mtime(run))
+
+    update(sorted(modules.items()))
+    return digest.hexdigest()
+
+
+class SchemaCache:
+    """
+    Persists generated OpenAPI documents on disk, keyed by a fingerprint.
+
+    Generating the OpenAPI document of an app with many task endpoints is
+    expensive and is otherwise repeated by every worker process on its first
+    ``/docs`` request. With a shared cache directory, only the first process
+    after a code change generates it; the others read it from disk.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """
+        Initialize the schema cache.
+
+        Args:
+            directory: Directory holding the cached documents. Created on
+                      first write.
+        """
+        self.directory = Path(directory)
+
+    def path_for(self, fingerprint: str) -> Path:
+        """Return the file caching the document of a fingerprint."""
+        return self.directory / f"openapi-{fingerprint}.json"
+
+    def load(self, fingerprint: str) -> dict[str, Any] | None:
+        """Return the cached document of a fingerprint, if readable."""
+        try:
+            with self.path_for(fingerprint).open("rb") as fp:
+                document = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return document if isinstance(document, dict) else None
+
+    def store(self, fingerprint: str, document: dict[str, Any]) -> None:
+        """
+        Write the document of a fingerprint.
+
+        The file is written atomically, so concurrent workers never read a
+        partial document. Write errors are ignored: the cache is best-effort.
+        """
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as fp:
+                    json.dump(document, fp, separators=(",", ":"))
+                os.replace(tmp_path, self.path_for(fingerprint))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
+
+    def install(self, fastapi_app: FastAPI, fingerprint: Callable[[], str]) -> None:
+        """
+        Serve the OpenAPI document of an app through the cache.
+
+        Args:
+            fastapi_app: The application whose ``openapi`` method is wrapped.
+            fingerprint: Returns the current fingerprint of the application.
+                        Only called again when the routes change.
+        """
+        generate = fastapi_app.openapi
+        seen_routes: tuple[int, ...] | None = None
+
+        def openapi() -> dict[str, Any]:
+            nonlocal seen_routes
+            routes = tuple(map(id, fastapi_app.routes))
+            document = fastapi_app.openapi_schema
+            if document is None or routes != seen_routes:
+                key = fingerprint()
+                document = self.load(key)
+                if document is None:
+                    fastapi_app.openapi_schema = None
+                    document = generate()
+                    self.store(key, document)
+                fastapi_app.openapi_schema = document
+                seen_routes = routes
+            return document
+
+        fastapi_app.openapi = openapi  # type: ignore[method-assign]
@@ -2,11 +2,112 @@
 
 from __future__ import annotations
 
+import contextlib
+import gc
+import logging
+import os
+import signal
+import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import socket
+
     from gunicorn.app.base import BaseApplication
 
+logger = logging.getLogger("uvicorn.error")
+
+# A worker dying within this many seconds of being forked failed to boot
+BOOT_WINDOW = 5.0
+
+# Delay before replacing a worker after its first boot failure, doubled on
+# each consecutive one up to the maximum
+RESTART_BACKOFF = 0.5
+MAX_RESTART_BACKOFF = 30.0
+
+# Exit status of the pre-fork server when workers keep failing to boot,
+# as uvicorn exits on a startup failure
+STARTUP_FAILURE = 3
+
+
+def process_memory() -> dict[str, int]:
+    """
+    Return the memory usage of the current process in bytes.
+
+    Returns:
+        ``rss`` (resident set size) and, where the kernel reports it,
+        ``private`` (pages not shared with other processes, i.e. not shared
+        copy-on-write with the parent). Empty if unavailable.
+    """
+    fields = {"Rss": "rss", "Private_Clean": "private", "Private_Dirty": "private"}
+    memory: dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup") as fp:
+            for line in fp:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    key = fields[name]
+                    memory[key] = memory.get(key, 0) + int(value.split()[0]) * 1024
+    except (OSError, ValueError):
+        try:
+            import resource
+        except ImportError:
+            return {}
+        # Peak RSS: kilobytes on Linux, bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        memory = {"rss": maxrss if os.uname().sysname == "Darwin" else maxrss * 1024}
+    return memory
+
+
+def worker_report(started: float) -> str:
+    """Describe the startup time and memory of a worker process."""
+    elapsed = (time.perf_counter() - started) * 1000
+    report = f"Worker {os.getpid()} ready in {elapsed:.1f} ms"
+    memory = process_memory()
+    if "rss" in memory:
+        report += f", RSS {memory['rss'] / 2**20:.1f} MiB"
+    if "private" in memory:
+        report += f" ({memory['private'] / 2**20:.1f} MiB private)"
+    return report
+
+
+def freeze_for_fork() -> None:
+    """
+    Prepare the current process to fork workers sharing its memory.
+
+    Objects allocated so far (the Celery app, the bridge, all routes and
+    payload models) are moved to the permanent GC generation, so collections
+    in the workers never touch them and their pages stay shared
+    copy-on-write with the parent.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def prefork_hooks() -> dict[str, Callable[..., None]]:
+    """
+    Return gunicorn server hooks for pre-fork serving.
+
+    The master freezes its heap before forking workers, and each worker logs
+    its startup time and memory once initialized.
+    """
+
+    def when_ready(server: Any) -> None:  # noqa: ARG001
+        freeze_for_fork()
+
+    def post_fork(server: Any, worker: Any) -> None:  # noqa: ARG001
+        worker.forked_at = time.perf_counter()
+
+    def post_worker_init(worker: Any) -> None:
+        worker.log.info(worker_report(worker.forked_at))
+
+    return {
+        "when_ready": when_ready,
+        "post_fork": post_fork,
+        "post_worker_init": post_worker_init,
+    }
+
 
 def create_gunicorn_app(
     app: Any, options: dict[str, Any] | None = None
@@ -96,3 +197,166 @@ class GunicornApplication:
         """
         gunicorn_app = create_gunicorn_app(self.application, self.options)
         gunicorn_app.run()
+
+
+class PreforkServer:
+    """Serves a prebuilt ASGI app from forked uvicorn worker processes.
+
+    Unlike ``uvicorn.run(..., workers=N)``, which spawns fresh interpreters
+    that import and build the app again, the app is built once in the parent.
+    The parent binds the socket, freezes its heap and forks the workers,
+    which share the app's memory copy-on-write. Workers that die are
+    replaced; SIGINT and SIGTERM are forwarded to all workers.
+
+    A worker that dies during startup is replaced after an exponential
+    backoff, and the server shuts down once workers failed to boot
+    ``max_boot_failures`` times in a row, instead of forking in a tight loop.
+
+    Example:
+        >>> from celery_fastapi.server import PreforkServer
+        >>> app = create_my_fastapi_app()
+        >>> PreforkServer(app, workers=4, host="0.0.0.0", port=8000).run()
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        workers: int,
+        *,
+        max_boot_failures: int = 5,
+        **options: Any,
+    ) -> None:
+        """Initialize the pre-fork server.
+
+        Args:
+            app: The ASGI application to serve.
+            workers: Number of worker processes.
+            max_boot_failures: Number of consecutive worker deaths during
+                              startup after which the server shuts down.
+            **options: uvicorn configuration options (host, port, log_level, ...).
+        """
+        self.application = app
+        self.workers = workers
+        self.max_boot_failures = max_boot_failures
+        self.options = options
+        # Worker PID -> time.monotonic() at which it was forked
+        self._children: dict[int, float] = {}
+        self._boot_failures = 0
+        self._should_exit = False
+
+    def run(self) -> None:
+        """Run the server until interrupted.
+
+        Raises:
+            ImportError: If uvicorn is not installed.
+            SystemExit: If workers keep failing to boot.
+        """
+        try:
+            import uvicorn
+        except ImportError as exc:
+            raise ImportError(
+                "uvicorn is not installed. "
+                "Install with: pip install celery-fastapi[server]"
+            ) from exc
+
+        config = uvicorn.Config(self.application, **self.options)
+        config.load()
+        sock = config.bind_socket()
+        freeze_for_fork()
+
+        signal.signal(signal.SIGINT, self._handle_exit)
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        try:
+            for _ in range(self.workers):
+                self._spawn(config, sock)
+            while self._children:
+                try:
+                    pid, _ = os.wait()
+                except ChildProcessError:
+                    break
+                if pid not in self._children:
+                    continue
+                delay = self._restart_delay(pid)
+                if self._should_exit:
+                    continue
+                if self._boot_failures >= self.max_boot_failures:
+                    logger.error(
+                        "Workers failed to start %d times in a row, shutting down",
+                        self._boot_failures,
+                    )
+                    self._handle_exit(signal.SIGTERM, None)
+                    continue
+                if delay:
+                    logger.warning(
+                        "Worker %d died during startup, starting a new one in %.1f s",
+                        pid,
+                        delay,
+                    )
+                    self._sleep(delay)
+                else:
+                    logger.warning("Worker %d died, starting a new one", pid)
+                if not self._should_exit:
+                    self._spawn(config, sock)
+        finally:
+            sock.close()
+        if self._boot_failures >= self.max_boot_failures:
+            raise SystemExit(STARTUP_FAILURE)
+
+    def _restart_delay(self, pid: int) -> float:
+        """Forget a dead worker and return the delay before replacing it."""
+        lifetime = time.monotonic() - self._children.pop(pid)
+        if lifetime >= BOOT_WINDOW:
+            self._boot_failures = 0
+            return 0.0
+        self._boot_failures += 1
+        return min(
+            RESTART_BACKOFF * 2.0 ** (self._boot_failures - 1), MAX_RESTART_BACKOFF
+        )
+
+    def _sleep(self, delay: float) -> None:
+        """Sleep for ``delay`` seconds, waking up early on shutdown."""
+        deadline = time.monotonic() + delay
+        while not self._should_exit and (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(remaining, 0.1))
+
+    def _handle_exit(self, signum: int, frame: Any) -> None:  # noqa: ARG002
+        self._should_exit = True
+        for pid in self._children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def _spawn(self, config: Any, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = time.monotonic()
+            return
+
+        # Worker process: never returns into the parent's control flow
+        started = time.perf_counter()
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            _create_worker_server(config, started).run(sockets=[sock])
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        except BaseException:
+            logger.exception("Worker %d crashed", os.getpid())
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+
+def _create_worker_server(config: Any, started: float) -> Any:
+    """Create a uvicorn server that reports its startup once serving."""
+    import uvicorn
+
+    class _WorkerServer(uvicorn.Server):
+        """uvicorn server logging the worker startup time and memory."""
+
+        async def startup(self, sockets: list[socket.socket] | None = None) -> None:
+            await super().startup(sockets)
+            if self.started:
+                logger.info(worker_report(started))
+
+    return _WorkerServer(config)
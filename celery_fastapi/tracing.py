@@ -0,0 +1,108 @@
+"""OpenTelemetry tracing of task submissions and result backend reads."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Attributes following the OpenTelemetry messaging semantic conventions
+MESSAGING_SYSTEM = "celery"
+
+
+class BridgeTracer:
+    """
+    Opens OpenTelemetry spans around the hot paths of a bridge.
+
+    Spans cover request body parsing, payload validation and task message
+    building, broker publishes and result backend reads. The trace context of
+    each publish span is injected into the task ``headers``, so spans opened
+    by an instrumented worker (``opentelemetry-instrumentation-celery``) join
+    the trace of the HTTP request that submitted the task.
+
+    Sampling is left to the tracer provider: with a ratio-based sampler,
+    unsampled requests only create non-recording spans, and attributes are
+    only computed for recording ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        tracer_provider: Any = None,
+        propagate: bool = True,
+    ) -> None:
+        """
+        Initialize the bridge tracer.
+
+        Args:
+            tracer_provider: OpenTelemetry TracerProvider. The global one is
+                            used if omitted.
+            propagate: Whether to inject the trace context into task headers.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import propagate as otel_propagate
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "opentelemetry-api is required for tracing. "
+                "Install it with: pip install celery-fastapi[opentelemetry]"
+            ) from exc
+
+        from celery_fastapi import __version__
+
+        self.tracer = trace.get_tracer(
+            "celery_fastapi", __version__, tracer_provider=tracer_provider
+        )
+        self.propagate = propagate
+        self._inject = otel_propagate.inject
+        self._producer_kind = trace.SpanKind.PRODUCER
+        self._client_kind = trace.SpanKind.CLIENT
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """Open an internal span, recording exceptions raised inside it."""
+        with self.tracer.start_as_current_span(name) as span:
+            if attributes and span.is_recording():
+                span.set_attributes(attributes)
+            yield span
+
+    @contextmanager
+    def publish_span(
+        self, task_name: str, queue: str | None, batch_size: int | None = None
+    ) -> Iterator[Any]:
+        """Open a producer span around publishing one task or a batch."""
+        name = f"publish {task_name}" if batch_size is None else "publish batch"
+        with self.tracer.start_as_current_span(name, kind=self._producer_kind) as span:
+            if span.is_recording():
+                span.set_attribute("messaging.system", MESSAGING_SYSTEM)
+                span.set_attribute("messaging.operation.type", "publish")
+                if batch_size is None:
+                    span.set_attribute("celery.task_name", task_name)
+                else:
+                    span.set_attribute("messaging.batch.message_count", batch_size)
+                if queue:
+                    span.set_attribute("messaging.destination.name", queue)
+            yield span
+
+    @contextmanager
+    def backend_span(self, operation: str) -> Iterator[Any]:
+        """Open a client span around a result backend read."""
+        with self.tracer.start_as_current_span(
+            f"backend {operation}", kind=self._client_kind
+        ) as span:
+            yield span
+
+    def inject(self, send_options: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return ``send_options`` with the current trace context in its headers.
+
+        The options and any existing headers are copied, not modified.
+        """
+        if not self.propagate:
+            return send_options
+        headers = dict(send_options.get("headers") or {})
+        self._inject(headers)
+        return {**send_options, "headers": headers}
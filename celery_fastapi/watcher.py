@@ -0,0 +1,212 @@
+"""Shared watching of task state changes for Celery FastAPI."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any
+
+from celery_fastapi.results import ResultFetcher, TaskMeta, meta_is_ready
+
+
+def _meta_key(meta: TaskMeta) -> tuple[Any, ...]:
+    """Return the parts of a task meta whose change is worth reporting."""
+    return meta.get("status"), meta.get("result"), meta.get("date_done")
+
+
+class Subscription:
+    """A subscriber's view of the state changes of one task."""
+
+    def __init__(self, watcher: TaskWatcher, task_id: str) -> None:
+        self.watcher = watcher
+        self.task_id = task_id
+        self._queue: asyncio.Queue[TaskMeta] = asyncio.Queue(maxsize=16)
+
+    def push(self, meta: TaskMeta) -> None:
+        """Deliver a meta update, dropping the oldest one if the queue is full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(meta)
+
+    async def get(self, timeout: float | None = None) -> TaskMeta | None:
+        """
+        Wait for the next state change.
+
+        Args:
+            timeout: Seconds to wait. ``None`` waits forever.
+
+        Returns:
+            The new task meta, or None if the timeout expired first.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving updates."""
+        self.watcher.unsubscribe(self)
+
+
+class TaskWatcher:
+    """
+    Multiplexes state-change subscriptions over one backend polling loop.
+
+    However many clients watch however many tasks, a single background
+    coroutine fetches the meta of all watched tasks with one
+    ``ResultFetcher.get_many_meta`` call per interval (a single ``mget`` on
+    key-value backends) and pushes changes to every subscriber of the task.
+    Tasks are dropped from the watch list once they reach a terminal state
+    or lose their last subscriber, and the loop exits when nothing is watched.
+    """
+
+    def __init__(
+        self,
+        fetcher: ResultFetcher,
+        *,
+        interval: float = 0.5,
+        max_subscriptions: int = 10000,
+    ) -> None:
+        """
+        Initialize the task watcher.
+
+        Args:
+            fetcher: ResultFetcher used to read task meta.
+            interval: Seconds between backend checks.
+            max_subscriptions: Maximum number of concurrent subscriptions.
+        """
+        self.fetcher = fetcher
+        self.interval = interval
+        self.max_subscriptions = max_subscriptions
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._last: dict[str, TaskMeta] = {}
+        self._count = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of active subscriptions."""
+        return self._count
+
+    @property
+    def watched_task_count(self) -> int:
+        """Number of distinct tasks being watched."""
+        return len(self._subscribers)
+
+    def subscribe(self, task_id: str) -> Subscription:
+        """
+        Subscribe to the state changes of a task.
+
+        The current state is delivered as the first update.
+
+        Raises:
+            OverflowError: If ``max_subscriptions`` is reached.
+        """
+        if self._count >= self.max_subscriptions:
+            raise OverflowError(
+                f"Too many task subscriptions ({self.max_subscriptions})"
+            )
+        subscription = Subscription(self, task_id)
+        self._subscribers.setdefault(task_id, set()).add(subscription)
+        self._count += 1
+        last = self._last.get(task_id)
+        if last is not None:
+            subscription.push(last)
+        self._ensure_running(wake=last is None)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription. Unknown subscriptions are ignored."""
+        subscribers = self._subscribers.get(subscription.task_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        self._count -= 1
+        if not subscribers:
+            del self._subscribers[subscription.task_id]
+            self._last.pop(subscription.task_id, None)
+
+    async def wait(self, task_id: str, timeout: float) -> TaskMeta | None:
+        """
+        Wait for a task to reach a terminal state.
+
+        Waiters share the polling loop with all other subscriptions, so any
+        number of concurrent long-polls costs one backend read per interval.
+
+        Args:
+            task_id: The task ID.
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            The last meta received, which is not ready if the wait timed out,
+            or None if no meta was received at all.
+
+        Raises:
+            OverflowError: If ``max_subscriptions`` is reached.
+        """
+        subscription = self.subscribe(task_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        last: TaskMeta | None = None
+        try:
+            while (remaining := deadline - loop.time()) > 0:
+                meta = await subscription.get(remaining)
+                if meta is None:
+                    break
+                last = meta
+                if meta_is_ready(meta):
+                    break
+        finally:
+            subscription.close()
+        return last
+
+    def _ensure_running(self, wake: bool) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run(self._wakeup))
+        elif wake and self._wakeup is not None:
+            # Poll now rather than at the next interval
+            self._wakeup.set()
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while self._subscribers:
+            wakeup.clear()
+            task_ids = list(self._subscribers)
+            try:
+                metas = await self.fetcher.get_many_meta(task_ids)
+            except Exception:  # noqa: BLE001
+                metas = {}
+            for task_id, meta in metas.items():
+                self._dispatch(task_id, meta)
+            if not self._subscribers:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), self.interval)
+
+    def _dispatch(self, task_id: str, meta: TaskMeta) -> None:
+        subscribers = self._subscribers.get(task_id)
+        if not subscribers:
+            return
+        last = self._last.get(task_id)
+        if last is not None and _meta_key(last) == _meta_key(meta):
+            return
+        self._last[task_id] = meta
+        for subscription in subscribers:
+            subscription.push(meta)
+        if meta_is_ready(meta):
+            # Terminal: subscribers are done once they read this update
+            for subscription in list(subscribers):
+                self.unsubscribe(subscription)
+
+    async def close(self) -> None:
+        """Stop the polling loop and drop all subscriptions."""
+        task, self._task = self._task, None
+        self._subscribers.clear()
+        self._last.clear()
+        self._count = 0
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
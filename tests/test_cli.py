@@ -28,6 +28,12 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Start the FastAPI server" in result.stdout
 
+    def test_serve_prefork_option(self) -> None:
+        """Test that both serve commands offer pre-fork mode."""
+        for command in ("serve", "serve-gunicorn"):
+            result = runner.invoke(app, [command, "--help"])
+            assert "--prefork" in result.stdout
+
     def test_routes_help(self) -> None:
         """Test routes --help command."""
         result = runner.invoke(app, ["routes", "--help"])
@@ -1,11 +1,18 @@
 """Tests for the core CeleryFastAPIBridge class."""
 
+import json
+
 from celery import Celery
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from celery_fastapi import CeleryFastAPIBridge
-from celery_fastapi.core import GenericTaskPayload
+from celery_fastapi.core import (
+    GenericTaskPayload,
+    PayloadPlan,
+    _create_task_payload_model,
+    _generic_send_options,
+)
 
 
 class TestCeleryFastAPIBridge:
@@ -115,6 +122,46 @@ class TestGenericTaskPayload:
         assert payload.kwargs == {"key": "value"}
 
 
+class TestPayloadPlan:
+    """Tests for precompiled payload plans."""
+
+    def test_task_payload_split(self, celery_app: Celery) -> None:
+        """Test that task arguments and Celery options are split once."""
+        model = _create_task_payload_model(
+            "test_app.add", celery_app.tasks["test_app.add"].run, "celery"
+        )
+        plan = PayloadPlan(model)
+        assert plan.kwarg_fields == ("x", "y")
+        assert "queue" not in plan.option_fields
+
+        payload = model(x=1, y=2, countdown=5, priority=3)
+        assert plan.send_options(payload, "high") == {
+            "args": [],
+            "kwargs": {"x": 1, "y": 2},
+            "queue": "high",
+            "countdown": 5,
+            "priority": 3,
+        }
+
+    def test_generic_send_options(self) -> None:
+        """Test that generic payloads keep their args, kwargs and set options."""
+        payload = GenericTaskPayload(
+            task_name="test.task",
+            queue="celery",
+            args=[1],
+            kwargs={"key": "value"},
+            routing_key="rk",
+            ignore_result=False,
+        )
+        assert _generic_send_options(payload) == {
+            "args": [1],
+            "kwargs": {"key": "value"},
+            "queue": "celery",
+            "routing_key": "rk",
+            "ignore_result": False,
+        }
+
+
 class TestTaskEndpoints:
     """Tests for task execution endpoints."""
 
@@ -165,3 +212,267 @@ class TestStatusEndpoints:
         assert "scheduled" in data
         assert "reserved" in data
         assert "revoked" in data
+
+
+class TestBatchEndpoints:
+    """Tests for batch submission endpoints."""
+
+    def test_task_batch(self, client: TestClient) -> None:
+        """Test submitting several tasks in one request."""
+        response = client.post(
+            "/test_app/add/batch",
+            json=[{"x": 1, "y": 2}, {"x": 3, "y": 4}],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["submitted"] == 2
+        assert data["failed"] == 0
+        assert [item["index"] for item in data["items"]] == [0, 1]
+        assert all(item["task_id"] for item in data["items"])
+
+    def test_task_batch_partial_failure(self, client: TestClient) -> None:
+        """Test that invalid items are reported without rejecting the batch."""
+        response = client.post(
+            "/test_app/add/batch",
+            json=[{"x": 1, "y": 2}, {"x": 1}],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["submitted"] == 1
+        assert data["failed"] == 1
+        assert data["items"][1]["status"] == "ERROR"
+        assert data["items"][1]["error"][0]["loc"] == ["y"]
+
+    def test_trigger_batch(self, client: TestClient) -> None:
+        """Test the generic batch trigger endpoint."""
+        response = client.post(
+            "/trigger/batch",
+            json=[
+                {"task_name": "test_app.add", "queue": "celery", "args": [1, 2]},
+                {"task_name": "test_app.add"},
+            ],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["submitted"] == 1
+        assert data["items"][0]["status"] == "PENDING"
+        assert data["items"][1]["status"] == "ERROR"
+
+    def test_batch_size_limit(self, celery_app: Celery) -> None:
+        """Test that oversized batches are rejected with 413."""
+        bridge = CeleryFastAPIBridge(celery_app, max_batch_size=1)
+        client = TestClient(bridge.register_routes())
+        response = client.post("/test_app/add/batch", json=[{"x": 1, "y": 2}] * 2)
+        assert response.status_code == 413
+
+    def test_batch_endpoints_excluded(self, celery_app: Celery) -> None:
+        """Test that batch endpoints can be disabled."""
+        bridge = CeleryFastAPIBridge(celery_app, include_batch_endpoints=False)
+        routes = [route.path for route in bridge.register_routes().routes]
+        assert "/test_app/add/batch" not in routes
+        assert "/trigger/batch" not in routes
+
+
+class TestStreamEndpoints:
+    """Tests for NDJSON streaming ingestion endpoints."""
+
+    def test_task_stream(self, client: TestClient) -> None:
+        """Test that each NDJSON line is validated and published."""
+
+        def body():  # type: ignore[no-untyped-def]
+            yield b'{"x": 1, "y": 2}\n{"x": 3,'
+            yield b' "y": 4}\n\n{"x": 5}\nnot json\n'
+
+        response = client.post(
+            "/test_app/add/stream",
+            content=body(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        by_line = {line["line"]: line for line in lines}
+        assert set(by_line) == {1, 2, 4, 5}
+        assert by_line[1]["task_id"]
+        assert by_line[2]["task_id"]
+        assert by_line[4]["error"][0]["loc"] == ["y"]
+        assert "error" in by_line[5]
+
+    def test_oversized_lines_rejected(self, celery_app: Celery) -> None:
+        """Test that lines over max_line_size are answered with an error."""
+        bridge = CeleryFastAPIBridge(celery_app, max_line_size=64)
+        client = TestClient(bridge.register_routes())
+        padding = " " * 100
+
+        def body():  # type: ignore[no-untyped-def]
+            yield b'{"x": 1, "y": 2}\n{"x": 1,' + padding.encode()
+            yield padding.encode() + b'"y": 2}\n{"x": ' + padding.encode()
+            yield b'3, "y": 4}\n{"x": 5, "y": 6}\n' + padding.encode() * 2
+
+        response = client.post(
+            "/test_app/add/stream",
+            content=body(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        by_line = {line["line"]: line for line in lines}
+        assert set(by_line) == {1, 2, 3, 4, 5}
+        assert by_line[1]["task_id"]
+        assert "maximum size of 64 bytes" in by_line[2]["error"]
+        assert "maximum size of 64 bytes" in by_line[3]["error"]
+        assert by_line[4]["task_id"]
+        assert "maximum size of 64 bytes" in by_line[5]["error"]
+
+    def test_trigger_stream_micro_batches(self, celery_app: Celery) -> None:
+        """Test that the generic stream publishes in micro-batches."""
+        bridge = CeleryFastAPIBridge(celery_app, stream_batch_size=2)
+        batches: list[int] = []
+        original = bridge.publisher.send_many
+
+        async def send_many(messages):  # type: ignore[no-untyped-def]
+            batches.append(len(messages))
+            return await original(messages)
+
+        bridge.publisher.send_many = send_many  # type: ignore[method-assign]
+        client = TestClient(bridge.register_routes())
+        payload = json.dumps({"task_name": "test_app.add", "queue": "celery"})
+        response = client.post(
+            "/trigger/stream",
+            content="\n".join([payload] * 5),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 5
+        assert batches == [2, 2, 1]
+
+
+class TestLazyTaskRoutes:
+    """Tests for the lazy task dispatcher route."""
+
+    def test_models_built_on_first_use(self, celery_app: Celery) -> None:
+        """Test that one route serves all tasks and models are built lazily."""
+        bridge = CeleryFastAPIBridge(celery_app, prefix="/api", lazy_task_routes=True)
+        client = TestClient(bridge.register_routes())
+        paths = [route["path"] for route in bridge.get_registered_routes()]
+        assert "/api/{task_path:path}" in paths
+        assert "/api/test_app/add" not in paths
+        assert bridge._task_specs == {}
+
+        response = client.post("/api/test_app/add", json={"x": 2, "y": 3})
+        assert response.status_code == 200
+        assert response.json()["task_id"]
+        assert list(bridge._task_specs) == ["test_app.add"]
+
+        response = client.post("/api/test_app/add", json={"x": 2})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "y"]
+
+    def test_batch_and_stream(self, celery_app: Celery) -> None:
+        """Test that batch and stream suffixes are dispatched."""
+        bridge = CeleryFastAPIBridge(celery_app, lazy_task_routes=True)
+        client = TestClient(bridge.register_routes())
+
+        response = client.post(
+            "/test_app/greet/batch", json=[{"name": "a"}, {"name": None}]
+        )
+        assert response.status_code == 200
+        assert response.json()["submitted"] == 1
+        assert response.json()["failed"] == 1
+        assert client.post("/test_app/greet/batch", json={}).status_code == 422
+
+        response = client.post(
+            "/test_app/greet/stream",
+            content=b'{"name": "a"}\n{"name": "b"}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert [json.loads(line)["line"] for line in response.text.splitlines()] == [
+            1,
+            2,
+        ]
+
+    def test_only_task_paths_match(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that the catch-all route does not shadow other routes."""
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, lazy_task_routes=True)
+        bridge.register_routes()
+
+        @fastapi_app.post("/custom")
+        async def custom() -> dict[str, bool]:
+            return {"custom": True}
+
+        client = TestClient(fastapi_app)
+        assert client.post("/custom").json() == {"custom": True}
+        assert client.post("/test_app/unknown", json={}).status_code == 404
+        assert client.get("/test_app/add").status_code == 405
+        assert client.post("/test_app/add", content=b"{").status_code == 422
+
+
+class TestDispatchTaskRoutes:
+    """Tests for serving task routes through the dispatch route."""
+
+    def test_serves_task_endpoints(self, celery_app: Celery) -> None:
+        """Test that task, batch and stream endpoints are dispatched by path."""
+        bridge = CeleryFastAPIBridge(
+            celery_app, prefix="/api", dispatch_task_routes=True
+        )
+        app = bridge.register_routes()
+        client = TestClient(app)
+
+        app_paths = [getattr(route, "path", "") for route in app.router.routes]
+        assert "/api/test_app/add" not in app_paths
+        paths = [route["path"] for route in bridge.get_registered_routes()]
+        assert "/api/test_app/add" in paths
+        assert "/api/test_app/add/batch" in paths
+
+        response = client.post("/api/test_app/add", json={"x": 2, "y": 3})
+        assert response.status_code == 200
+        assert response.json()["task_id"]
+        response = client.post("/api/test_app/add", json={"x": 2})
+        assert response.json()["detail"][0]["loc"] == ["body", "y"]
+
+        response = client.post("/api/test_app/add/batch", json=[{"x": 1, "y": 2}])
+        assert response.json()["submitted"] == 1
+        response = client.post(
+            "/api/test_app/greet/stream",
+            content=b'{"name": "a"}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert json.loads(response.text)["line"] == 1
+
+    def test_other_routes_unaffected(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that unknown paths, wrong methods and later routes behave as usual."""
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, dispatch_task_routes=True)
+        bridge.register_routes()
+        client = TestClient(fastapi_app)
+
+        assert client.get("/available-tasks").status_code == 200
+        assert client.post("/test_app/unknown", json={}).status_code == 404
+        assert client.get("/test_app/add").status_code == 405
+        assert fastapi_app.url_path_for("run_test_app_add") == "/test_app/add"
+
+    def test_mounted_app(self, celery_app: Celery) -> None:
+        """Test that task routes are found under the root path of a mount."""
+        bridge = CeleryFastAPIBridge(celery_app, dispatch_task_routes=True)
+        outer = FastAPI()
+        outer.mount("/bridge", bridge.register_routes())
+        client = TestClient(outer)
+
+        response = client.post("/bridge/test_app/add", json={"x": 2, "y": 3})
+        assert response.status_code == 200
+        assert client.post("/test_app/add", json={"x": 2, "y": 3}).status_code == 404
+
+    def test_openapi_lists_task_schemas(self, celery_app: Celery) -> None:
+        """Test that the OpenAPI document keeps the per-task payload schemas."""
+        bridge = CeleryFastAPIBridge(celery_app, dispatch_task_routes=True)
+        app = bridge.register_routes()
+        routes = app.router.routes
+
+        document = app.openapi()
+        assert "/test_app/add" in document["paths"]
+        assert "/test_app/add/batch" in document["paths"]
+        assert "TestAppAddPayload" in document["components"]["schemas"]
+        assert app.router.routes is routes
@@ -0,0 +1,120 @@
+"""Tests for the event-driven cluster state model."""
+
+import time
+
+import pytest
+from celery import Celery
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.events import ClusterEventMonitor
+
+
+def task_event(kind: str, task_id: str, **fields: object) -> dict[str, object]:
+    """Build a task event as delivered by the event receiver."""
+    return {"type": f"task-{kind}", "uuid": task_id, "timestamp": time.time(), **fields}
+
+
+@pytest.fixture
+def monitor(celery_app: Celery) -> ClusterEventMonitor:
+    """Create an event monitor without starting its receiver thread."""
+    return ClusterEventMonitor(celery_app)
+
+
+class TestClusterEventMonitor:
+    """Tests for ClusterEventMonitor."""
+
+    def test_task_lifecycle(self, monitor: ClusterEventMonitor) -> None:
+        """Test that task events move a task through its states."""
+        monitor.on_event(
+            task_event("received", "t1", name="test_app.add", hostname="w1")
+        )
+        assert monitor.get_task("t1")["state"] == "RECEIVED"  # type: ignore[index]
+        assert monitor.tasks_by_worker("RECEIVED") == {"w1": [monitor.get_task("t1")]}
+
+        monitor.on_event(task_event("started", "t1", hostname="w1"))
+        assert list(monitor.tasks_by_worker("STARTED")) == ["w1"]
+
+        monitor.on_event(task_event("succeeded", "t1", result="3", hostname="w1"))
+        record = monitor.get_task("t1")
+        assert record is not None
+        assert record["state"] == "SUCCESS"
+        assert record["name"] == "test_app.add"
+        assert monitor.tasks_by_worker("RECEIVED", "STARTED") == {}
+
+    def test_size_bound_evicts_oldest(self, celery_app: Celery) -> None:
+        """Test that the least recently updated tasks are evicted first."""
+        monitor = ClusterEventMonitor(celery_app, max_tasks=2)
+        for task_id in ("a", "b", "c"):
+            monitor.on_event(task_event("received", task_id, hostname="w1"))
+        monitor.on_event(task_event("started", "b", hostname="w1"))
+        monitor.on_event(task_event("received", "d", hostname="w1"))
+
+        assert monitor.get_task("a") is None
+        assert monitor.get_task("c") is None
+        assert monitor.get_task("b") is not None
+        assert {t["id"] for t in monitor.tasks_by_worker("RECEIVED")["w1"]} == {"d"}
+
+    def test_ttl_evicts_expired(self, celery_app: Celery) -> None:
+        """Test that tasks expire after the TTL."""
+        monitor = ClusterEventMonitor(celery_app, task_ttl=0)
+        monitor.on_event(task_event("received", "t1", hostname="w1"))
+        assert monitor.get_task("t1") is None
+        assert monitor.tasks_by_worker("RECEIVED") == {}
+
+    def test_worker_heartbeats(self, monitor: ClusterEventMonitor) -> None:
+        """Test that heartbeats and offline events track workers."""
+        monitor.on_event({"type": "worker-heartbeat", "hostname": "w1", "active": 2})
+        monitor.on_event({"type": "worker-online", "hostname": "w2"})
+        assert monitor.workers()["w1"]["active"] == 2
+
+        monitor.on_event({"type": "worker-offline", "hostname": "w2"})
+        assert set(monitor.workers()) == {"w1"}
+
+    async def test_close_joins_receiver(self, monitor: ClusterEventMonitor) -> None:
+        """Test that close waits for the receiver thread before a restart."""
+        await monitor.start()
+        thread = monitor._thread
+        assert thread is not None
+        await monitor.close()
+        assert not thread.is_alive()
+        assert monitor._thread is None
+
+        await monitor.start()
+        assert monitor._thread is not thread
+        await monitor.close()
+
+
+class TestEventEndpoints:
+    """Tests for endpoints answered from the event model."""
+
+    def test_list_tasks_from_events(
+        self, celery_app: Celery, monitor: ClusterEventMonitor
+    ) -> None:
+        """Test that /tasks is built from the event model."""
+        monitor.on_event(
+            task_event("started", "t1", name="test_app.add", hostname="w1")
+        )
+        monitor.on_event(task_event("received", "t2", name="other.task", hostname="w1"))
+        monitor.on_event(
+            task_event("received", "t3", name="test_app.add", hostname="w2", eta="soon")
+        )
+        monitor.on_event(task_event("revoked", "t4"))
+        bridge = CeleryFastAPIBridge(celery_app, event_monitor=monitor)
+        data = TestClient(bridge.register_routes()).get("/tasks").json()
+
+        assert [t["id"] for t in data["active"]["w1"]] == ["t1"]
+        assert data["reserved"] == {}
+        assert [t["id"] for t in data["scheduled"]["w2"]] == ["t3"]
+        assert data["revoked"] == {"unknown": ["t4"]}
+
+    def test_queued_task_status_from_events(
+        self, celery_app: Celery, monitor: ClusterEventMonitor
+    ) -> None:
+        """Test that a queued task is reported instead of 404."""
+        monitor.on_event(task_event("sent", "queued-1", name="test_app.add"))
+        bridge = CeleryFastAPIBridge(celery_app, event_monitor=monitor)
+        response = TestClient(bridge.register_routes()).get("/tasks/queued-1")
+
+        assert response.status_code == 200
+        assert response.json()["state"] == "PENDING"
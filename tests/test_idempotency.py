@@ -0,0 +1,221 @@
+"""Tests for Idempotency-Key deduplication of task submissions."""
+
+import time
+from typing import Any
+
+import pytest
+from celery import Celery
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.idempotency import (
+    IdempotencyStore,
+    MemoryIdempotencyStore,
+    RedisIdempotencyStore,
+    idempotent_task_id,
+)
+from celery_fastapi.publisher import InlinePublisher
+
+
+class FakeRedis:
+    """In-memory stand-in for the parts of ``redis.asyncio.Redis`` used."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[bytes, float | None]] = {}
+        self.closed = False
+
+    def _live(self, name: str) -> bytes | None:
+        entry = self.data.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[name]
+            return None
+        return value
+
+    async def set(
+        self, name: str, value: str, nx: bool = False, ex: int | None = None
+    ) -> bool | None:
+        if nx and self._live(name) is not None:
+            return None
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self.data[name] = (value.encode(), expires_at)
+        return True
+
+    async def get(self, name: str) -> bytes | None:
+        return self._live(name)
+
+    async def delete(self, name: str) -> int:
+        return 1 if self.data.pop(name, None) is not None else 0
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class CountingPublisher(InlinePublisher):
+    """Inline publisher recording the task IDs it publishes."""
+
+    def __init__(self, celery_app: Celery) -> None:
+        super().__init__(celery_app)
+        self.sent: list[str] = []
+
+    async def send(self, task_name: str, **options: Any) -> str:
+        task_id = await super().send(task_name, **options)
+        self.sent.append(task_id)
+        return task_id
+
+
+class TestIdempotencyStores:
+    """Tests for the idempotency stores."""
+
+    async def test_memory_lru_and_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the memory store evicts old keys and expires entries."""
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        store = MemoryIdempotencyStore(max_size=2, ttl=10)
+
+        assert await store.claim("a", "task-a") is None
+        assert await store.claim("b", "task-b") is None
+        assert await store.claim("a", "other") == "task-a"
+        assert await store.claim("c", "task-c") is None
+        # "b" was the least recently used key
+        assert len(store) == 2
+        assert await store.claim("b", "task-b2") is None
+
+        now += 11
+        assert await store.claim("c", "task-c2") is None
+
+    async def test_release(self) -> None:
+        """Test that only the claiming task ID releases a key."""
+        store = MemoryIdempotencyStore()
+        await store.claim("a", "task-a")
+        await store.release("a", "other")
+        assert await store.claim("a", "task-b") == "task-a"
+        await store.release("a", "task-a")
+        assert await store.claim("a", "task-b") is None
+
+    async def test_redis_store(self) -> None:
+        """Test claiming, reading back and releasing keys in Redis."""
+        client = FakeRedis()
+        store = RedisIdempotencyStore(client, ttl=60, prefix="idem:")
+
+        assert await store.claim("a", "task-a") is None
+        assert await store.claim("a", "task-b") == "task-a"
+        assert list(client.data) == ["idem:a"]
+        await store.release("a", "task-a")
+        assert await store.claim("a", "task-b") is None
+        await store.close()
+        assert client.closed
+
+    async def test_redis_claim_after_expiry(self) -> None:
+        """Test that a key expiring mid-claim is still claimed only once."""
+        client = FakeRedis()
+        store = RedisIdempotencyStore(client, ttl=60, prefix="idem:")
+        assert await store.claim("a", "task-a") is None
+        get = client.get
+        competing: list[str | None] = []
+
+        async def expire_then_get(name: str) -> bytes | None:
+            # The key expires, and another submission claims it first
+            client.get = get  # type: ignore[method-assign]
+            del client.data[name]
+            competing.append(await store.claim("a", "task-c"))
+            return None
+
+        client.get = expire_then_get  # type: ignore[method-assign]
+        assert await store.claim("a", "task-b") == "task-c"
+        assert competing == [None]
+
+    def test_incomplete_store(self) -> None:
+        """Test that a store missing release fails when it is created."""
+
+        class ClaimOnly(IdempotencyStore):
+            async def claim(self, key: str, task_id: str) -> str | None:
+                return key + task_id
+
+        with pytest.raises(TypeError, match="release"):
+            ClaimOnly()  # type: ignore[abstract]
+
+    def test_deterministic_task_id(self) -> None:
+        """Test that task IDs depend on the task name and the key only."""
+        assert idempotent_task_id("t", "k") == idempotent_task_id("t", "k")
+        assert idempotent_task_id("t", "k") != idempotent_task_id("t", "k2")
+        assert idempotent_task_id("t", "k") != idempotent_task_id("u", "k")
+
+
+class TestIdempotentEndpoints:
+    """Tests for the Idempotency-Key header on submission endpoints."""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_task_endpoint_replay(
+        self, celery_app: Celery, fastapi_app: FastAPI, lazy: bool
+    ) -> None:
+        """Test that a repeated key returns the original task ID unpublished."""
+        publisher = CountingPublisher(celery_app)
+        bridge = CeleryFastAPIBridge(
+            celery_app, fastapi_app, publisher=publisher, lazy_task_routes=lazy
+        )
+        client = TestClient(bridge.register_routes())
+        headers = {"Idempotency-Key": "order-42"}
+
+        first = client.post("/test_app/add", json={"x": 1, "y": 2}, headers=headers)
+        second = client.post("/test_app/add", json={"x": 1, "y": 2}, headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        task_id = first.json()["task_id"]
+        assert task_id == idempotent_task_id("test_app.add", "order-42")
+        assert second.json()["task_id"] == task_id
+        assert "idempotent-replayed" not in first.headers
+        assert second.headers["idempotent-replayed"] == "true"
+        assert publisher.sent == [task_id]
+
+        # Without the header every submission is published
+        client.post("/test_app/add", json={"x": 1, "y": 2})
+        assert len(publisher.sent) == 2
+
+    def test_trigger_replay(self, celery_app: Celery) -> None:
+        """Test that /trigger deduplicates by key and scopes keys per task."""
+        publisher = CountingPublisher(celery_app)
+        bridge = CeleryFastAPIBridge(celery_app, publisher=publisher)
+        client = TestClient(bridge.register_routes())
+        headers = {"Idempotency-Key": "k"}
+        payload = {"task_name": "test_app.add", "queue": "celery", "args": [1, 2]}
+
+        first = client.post("/trigger", json=payload, headers=headers)
+        second = client.post("/trigger", json=payload, headers=headers)
+        other = client.post(
+            "/trigger",
+            json={**payload, "task_name": "test_app.multiply"},
+            headers=headers,
+        )
+
+        assert first.json()["task_id"] == second.json()["task_id"]
+        assert other.json()["task_id"] != first.json()["task_id"]
+        assert len(publisher.sent) == 2
+
+    def test_failed_publish_is_not_remembered(self, celery_app: Celery) -> None:
+        """Test that a key is released when publishing fails."""
+
+        class FlakyPublisher(CountingPublisher):
+            fail = True
+
+            async def send(self, task_name: str, **options: Any) -> str:
+                if self.fail:
+                    self.fail = False
+                    raise RuntimeError("broker down")
+                return await super().send(task_name, **options)
+
+        publisher = FlakyPublisher(celery_app)
+        bridge = CeleryFastAPIBridge(celery_app, publisher=publisher)
+        client = TestClient(bridge.register_routes(), raise_server_exceptions=False)
+        headers = {"Idempotency-Key": "retry-me"}
+
+        failed = client.post("/test_app/add", json={"x": 1, "y": 2}, headers=headers)
+        retried = client.post("/test_app/add", json={"x": 1, "y": 2}, headers=headers)
+
+        assert failed.status_code == 500
+        assert retried.status_code == 200
+        assert "idempotent-replayed" not in retried.headers
+        assert publisher.sent == [retried.json()["task_id"]]
@@ -0,0 +1,140 @@
+"""Tests for the cached cluster inspector."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from celery import Celery
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.inspector import INSPECT_COMMANDS, ClusterInspector
+
+
+class FakeInspect:
+    """Stand-in for celery.app.control.Inspect that counts broadcasts."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def __getattr__(self, command: str) -> Any:
+        def reply() -> dict[str, Any] | None:
+            with self.lock:
+                self.calls.append(command)
+            if command == "registered":
+                return {"w1": ["test_app.add", "other.task"]}
+            if command == "active":
+                return {"w1": [{"name": "test_app.add"}, {"name": "other.task"}]}
+            return None
+
+        return reply
+
+
+@pytest.fixture
+def fake_inspect(celery_app: Celery, monkeypatch: pytest.MonkeyPatch) -> FakeInspect:
+    """Replace inspect() on the test app with a FakeInspect."""
+    fake = FakeInspect()
+    monkeypatch.setattr(celery_app.control, "inspect", lambda **_kwargs: fake)
+    return fake
+
+
+class TestClusterInspector:
+    """Tests for ClusterInspector."""
+
+    async def test_snapshot_gathers_all_commands(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that one snapshot broadcasts every command once."""
+        inspector = ClusterInspector(celery_app)
+        snapshot = await inspector.get_snapshot()
+        await inspector.close()
+
+        assert sorted(fake_inspect.calls) == sorted(INSPECT_COMMANDS)
+        assert snapshot.ping == {}
+        assert snapshot.registered == {"w1": ["test_app.add", "other.task"]}
+
+    async def test_concurrent_refreshes_coalesce(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that concurrent callers share one set of broadcasts."""
+        inspector = ClusterInspector(celery_app)
+        snapshots = await asyncio.gather(*(inspector.refresh() for _ in range(10)))
+        await inspector.close()
+
+        assert len(fake_inspect.calls) == len(INSPECT_COMMANDS)
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+    async def test_fresh_snapshot_is_cached(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that a fresh snapshot is served without broadcasting."""
+        inspector = ClusterInspector(celery_app, refresh_interval=60)
+        first = await inspector.get_snapshot()
+        second = await inspector.get_snapshot()
+        await inspector.close()
+
+        assert first is second
+        assert len(fake_inspect.calls) == len(INSPECT_COMMANDS)
+
+    async def test_stale_snapshot_is_refreshed(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that a stale snapshot triggers a refresh on demand."""
+        inspector = ClusterInspector(celery_app, refresh_interval=0)
+        first = await inspector.get_snapshot()
+        second = await inspector.get_snapshot()
+        await inspector.close()
+
+        assert first is not second
+        assert len(fake_inspect.calls) == 2 * len(INSPECT_COMMANDS)
+
+    async def test_no_broadcasts_until_read(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that a started inspector stays idle until the snapshot is read."""
+        inspector = ClusterInspector(celery_app, refresh_interval=0.01)
+        await inspector.start()
+        await asyncio.sleep(0.05)
+        assert fake_inspect.calls == []
+
+        await inspector.get_snapshot()
+        await inspector.close()
+        assert len(fake_inspect.calls) == len(INSPECT_COMMANDS)
+
+    async def test_background_refresh(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that the background task keeps the snapshot populated."""
+        inspector = ClusterInspector(celery_app, refresh_interval=0.01, background=True)
+        await inspector.start()
+        await asyncio.sleep(0.05)
+        await inspector.close()
+
+        assert inspector.snapshot is not None
+        assert len(fake_inspect.calls) > len(INSPECT_COMMANDS)
+
+
+class TestInspectionEndpoints:
+    """Tests for endpoints served from the cluster snapshot."""
+
+    @pytest.mark.usefixtures("fake_inspect")
+    def test_workers_filtered_with_age(self, celery_app: Celery) -> None:
+        """Test that /workers filters registered tasks and reports the age."""
+        client = TestClient(CeleryFastAPIBridge(celery_app).register_routes())
+        data = client.get("/workers").json()
+        assert data["registered"] == {"w1": ["test_app.add"]}
+        assert data["snapshot_age"] >= 0
+
+    def test_endpoints_share_snapshot(
+        self, celery_app: Celery, fake_inspect: FakeInspect
+    ) -> None:
+        """Test that /tasks, /workers and /queues reuse one snapshot."""
+        client = TestClient(CeleryFastAPIBridge(celery_app).register_routes())
+        tasks = client.get("/tasks").json()
+        client.get("/workers")
+        client.get("/queues")
+
+        assert tasks["active"] == {"w1": [{"name": "test_app.add"}]}
+        assert len(fake_inspect.calls) == len(INSPECT_COMMANDS)
@@ -0,0 +1,180 @@
+"""Tests for submission rate limits and the queue depth guard."""
+
+import pytest
+from celery import Celery
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.limits import (
+    QueueBacklogged,
+    QueueDepthGuard,
+    RateLimiter,
+    RateLimitExceeded,
+)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_task_and_queue_limits(self) -> None:
+        """Test that each bucket limits its own scope."""
+        limiter = RateLimiter(
+            task_limits={"slow": "2/m"}, queue_limits={"small": 1}, burst=60
+        )
+        limiter.check("slow", "celery", None)
+        limiter.check("slow", "celery", None)
+        with pytest.raises(RateLimitExceeded, match="task 'slow'") as exc_info:
+            limiter.check("slow", "celery", None)
+        assert 0 < exc_info.value.retry_after <= 30
+        assert exc_info.value.status_code == 429
+
+        # Other tasks and unlimited queues are unaffected
+        limiter.check("fast", "celery", None)
+        for _ in range(60):
+            limiter.check("fast", "small", None)
+        with pytest.raises(RateLimitExceeded, match="queue 'small'"):
+            limiter.check("fast", "small", None)
+
+    def test_rejection_consumes_nothing(self) -> None:
+        """Test that a submission rejected by one bucket leaves the others full."""
+        limiter = RateLimiter(task_limits={"t": "1/m"}, client_limit="1/m")
+        limiter.check("t", None, "alice")
+        with pytest.raises(RateLimitExceeded, match="task"):
+            limiter.check("t", None, "bob")
+        # bob's bucket was not charged by the rejected submission
+        limiter.check("other", None, "bob")
+
+    def test_client_buckets_are_bounded(self) -> None:
+        """Test that client buckets are per key and evicted beyond max_clients."""
+        limiter = RateLimiter(client_limit="1/m", max_clients=2)
+        limiter.check("t", None, "a")
+        limiter.check("t", None, "b")
+        with pytest.raises(RateLimitExceeded, match="client"):
+            limiter.check("t", None, "a")
+        limiter.check("t", None, "c")
+        # "b" was evicted and starts with a full bucket again
+        limiter.check("t", None, "b")
+
+
+class TestQueueDepthGuard:
+    """Tests for QueueDepthGuard."""
+
+    async def test_rejects_backlogged_queue(self, celery_app: Celery) -> None:
+        """Test that submissions are rejected once the queue is at its limit."""
+        guard = QueueDepthGuard(
+            celery_app, max_depth={"depth-1": 2}, refresh_interval=0
+        )
+        await guard.check("depth-1")
+        # Unguarded queues are never read
+        await guard.check("other")
+        assert guard.depths == {"depth-1": 0}
+
+        for i in range(2):
+            celery_app.send_task("test_app.add", args=[i, i], queue="depth-1")
+        with pytest.raises(QueueBacklogged, match="2 pending") as exc_info:
+            await guard.check("depth-1")
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.retry_after_header == "1"
+        await guard.close()
+
+    async def test_serves_cached_depths(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lengths are read once per refresh interval."""
+        reads: list[list[str]] = []
+        guard = QueueDepthGuard(celery_app, max_depth=10, refresh_interval=60)
+
+        def read_sync(queues):  # type: ignore[no-untyped-def]
+            reads.append(sorted(queues))
+            return dict.fromkeys(queues, 3)
+
+        monkeypatch.setattr(guard, "_read_sync", read_sync)
+        for _ in range(5):
+            await guard.check("celery")
+        await guard.check("high_priority")
+        await guard.close()
+
+        assert reads == [["celery", "high_priority"]]
+        assert guard.depths == {"celery": 3, "high_priority": 3}
+
+    async def test_unknown_queues_not_read(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that queue names unknown to the app are neither read nor kept."""
+        reads: list[list[str]] = []
+        guard = QueueDepthGuard(celery_app, max_depth=10, refresh_interval=0)
+
+        def read_sync(queues):  # type: ignore[no-untyped-def]
+            reads.append(sorted(queues))
+            return dict.fromkeys(queues, 0)
+
+        monkeypatch.setattr(guard, "_read_sync", read_sync)
+        for i in range(100):
+            await guard.check(f"made-up-{i}")
+        await guard.close()
+
+        assert reads == []
+        assert guard.queues == {"celery", "high_priority"}
+        assert guard.limit_for("made-up-0") is None
+
+
+class TestAdmissionEndpoints:
+    """Tests for rate limits and queue depth on the submission endpoints."""
+
+    def test_rate_limited_task_endpoint(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that a task over its limit gets 429 with Retry-After."""
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            rate_limiter=RateLimiter(task_limits={"test_app.add": "1/m"}),
+        )
+        client = TestClient(bridge.register_routes())
+
+        assert client.post("/test_app/add", json={"x": 1, "y": 2}).status_code == 200
+        response = client.post("/test_app/add", json={"x": 1, "y": 2})
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "60"
+        assert (
+            client.post("/test_app/multiply", json={"x": 1, "y": 2}).status_code == 200
+        )
+
+    def test_rate_limited_batch_items(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that batch items over the limit are reported individually."""
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            rate_limiter=RateLimiter(client_limit="2/m", burst=60),
+        )
+        client = TestClient(bridge.register_routes())
+        response = client.post("/test_app/add/batch", json=[{"x": 1, "y": 2}] * 3)
+
+        body = response.json()
+        assert body["submitted"] == 2
+        assert body["items"][2]["error"] == "Rate limit exceeded for client"
+
+    def test_backlogged_queue_on_trigger(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that /trigger returns 503 while the target queue is backlogged."""
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            queue_depth_guard=QueueDepthGuard(
+                celery_app,
+                max_depth={"depth-4": 1},
+                refresh_interval=0,
+                background=False,
+            ),
+        )
+        client = TestClient(bridge.register_routes())
+        payload = {"task_name": "test_app.add", "queue": "depth-4", "args": [1, 2]}
+
+        assert client.post("/trigger", json=payload).status_code == 200
+        response = client.post("/trigger", json=payload)
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
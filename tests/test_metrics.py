@@ -0,0 +1,150 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+import pytest
+from celery import Celery, states
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.limits import RateLimiter
+from celery_fastapi.publisher import ProducerPool, PublisherBusyError
+
+pytest.importorskip("prometheus_client")
+
+from celery_fastapi.metrics import BridgeMetrics  # noqa: E402
+
+
+def _sample(metrics: BridgeMetrics, name: str, **labels: str) -> float:
+    value = metrics.registry.get_sample_value(name, labels)
+    return value or 0.0
+
+
+class TestBridgeMetrics:
+    """Tests for BridgeMetrics and the /metrics endpoint."""
+
+    def test_submission_outcomes(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that submissions are counted by task, queue and outcome."""
+        metrics = BridgeMetrics()
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            metrics=metrics,
+            rate_limiter=RateLimiter(task_limits={"test_app.multiply": "1/m"}),
+        )
+        client = TestClient(bridge.register_routes())
+        client.post("/test_app/add", json={"x": 1, "y": 2})
+        client.post("/test_app/multiply", json={"x": 1, "y": 2})
+        client.post("/test_app/multiply", json={"x": 1, "y": 2})
+        client.post("/test_app/greet/batch", json=[{"name": "a"}, {"name": "b"}])
+
+        counter = "celery_fastapi_submissions_total"
+        add = {"task": "test_app.add", "queue": "celery"}
+        multiply = {"task": "test_app.multiply", "queue": "celery"}
+        greet = {"task": "test_app.greet", "queue": "high_priority"}
+        assert _sample(metrics, counter, **add, outcome="published") == 1
+        assert _sample(metrics, counter, **multiply, outcome="published") == 1
+        assert _sample(metrics, counter, **multiply, outcome="rejected") == 1
+        assert _sample(metrics, counter, **greet, outcome="published") == 2
+        assert _sample(metrics, "celery_fastapi_validation_seconds_count") == 2
+        assert _sample(metrics, "celery_fastapi_message_build_seconds_count") == 3
+        assert (
+            _sample(metrics, "celery_fastapi_publish_seconds_count", mode="single") == 2
+        )
+        assert (
+            _sample(metrics, "celery_fastapi_publish_seconds_count", mode="batch") == 1
+        )
+
+    def test_invalid_items(self, celery_app: Celery, fastapi_app: FastAPI) -> None:
+        """Test that batch items and stream lines failing validation are counted."""
+        metrics = BridgeMetrics()
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, metrics=metrics)
+        client = TestClient(bridge.register_routes())
+        client.post("/test_app/add/batch", json=[{"x": 1, "y": 2}, {"x": 1}])
+        client.post(
+            "/test_app/add/stream",
+            content=b'{"x": 1}\nnot json\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        client.post(
+            "/trigger/batch",
+            json=[{"task_name": "test_app.greet", "queue": "high_priority", "args": 1}],
+        )
+
+        counter = "celery_fastapi_submissions_total"
+        add = {"task": "test_app.add", "queue": "celery"}
+        greet = {"task": "test_app.greet", "queue": "high_priority"}
+        assert _sample(metrics, counter, **add, outcome="invalid") == 3
+        assert _sample(metrics, counter, **add, outcome="published") == 1
+        assert _sample(metrics, counter, **greet, outcome="invalid") == 1
+
+    def test_producer_pool(self, celery_app: Celery, fastapi_app: FastAPI) -> None:
+        """Test that pool occupancy, waits and timeouts are reported."""
+        metrics = BridgeMetrics()
+        pool = ProducerPool(celery_app, size=1, acquire_timeout=0.01)
+        CeleryFastAPIBridge(
+            celery_app, fastapi_app, metrics=metrics, producer_pool=pool
+        )
+
+        with pool.acquire():
+            assert _sample(metrics, "celery_fastapi_producers_in_use") == 1
+            with pytest.raises(PublisherBusyError), pool.acquire():
+                pass
+        assert _sample(metrics, "celery_fastapi_producers_in_use") == 0
+        assert _sample(metrics, "celery_fastapi_producer_waiters") == 0
+        assert _sample(metrics, "celery_fastapi_producer_wait_seconds_count") == 1
+        assert _sample(metrics, "celery_fastapi_producer_timeouts_total") == 1
+        pool.close()
+
+    def test_backend_and_inspect_latency(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that backend reads and inspect broadcasts are timed and counted."""
+        metrics = BridgeMetrics()
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, metrics=metrics)
+        bridge.inspector.timeout = 0.01
+        client = TestClient(bridge.register_routes())
+        celery_app.backend.store_result("metrics-1", 3, states.SUCCESS)
+        client.get("/tasks/metrics-1")
+        client.get("/tasks/metrics-1")
+        client.get("/workers")
+
+        assert (
+            _sample(
+                metrics,
+                "celery_fastapi_backend_seconds_count",
+                operation="get_task_meta",
+            )
+            == 1
+        )
+        assert (
+            _sample(metrics, "celery_fastapi_inspect_seconds_count", command="ping")
+            == 1
+        )
+        lookups = "celery_fastapi_result_lookups_total"
+        assert _sample(metrics, lookups, outcome="miss") == 1
+        assert _sample(metrics, lookups, outcome="hit") == 1
+
+    def test_endpoint_and_label_cap(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test the exposition format and the cap on distinct label values."""
+        metrics = BridgeMetrics(max_label_values=1)
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, metrics=metrics)
+        client = TestClient(bridge.register_routes())
+        for name in ("first.task", "second.task"):
+            client.post(
+                "/trigger", json={"task_name": name, "queue": "celery", "args": []}
+            )
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'task="first.task"' in response.text
+        assert 'task="other"' in response.text
+        assert "second.task" not in response.text
+
+    def test_disabled_by_default(self, client: TestClient) -> None:
+        """Test that /metrics is only served when metrics are enabled."""
+        assert client.get("/metrics").status_code in (404, 405)
@@ -0,0 +1,312 @@
+"""Tests for the task submission engines."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from celery import Celery
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge, InlinePublisher, ThreadPoolPublisher
+from celery_fastapi.publisher import (
+    BatchingPublisher,
+    ProducerPool,
+    PublisherBusyError,
+    TaskPublisher,
+    create_publisher,
+)
+
+
+class TestCreatePublisher:
+    """Tests for resolving publisher specifications."""
+
+    def test_default_is_thread_pool(self, celery_app: Celery) -> None:
+        """Test that the default publisher runs on a thread pool."""
+        assert isinstance(create_publisher(celery_app), ThreadPoolPublisher)
+
+    def test_inline_by_name(self, celery_app: Celery) -> None:
+        """Test selecting the inline publisher by name."""
+        assert isinstance(create_publisher(celery_app, "inline"), InlinePublisher)
+
+    def test_instance_passthrough(self, celery_app: Celery) -> None:
+        """Test that publisher instances are used as-is."""
+        publisher = InlinePublisher(celery_app)
+        assert create_publisher(celery_app, publisher) is publisher
+
+    def test_unknown_name(self, celery_app: Celery) -> None:
+        """Test that unknown publisher names are rejected."""
+        with pytest.raises(ValueError, match="Unknown publisher"):
+            create_publisher(celery_app, "carrier-pigeon")
+
+    def test_incomplete_engine(self, celery_app: Celery) -> None:
+        """Test that an engine missing send_many fails when it is created."""
+
+        class SendOnly(TaskPublisher):
+            async def send(self, task_name: str, **_: object) -> str:
+                return task_name
+
+        with pytest.raises(TypeError, match="send_many"):
+            SendOnly(celery_app)  # type: ignore[abstract]
+
+
+class TestThreadPoolPublisher:
+    """Tests for ThreadPoolPublisher."""
+
+    async def test_send_runs_off_event_loop(self, celery_app: Celery) -> None:
+        """Test that send_task is called from a publisher thread."""
+        threads: list[str] = []
+        original = celery_app.send_task
+
+        def send_task(*args, **kwargs):  # type: ignore[no-untyped-def]
+            threads.append(threading.current_thread().name)
+            return original(*args, **kwargs)
+
+        celery_app.send_task = send_task  # type: ignore[method-assign]
+        publisher = ThreadPoolPublisher(celery_app, max_workers=2)
+        task_id = await publisher.send("test_app.add", args=[1, 2])
+        await publisher.close()
+
+        assert task_id
+        assert threads[0].startswith("celery-fastapi-publisher")
+
+    async def test_backpressure_timeout(self, celery_app: Celery) -> None:
+        """Test that a saturated publisher raises PublisherBusyError."""
+        release = threading.Event()
+
+        def send_task(*_args: object, **_kwargs: object) -> None:
+            release.wait()
+
+        celery_app.send_task = send_task  # type: ignore[method-assign]
+        publisher = ThreadPoolPublisher(
+            celery_app, max_workers=1, max_pending=1, acquire_timeout=0.05
+        )
+        blocked = asyncio.ensure_future(publisher.send("test_app.add"))
+        await asyncio.sleep(0.01)
+        assert publisher.pending == 1
+
+        with pytest.raises(PublisherBusyError):
+            await publisher.send("test_app.add")
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(blocked, return_exceptions=True), 1)
+        await publisher.close()
+
+    def test_invalid_limits(self, celery_app: Celery) -> None:
+        """Test that max_pending must cover the thread pool."""
+        with pytest.raises(ValueError):
+            ThreadPoolPublisher(celery_app, max_workers=4, max_pending=2)
+
+
+class TestBridgePublisher:
+    """Tests for publisher integration with the bridge."""
+
+    def test_endpoint_uses_publisher_in_lifespan(self, celery_app: Celery) -> None:
+        """Test that task endpoints publish through the bridge publisher."""
+        bridge = CeleryFastAPIBridge(celery_app, publisher="thread")
+        with TestClient(bridge.register_routes()) as client:
+            response = client.post("/test_app/add", json={"x": 1, "y": 2})
+            assert response.status_code == 200
+            assert response.json()["task_id"]
+        assert bridge.publisher._executor is None  # type: ignore[attr-defined]
+
+    def test_busy_publisher_returns_503(self, celery_app: Celery) -> None:
+        """Test that a saturated publisher maps to 503 with Retry-After."""
+
+        class BusyPublisher(InlinePublisher):
+            async def send(self, _task_name: str, **_options: object) -> str:
+                raise PublisherBusyError("full")
+
+        bridge = CeleryFastAPIBridge(celery_app, publisher=BusyPublisher(celery_app))
+        client = TestClient(bridge.register_routes())
+        response = client.post("/test_app/add", json={"x": 1, "y": 2})
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+
+class TestSendMany:
+    """Tests for publishing several messages at once."""
+
+    async def test_shares_one_producer(self, celery_app: Celery) -> None:
+        """Test that all messages in a batch use the same producer."""
+        producers: list[object] = []
+        original = celery_app.send_task
+
+        def send_task(*args, **kwargs):  # type: ignore[no-untyped-def]
+            producers.append(kwargs["producer"])
+            return original(*args, **kwargs)
+
+        celery_app.send_task = send_task  # type: ignore[method-assign]
+        publisher = ThreadPoolPublisher(celery_app)
+        results = await publisher.send_many(
+            [("test_app.add", {"args": [1, 2]}), ("test_app.add", {"args": [3, 4]})]
+        )
+        await publisher.close()
+
+        assert len(results) == 2
+        assert all(isinstance(result, str) for result in results)
+        assert producers[0] is producers[1]
+
+    async def test_reports_errors_per_message(self, celery_app: Celery) -> None:
+        """Test that a failing message does not abort the batch."""
+        original = celery_app.send_task
+
+        def send_task(name, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if name == "boom":
+                raise RuntimeError("broker said no")
+            return original(name, *args, **kwargs)
+
+        celery_app.send_task = send_task  # type: ignore[method-assign]
+        results = await InlinePublisher(celery_app).send_many(
+            [("boom", {}), ("test_app.add", {"args": [1, 2]})]
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert isinstance(results[1], str)
+
+
+class TestProducerPool:
+    """Tests for the bridge-owned producer pool."""
+
+    def test_warm_and_reuse(self, celery_app: Celery) -> None:
+        """Test that warmed producers are reused without new connections."""
+        pool = ProducerPool(celery_app, size=2)
+        assert pool.warm() == 2
+        assert pool.warm() == 0
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+        stats = pool.stats()
+        assert stats["created"] == 2
+        assert stats["idle"] == 2
+        assert stats["acquired"] == 2
+        pool.close()
+        assert pool.stats()["created"] == 0
+
+    def test_exhaustion(self, celery_app: Celery) -> None:
+        """Test that waits for a producer are counted and time out."""
+        pool = ProducerPool(celery_app, size=1, acquire_timeout=0.05)
+        with pool.acquire(), pytest.raises(PublisherBusyError), pool.acquire():
+            pass
+        stats = pool.stats()
+        assert stats["exhausted"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds"] > 0
+
+        holding = threading.Event()
+
+        def hold() -> None:
+            with pool.acquire():
+                holding.set()
+                time.sleep(0.05)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        holding.wait()
+        pool.acquire_timeout = 5
+        with pool.acquire():
+            pass
+        holder.join()
+        assert pool.stats()["exhausted"] == 2
+        assert pool.stats()["timeouts"] == 1
+        pool.close()
+
+    def test_discard_and_health_check(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that failed and unhealthy producers are replaced."""
+        pool = ProducerPool(celery_app, size=1, health_check_interval=0)
+        with pytest.raises(RuntimeError), pool.acquire() as broken:
+            raise RuntimeError("publish failed")
+        with pool.acquire() as producer:
+            assert producer is not broken
+
+        monkeypatch.setattr(pool, "_healthy", lambda _producer: False)
+        with pool.acquire() as replaced:
+            assert replaced is not producer
+        stats = pool.stats()
+        assert stats["discarded"] == 2
+        assert stats["health_check_failures"] == 1
+        assert stats["created"] == 1
+        pool.close()
+
+    def test_bridge_warms_pool_on_startup(self, celery_app: Celery) -> None:
+        """Test that the bridge opens its producers on startup and publishes with them."""
+        bridge = CeleryFastAPIBridge(
+            celery_app, producer_pool=ProducerPool(celery_app, size=2)
+        )
+        assert bridge.publisher.producer_pool is bridge.producer_pool
+        with TestClient(bridge.register_routes()) as client:
+            assert bridge.producer_pool.stats()["created"] == 2
+            response = client.post("/test_app/add", json={"x": 1, "y": 2})
+            assert response.status_code == 200
+            assert bridge.producer_pool.stats()["acquired"] == 1
+        assert bridge.producer_pool.stats()["created"] == 0
+
+
+class TestBatchingPublisher:
+    """Tests for BatchingPublisher."""
+
+    async def test_coalesces_concurrent_sends(self, celery_app: Celery) -> None:
+        """Test that concurrent sends are published as one batch."""
+        batches: list[int] = []
+        publisher = BatchingPublisher(celery_app, max_delay=0.01)
+        original = publisher._send_many_sync
+
+        def send_many_sync(messages):  # type: ignore[no-untyped-def]
+            batches.append(len(messages))
+            return original(messages)
+
+        publisher._send_many_sync = send_many_sync  # type: ignore[method-assign]
+        task_ids = await asyncio.gather(
+            *(publisher.send("test_app.add", args=[i, i]) for i in range(10))
+        )
+        await publisher.close()
+
+        assert batches == [10]
+        assert len(set(task_ids)) == 10
+        assert publisher.batches_sent == 1
+        assert publisher.messages_sent == 10
+
+    async def test_max_batch_flushes_early(self, celery_app: Celery) -> None:
+        """Test that a full batch is published without waiting for the delay."""
+        publisher = BatchingPublisher(celery_app, max_batch=3, max_delay=60)
+        task_ids = await asyncio.wait_for(
+            asyncio.gather(*(publisher.send("test_app.add") for _ in range(3))), 5
+        )
+        assert len(task_ids) == 3
+
+        pending = asyncio.ensure_future(publisher.send("test_app.add"))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+        await publisher.close()
+        assert pending.done()
+        assert publisher.batches_sent == 2
+
+    async def test_errors_reach_their_caller(self, celery_app: Celery) -> None:
+        """Test that a failing message only fails its own caller."""
+        original = celery_app.send_task
+
+        def send_task(name, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if name == "boom":
+                raise RuntimeError("broker said no")
+            return original(name, *args, **kwargs)
+
+        celery_app.send_task = send_task  # type: ignore[method-assign]
+        publisher = BatchingPublisher(celery_app)
+        results = await asyncio.gather(
+            publisher.send("boom"),
+            publisher.send("test_app.add", args=[1, 2]),
+            return_exceptions=True,
+        )
+        await publisher.close()
+
+        assert isinstance(results[0], RuntimeError)
+        assert isinstance(results[1], str)
+
+    def test_by_name(self, celery_app: Celery) -> None:
+        """Test selecting the batching publisher by name."""
+        assert isinstance(create_publisher(celery_app, "batch"), BatchingPublisher)
+        with pytest.raises(ValueError):
+            BatchingPublisher(celery_app, max_batch=0)
@@ -0,0 +1,87 @@
+"""Tests for the shared refresh helpers."""
+
+import asyncio
+import threading
+
+import pytest
+
+from celery_fastapi.refresh import LazyExecutor, PeriodicRefresher, SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    async def test_coalesces_per_key(self) -> None:
+        """Concurrent calls for a key share one call; other keys run their own."""
+        flight: SingleFlight[str] = SingleFlight()
+        calls: list[str] = []
+
+        async def call(key: str) -> str:
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        results = await asyncio.gather(
+            *(flight.run(key, lambda key=key: call(key)) for key in "aab")
+        )
+
+        assert results == ["A", "A", "B"]
+        assert sorted(calls) == ["a", "b"]
+        assert "a" not in flight
+
+    async def test_cancelled_caller(self) -> None:
+        """Cancelling one caller does not abort the call shared with others."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        async def call() -> int:
+            await asyncio.sleep(0.02)
+            return 1
+
+        first = asyncio.create_task(flight.run("k", call))
+        second = asyncio.create_task(flight.run("k", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestPeriodicRefresher:
+    """Tests for PeriodicRefresher."""
+
+    async def test_refreshes_until_stopped(self) -> None:
+        """The refresh runs right away and again, surviving errors."""
+        calls = 0
+
+        async def refresh() -> None:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("broker down")
+
+        refresher = PeriodicRefresher(refresh, 0.01)
+        refresher.start()
+        assert refresher.running
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+
+        assert not refresher.running
+        assert calls >= 2
+        stopped_at = calls
+        await asyncio.sleep(0.03)
+        assert calls == stopped_at
+
+
+class TestLazyExecutor:
+    """Tests for LazyExecutor."""
+
+    async def test_created_on_first_use(self) -> None:
+        """No thread pool exists until a call runs; shutdown drops it."""
+        executor = LazyExecutor(1, "celery-fastapi-test")
+        assert executor._executor is None
+
+        name = await executor.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("celery-fastapi-test")
+        executor.shutdown()
+        assert executor._executor is None
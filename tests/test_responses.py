@@ -0,0 +1,160 @@
+"""Tests for fast JSON responses."""
+
+import datetime
+import decimal
+from typing import Any
+
+import pytest
+from celery import Celery, states
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge, TaskStatusResponse
+from celery_fastapi.responses import FastJSONResponse
+
+orjson = pytest.importorskip("orjson")
+
+
+class TestFastJSONResponse:
+    """Tests for FastJSONResponse encoding."""
+
+    def test_encodes_models_and_fallback_types(self) -> None:
+        """Test that models, datetimes and unsupported types are encoded."""
+        done = datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+        status = TaskStatusResponse(
+            task_id="t",
+            state="SUCCESS",
+            result={1: decimal.Decimal("1.5")},
+            date_done=done,
+        )
+        body = FastJSONResponse([status]).body
+
+        assert orjson.loads(body) == [
+            {
+                "task_id": "t",
+                "state": "SUCCESS",
+                "result": {"1": 1.5},
+                "traceback": None,
+                "date_done": "2026-01-02T03:04:05Z",
+                "info": None,
+            }
+        ]
+        assert (
+            orjson.loads(body)[0]["date_done"]
+            == status.model_dump(mode="json")["date_done"]
+        )
+
+
+class TestFastResponseEndpoints:
+    """Tests for the endpoints with fast_responses enabled."""
+
+    @pytest.fixture
+    def clients(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> tuple[TestClient, TestClient]:
+        """Return clients of a default bridge and of a fast one."""
+
+        def inspect(**_: Any) -> Any:
+            class Inspect:
+                def __getattr__(self, command: str) -> Any:
+                    if command == "registered":
+                        return lambda: {"w1": ["test_app.add", "other.task"]}
+                    if command == "revoked":
+                        return lambda: {"w1": ["r"]}
+                    return lambda: {"w1": [{"name": "test_app.add", "id": "a"}]}
+
+            return Inspect()
+
+        monkeypatch.setattr(celery_app.control, "inspect", inspect)
+        bridges = [
+            CeleryFastAPIBridge(celery_app, FastAPI(), fast_responses=fast)
+            for fast in (False, True)
+        ]
+        default, fast = (TestClient(bridge.register_routes()) for bridge in bridges)
+        return default, fast
+
+    def test_same_bodies(
+        self, celery_app: Celery, clients: tuple[TestClient, TestClient]
+    ) -> None:
+        """Test that fast responses carry the same JSON as the default ones."""
+        celery_app.backend.store_result("fast-1", {"total": 3}, states.SUCCESS)
+        celery_app.backend.store_result("fast-2", {"done": 1}, "PROGRESS")
+        default, fast = clients
+        paths = [
+            "/tasks/fast-1",
+            "/tasks/fast-1/result",
+            "/tasks/status?task_id=fast-1&task_id=fast-2",
+            "/available-tasks",
+            "/tasks",
+            "/queues",
+        ]
+        for path in paths:
+            expected, actual = default.get(path), fast.get(path)
+            assert actual.status_code == expected.status_code == 200
+            assert actual.headers.get("etag") == expected.headers.get("etag")
+            assert actual.headers.get("cache-control") == expected.headers.get(
+                "cache-control"
+            )
+            if path in ("/tasks", "/queues"):
+                # snapshot_age differs between the two requests
+                expected_body = {**expected.json(), "snapshot_age": 0}
+                actual_body = {**actual.json(), "snapshot_age": 0}
+                assert actual_body == expected_body
+            else:
+                assert actual.json() == expected.json()
+
+        workers = fast.get("/workers").json()
+        assert workers["registered"] == {"w1": ["test_app.add"]}
+
+        response = fast.post("/tasks/status", json={"task_ids": ["fast-2"]})
+        assert response.json()[0]["info"] == {"done": 1}
+
+    def test_wide_integers(
+        self, celery_app: Celery, clients: tuple[TestClient, TestClient]
+    ) -> None:
+        """Test that results orjson cannot encode fall back to JSONResponse."""
+        celery_app.backend.store_result("fast-4", {"big": 2**70}, states.SUCCESS)
+        default, fast = clients
+        paths = [
+            "/tasks/fast-4",
+            "/tasks/fast-4/result",
+            "/tasks/status?task_id=fast-4",
+        ]
+        for path in paths:
+            expected, actual = default.get(path), fast.get(path)
+            assert actual.status_code == expected.status_code == 200
+            assert actual.json() == expected.json()
+
+        response = fast.post("/tasks/status", json={"task_ids": ["fast-4"]})
+        assert response.status_code == 200
+        assert response.json()[0]["result"] == {"big": 2**70}
+
+    def test_malformed_worker_reply(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that fast responses reject worker replies the model does not fit."""
+
+        def inspect(**_: Any) -> Any:
+            class Inspect:
+                def __getattr__(self, command: str) -> Any:
+                    if command == "revoked":
+                        return lambda: {"w1": [{"id": "r"}]}
+                    return lambda: {}
+
+            return Inspect()
+
+        monkeypatch.setattr(celery_app.control, "inspect", inspect)
+        for fast in (False, True):
+            bridge = CeleryFastAPIBridge(celery_app, FastAPI(), fast_responses=fast)
+            client = TestClient(bridge.register_routes(), raise_server_exceptions=False)
+            assert client.get("/tasks").status_code == 500
+
+    def test_conditional_get(
+        self, celery_app: Celery, clients: tuple[TestClient, TestClient]
+    ) -> None:
+        """Test that fast responses keep their ETag validation."""
+        celery_app.backend.store_result("fast-3", 1, states.SUCCESS)
+        _, fast = clients
+        etag = fast.get("/tasks/fast-3").headers["etag"]
+        response = fast.get("/tasks/fast-3", headers={"If-None-Match": etag})
+        assert response.status_code == 304
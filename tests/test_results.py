@@ -0,0 +1,445 @@
+"""Tests for non-blocking result backend access."""
+
+import asyncio
+import datetime
+import threading
+
+import pytest
+from celery import Celery, states
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.results import (
+    ResultCache,
+    ResultFetcher,
+    split_raw_meta,
+)
+
+
+class TestResultFetcher:
+    """Tests for ResultFetcher."""
+
+    async def test_get_meta_single_fetch(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a lookup performs exactly one backend read."""
+        celery_app.backend.store_result("task-1", 5, states.SUCCESS)
+        calls: list[str] = []
+        backend_cls = type(celery_app.backend)
+        original = backend_cls.get_task_meta
+
+        def get_task_meta(self, task_id, *args, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(task_id)
+            return original(self, task_id, *args, **kwargs)
+
+        monkeypatch.setattr(backend_cls, "get_task_meta", get_task_meta)
+        fetcher = ResultFetcher(celery_app)
+        meta = await fetcher.get_meta("task-1")
+        await fetcher.close()
+
+        assert meta["status"] == states.SUCCESS
+        assert meta["result"] == 5
+        assert calls == ["task-1"]
+
+
+class TestResultCache:
+    """Tests for the terminal result cache and read coalescing."""
+
+    def test_only_terminal_metas_are_cached(self) -> None:
+        """Test that running tasks are never cached."""
+        cache = ResultCache()
+        cache.put("running", {"status": states.STARTED, "result": None})
+        cache.put("done", {"status": states.SUCCESS, "result": 1})
+
+        assert cache.get("running") is None
+        assert cache.get("done") == {"status": states.SUCCESS, "result": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_bounded_by_entries_and_bytes(self) -> None:
+        """Test that the least recently used metas are evicted first."""
+        cache = ResultCache(max_entries=2)
+        for task_id in ("a", "b"):
+            cache.put(task_id, {"status": states.SUCCESS, "result": task_id})
+        cache.get("a")
+        cache.put("c", {"status": states.SUCCESS, "result": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+        cache = ResultCache(max_bytes=200)
+        cache.put("big", {"status": states.SUCCESS, "result": "x" * 500})
+        assert len(cache) == 0
+        for task_id in ("d", "e", "f"):
+            cache.put(task_id, {"status": states.SUCCESS, "result": "x" * 60})
+        assert len(cache) == 2
+        assert cache.size <= 200
+        assert cache.get("d") is None
+
+    def test_ttl(self) -> None:
+        """Test that expired metas are dropped."""
+        cache = ResultCache(ttl=0)
+        cache.put("t", {"status": states.SUCCESS, "result": 1})
+        assert cache.get("t") is None
+        assert len(cache) == 0
+
+    async def test_terminal_meta_read_once(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that finished tasks are read from the backend only once."""
+        celery_app.backend.store_result("cached-1", 5, states.SUCCESS)
+        celery_app.backend.store_result("cached-2", None, states.STARTED)
+        calls: list[str] = []
+        backend_cls = type(celery_app.backend)
+        original = backend_cls.get_task_meta
+
+        def get_task_meta(self, task_id, *args, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(task_id)
+            return original(self, task_id, *args, **kwargs)
+
+        monkeypatch.setattr(backend_cls, "get_task_meta", get_task_meta)
+        fetcher = ResultFetcher(celery_app)
+        for _ in range(3):
+            await fetcher.get_meta("cached-1")
+            await fetcher.get_meta("cached-2")
+        metas = await fetcher.get_many_meta(["cached-1"])
+        await fetcher.close()
+
+        assert metas["cached-1"]["result"] == 5
+        assert calls.count("cached-1") == 1
+        assert calls.count("cached-2") == 3
+
+    async def test_concurrent_reads_coalesced(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent lookups of a task share one backend read."""
+        celery_app.backend.store_result("polled", {"done": 1}, "PROGRESS")
+        calls: list[str] = []
+        release = threading.Event()
+        backend_cls = type(celery_app.backend)
+        original = backend_cls.get_task_meta
+
+        def get_task_meta(self, task_id, *args, **kwargs):  # type: ignore[no-untyped-def]
+            calls.append(task_id)
+            release.wait(5)
+            return original(self, task_id, *args, **kwargs)
+
+        monkeypatch.setattr(backend_cls, "get_task_meta", get_task_meta)
+        fetcher = ResultFetcher(celery_app)
+        lookups = asyncio.gather(*(fetcher.get_meta("polled") for _ in range(500)))
+        await asyncio.sleep(0.05)
+        release.set()
+        metas = await lookups
+        await fetcher.close()
+
+        assert calls == ["polled"]
+        assert fetcher.coalesced == 499
+        assert all(meta["status"] == "PROGRESS" for meta in metas)
+
+
+class TestStatusEndpoints:
+    """Tests for status endpoints backed by the result fetcher."""
+
+    def test_status_success(self, celery_app: Celery, client: TestClient) -> None:
+        """Test status of a successful task."""
+        celery_app.backend.store_result("status-ok", {"total": 3}, states.SUCCESS)
+        response = client.get("/tasks/status-ok")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"] == "SUCCESS"
+        assert data["result"] == {"total": 3}
+        assert data["info"] == {"total": 3}
+        assert data["date_done"] is not None
+
+    def test_status_progress(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that progress meta is exposed as info without a result."""
+        celery_app.backend.store_result("busy", {"done": 1}, "PROGRESS")
+        data = client.get("/tasks/busy").json()
+        assert data["state"] == "PROGRESS"
+        assert data["result"] is None
+        assert data["info"] == {"done": 1}
+
+    def test_status_failure(self, celery_app: Celery, client: TestClient) -> None:
+        """Test status of a failed task."""
+        celery_app.backend.store_result(
+            "bad", ValueError("boom"), states.FAILURE, traceback="Traceback ..."
+        )
+        data = client.get("/tasks/bad").json()
+        assert data["state"] == "FAILURE"
+        assert data["result"] is None
+        assert data["info"] == {"error": "boom"}
+        assert data["traceback"] == "Traceback ..."
+
+    def test_result_ready(self, celery_app: Celery, client: TestClient) -> None:
+        """Test fetching a finished result."""
+        celery_app.backend.store_result("result-ok", 42, states.SUCCESS)
+        response = client.get("/tasks/result-ok/result")
+        assert response.status_code == 200
+        assert response.json() == 42
+
+    def test_result_failed(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that a failed task returns 500."""
+        celery_app.backend.store_result("result-bad", ValueError("x"), states.FAILURE)
+        assert client.get("/tasks/result-bad/result").status_code == 500
+
+    def test_result_not_ready(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that an unfinished task returns 202."""
+        celery_app.backend.store_result("result-busy", None, states.STARTED)
+        response = client.get("/tasks/result-busy/result", params={"timeout": 0.05})
+        assert response.status_code == 202
+        assert client.get("/tasks/result-busy/result").status_code == 202
+
+    def test_result_not_found(self, client: TestClient) -> None:
+        """Test that an unknown task returns 404."""
+        assert client.get("/tasks/missing/result").status_code == 404
+
+
+class TestBulkStatus:
+    """Tests for bulk task status lookups."""
+
+    async def test_get_many_meta_uses_mget(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that key-value backends are queried with one mget call."""
+        celery_app.backend.store_result("bulk-1", 1, states.SUCCESS)
+        celery_app.backend.store_result("bulk-2", None, states.STARTED)
+        calls: list[int] = []
+        backend_cls = type(celery_app.backend)
+        original = backend_cls.mget
+
+        def mget(self, keys):  # type: ignore[no-untyped-def]
+            calls.append(len(keys))
+            return original(self, keys)
+
+        # The backend is thread-local, so patch the class rather than the instance
+        monkeypatch.setattr(backend_cls, "mget", mget)
+        fetcher = ResultFetcher(celery_app)
+        metas = await fetcher.get_many_meta(["bulk-1", "bulk-2", "bulk-3"])
+        await fetcher.close()
+
+        assert calls == [3]
+        assert metas["bulk-1"]["result"] == 1
+        assert metas["bulk-2"]["status"] == states.STARTED
+        assert metas["bulk-3"]["status"] == states.PENDING
+
+    def test_get_bulk_status(self, celery_app: Celery, client: TestClient) -> None:
+        """Test GET /tasks/status with repeated IDs."""
+        celery_app.backend.store_result("bulk-get", 2, states.SUCCESS)
+        response = client.get(
+            "/tasks/status", params=[("task_id", "bulk-get"), ("task_id", "nope")]
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["task_id"] for item in data] == ["bulk-get", "nope"]
+        assert data[0]["result"] == 2
+        assert data[1]["state"] == "PENDING"
+
+    def test_post_bulk_status(self, celery_app: Celery, client: TestClient) -> None:
+        """Test POST /tasks/status with duplicate IDs."""
+        celery_app.backend.store_result("bulk-post", None, states.STARTED)
+        response = client.post(
+            "/tasks/status", json={"task_ids": ["bulk-post", "bulk-post"]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["state"] == "STARTED"
+
+
+class TestConditionalGet:
+    """Tests for ETags and If-None-Match on status, result and listing endpoints."""
+
+    def test_terminal_status_not_modified(
+        self, celery_app: Celery, client: TestClient
+    ) -> None:
+        """Test that a finished task's status is revalidated with 304."""
+        celery_app.backend.store_result("etag-1", 3, states.SUCCESS)
+        response = client.get("/tasks/etag-1")
+        etag = response.headers["etag"]
+        assert etag.startswith('"')
+        assert response.headers["cache-control"] == "max-age=3600, immutable"
+
+        response = client.get("/tasks/etag-1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        response = client.get("/tasks/etag-1", headers={"If-None-Match": "W/" + etag})
+        assert response.status_code == 304
+        response = client.get("/tasks/etag-1", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+    def test_progress_changes_etag(
+        self, celery_app: Celery, client: TestClient
+    ) -> None:
+        """Test that progress updates of a running task change its ETag."""
+        celery_app.backend.store_result("etag-2", {"done": 1}, "PROGRESS")
+        response = client.get("/tasks/etag-2")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "no-cache"
+
+        celery_app.backend.store_result("etag-2", {"done": 2}, "PROGRESS")
+        response = client.get("/tasks/etag-2", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_result_and_bulk_status(
+        self, celery_app: Celery, client: TestClient
+    ) -> None:
+        """Test conditional requests for results and bulk status lookups."""
+        celery_app.backend.store_result("etag-3", 42, states.SUCCESS)
+        etag = client.get("/tasks/etag-3/result").headers["etag"]
+        response = client.get("/tasks/etag-3/result", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        params = [("task_id", "etag-3"), ("task_id", "etag-4")]
+        response = client.get("/tasks/status", params=params)
+        assert response.headers["cache-control"] == "no-cache"
+        headers = {"If-None-Match": response.headers["etag"]}
+        assert (
+            client.get("/tasks/status", params=params, headers=headers).status_code
+            == 304
+        )
+
+        celery_app.backend.store_result("etag-4", 1, states.SUCCESS)
+        assert (
+            client.get("/tasks/status", params=params, headers=headers).status_code
+            == 200
+        )
+
+    def test_available_tasks(self, client: TestClient) -> None:
+        """Test that the task listing is tagged with the registry fingerprint."""
+        response = client.get("/available-tasks")
+        etag = response.headers["etag"]
+        response = client.get("/available-tasks", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        response = client.get("/available-tasks", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+
+class TestRawResults:
+    """Tests for streaming results from their stored JSON."""
+
+    def test_split_raw_meta(self) -> None:
+        """Test that only plain JSON results of successful metas are split."""
+        value = (
+            b'{"status": "SUCCESS", "result": {"a": "\\"traceback\\""}, '
+            b'"traceback": null, "children": null, "date_done": "2026-01-01", '
+            b'"task_id": "t"}'
+        )
+        split = split_raw_meta(value)
+        assert split is not None
+        meta, body = split
+        assert body == b'{"a": "\\"traceback\\""}'
+        assert meta == {
+            "status": states.SUCCESS,
+            "traceback": None,
+            "children": None,
+            "date_done": "2026-01-01",
+            "task_id": "t",
+        }
+
+        typed = value.replace(b'"a"', b'"__type__"')
+        assert split_raw_meta(typed) is None
+        assert split_raw_meta(value.replace(b"SUCCESS", b"FAILURE")) is None
+        for token in (b"NaN", b"Infinity", b"-Infinity"):
+            non_finite = value.replace(b'"\\"traceback\\""', token)
+            assert split_raw_meta(non_finite) is None
+
+    async def test_large_result_not_decoded(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that results above the threshold are read without decoding."""
+        celery_app.backend.store_result("raw-1", list(range(1000)), states.SUCCESS)
+        celery_app.backend.store_result("raw-2", [1], states.SUCCESS)
+        decoded: list[int] = []
+        backend_cls = type(celery_app.backend)
+        original = backend_cls.decode_result
+
+        def decode_result(self, payload):  # type: ignore[no-untyped-def]
+            decoded.append(len(payload))
+            return original(self, payload)
+
+        monkeypatch.setattr(backend_cls, "decode_result", decode_result)
+        fetcher = ResultFetcher(celery_app)
+        meta, body = await fetcher.get_raw_result("raw-1", min_size=1024)
+        small_meta, small_body = await fetcher.get_raw_result("raw-2", min_size=1024)
+        await fetcher.close()
+
+        assert body is not None
+        assert body.startswith(b"[0, 1, 2")
+        assert "result" not in meta
+        assert meta["task_id"] == "raw-1"
+        assert small_body is None
+        assert small_meta["result"] == [1]
+        assert len(decoded) == 1
+
+    def test_result_endpoint_streams_raw_json(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that raw results match the decoded ones, compressed or not."""
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, raw_result_min_size=0)
+        client = TestClient(bridge.register_routes())
+        result = {"items": [{"id": i, "name": f"n{i}"} for i in range(5000)]}
+        celery_app.backend.store_result("raw-3", result, states.SUCCESS)
+
+        response = client.get(
+            "/tasks/raw-3/result", headers={"Accept-Encoding": "identity"}
+        )
+        assert response.json() == result
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == str(len(response.content))
+        etag = response.headers["etag"]
+
+        response = client.get(
+            "/tasks/raw-3/result", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == etag[:-1] + '-gzip"'
+        assert response.json() == result
+
+        headers = {"If-None-Match": response.headers["etag"]}
+        assert client.get("/tasks/raw-3/result", headers=headers).status_code == 304
+
+    def test_raw_and_decoded_etags_differ(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that the stored JSON and the re-encoded result have distinct ETags."""
+        celery_app.backend.store_result("raw-6", {"a": [1, 2]}, states.SUCCESS)
+        raw = CeleryFastAPIBridge(celery_app, raw_result_min_size=0)
+        decoded = CeleryFastAPIBridge(celery_app, fastapi_app)
+        headers = {"Accept-Encoding": "identity"}
+        raw_response = TestClient(raw.register_routes()).get(
+            "/tasks/raw-6/result", headers=headers
+        )
+        decoded_response = TestClient(decoded.register_routes()).get(
+            "/tasks/raw-6/result", headers=headers
+        )
+
+        assert raw_response.json() == decoded_response.json()
+        assert raw_response.content != decoded_response.content
+        assert raw_response.headers["etag"] != decoded_response.headers["etag"]
+
+    def test_non_finite_results_are_decoded(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that results holding NaN are decoded, not passed through."""
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, raw_result_min_size=0)
+        client = TestClient(bridge.register_routes())
+        celery_app.backend.store_result("raw-7", {"v": float("nan")}, states.SUCCESS)
+
+        response = client.get("/tasks/raw-7/result")
+        assert response.status_code == 200
+        assert response.json() == {"v": None}
+
+    def test_typed_results_are_decoded(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that results kombu encodes as typed objects are not passed through."""
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, raw_result_min_size=0)
+        client = TestClient(bridge.register_routes())
+        done = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        celery_app.backend.store_result("raw-4", {"at": done}, states.SUCCESS)
+        celery_app.backend.store_result("raw-5", None, states.STARTED)
+
+        assert client.get("/tasks/raw-4/result").json() == {"at": done.isoformat()}
+        assert client.get("/tasks/raw-5/result").status_code == 202
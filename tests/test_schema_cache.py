@@ -0,0 +1,80 @@
+"""Tests for the on-disk OpenAPI document cache."""
+
+from pathlib import Path
+
+import pytest
+from celery import Celery
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.schema_cache import SchemaCache
+
+
+def _bridge(celery_app: Celery, cache_dir: Path) -> CeleryFastAPIBridge:
+    bridge = CeleryFastAPIBridge(
+        celery_app, FastAPI(title="Cached"), schema_cache=str(cache_dir)
+    )
+    bridge.register_routes()
+    return bridge
+
+
+class TestSchemaCache:
+    """Tests for SchemaCache and the registry fingerprint."""
+
+    def test_fingerprint_tracks_registry(
+        self, celery_app: Celery, tmp_path: Path
+    ) -> None:
+        """Test that the fingerprint is stable and changes with the tasks."""
+        first = _bridge(celery_app, tmp_path).schema_fingerprint()
+        assert _bridge(celery_app, tmp_path).schema_fingerprint() == first
+
+        @celery_app.task(name="test_app.subtract")
+        def subtract(x: int, y: int) -> int:
+            return x - y
+
+        assert _bridge(celery_app, tmp_path).schema_fingerprint() != first
+
+    def test_document_reused_across_apps(
+        self,
+        celery_app: Celery,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a second app serves the stored document without generating it."""
+        document = TestClient(_bridge(celery_app, tmp_path).fastapi_app).get(
+            "/openapi.json"
+        )
+        assert document.status_code == 200
+        assert len(list(tmp_path.glob("openapi-*.json"))) == 1
+
+        def fail(**_: object) -> None:
+            raise AssertionError("OpenAPI document regenerated")
+
+        monkeypatch.setattr("fastapi.applications.get_openapi", fail)
+        client = TestClient(_bridge(celery_app, tmp_path).fastapi_app)
+        assert client.get("/openapi.json").json() == document.json()
+
+    def test_routes_added_later(self, celery_app: Celery, tmp_path: Path) -> None:
+        """Test that adding a route after registration refreshes the document."""
+        bridge = _bridge(celery_app, tmp_path)
+        client = TestClient(bridge.fastapi_app)
+        assert "/extra" not in client.get("/openapi.json").json()["paths"]
+
+        @bridge.fastapi_app.get("/extra")
+        async def extra() -> dict[str, str]:
+            return {}
+
+        assert "/extra" in client.get("/openapi.json").json()["paths"]
+        assert len(list(tmp_path.glob("openapi-*.json"))) == 2
+
+    def test_unreadable_entry(self, tmp_path: Path) -> None:
+        """Test that corrupt entries are misses and writes are atomic."""
+        cache = SchemaCache(tmp_path / "cache")
+        assert cache.load("abc") is None
+        cache.store("abc", {"openapi": "3.1.0"})
+        assert cache.load("abc") == {"openapi": "3.1.0"}
+        assert [p.name for p in cache.directory.iterdir()] == ["openapi-abc.json"]
+
+        cache.path_for("abc").write_text("{not json")
+        assert cache.load("abc") is None
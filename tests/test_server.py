@@ -0,0 +1,96 @@
+"""Tests for the server utilities."""
+
+import contextlib
+import gc
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from celery_fastapi.server import (
+    BOOT_WINDOW,
+    MAX_RESTART_BACKOFF,
+    RESTART_BACKOFF,
+    PreforkServer,
+    _create_worker_server,
+    freeze_for_fork,
+    prefork_hooks,
+    process_memory,
+    worker_report,
+)
+
+
+class TestPrefork:
+    """Tests for pre-fork helpers."""
+
+    def test_process_memory(self) -> None:
+        """Test that the resident set size is reported."""
+        memory = process_memory()
+        assert memory["rss"] > 0
+        assert memory.get("private", 0) <= memory["rss"]
+
+    def test_worker_report(self) -> None:
+        """Test the worker startup report."""
+        report = worker_report(time.perf_counter())
+        assert report.startswith("Worker ")
+        assert " ms, RSS " in report
+
+    def test_freeze_for_fork(self) -> None:
+        """Test that existing objects are moved to the permanent generation."""
+        try:
+            freeze_for_fork()
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+    def test_gunicorn_hooks(self) -> None:
+        """Test that workers log their startup after being forked."""
+        hooks = prefork_hooks()
+        messages: list[str] = []
+        worker = SimpleNamespace(log=SimpleNamespace(info=messages.append))
+        hooks["post_fork"](None, worker)
+        hooks["post_worker_init"](worker)
+        assert len(messages) == 1
+        assert messages[0].startswith("Worker ")
+
+    def test_restart_backoff(self) -> None:
+        """Test that workers dying during startup are replaced with backoff."""
+        server = PreforkServer(None, 2)
+        now = time.monotonic()
+        delays = []
+        for pid in range(1, 10):
+            server._children[pid] = now
+            delays.append(server._restart_delay(pid))
+        assert delays[:3] == [RESTART_BACKOFF, RESTART_BACKOFF * 2, RESTART_BACKOFF * 4]
+        assert delays[-1] == MAX_RESTART_BACKOFF
+        assert server._boot_failures == 9
+
+        server._children[10] = now - BOOT_WINDOW
+        assert server._restart_delay(10) == 0
+        assert server._boot_failures == 0
+        assert server._children == {}
+
+    async def test_failed_startup_not_reported(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a worker whose startup fails does not log it as ready."""
+        uvicorn = pytest.importorskip("uvicorn")
+
+        async def app(_scope: dict[str, Any], receive: Any, send: Any) -> None:
+            await receive()
+            await send({"type": "lifespan.startup.failed", "message": "boom"})
+
+        config = uvicorn.Config(app, lifespan="on")
+        config.load()
+        server = _create_worker_server(config, time.perf_counter())
+        server.lifespan = config.lifespan_class(config)
+        # Newer uvicorn versions exit, older ones set should_exit and return
+        with (
+            caplog.at_level(logging.INFO, logger="uvicorn.error"),
+            contextlib.suppress(SystemExit),
+        ):
+            await server.startup()
+        assert not server.started
+        assert not any(r.getMessage().startswith("Worker ") for r in caplog.records)
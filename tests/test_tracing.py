@@ -0,0 +1,112 @@
+"""Tests for OpenTelemetry tracing of submissions and backend reads."""
+
+from typing import Any
+
+import pytest
+from celery import Celery, states
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge, InlinePublisher
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF  # noqa: E402
+
+from celery_fastapi.tracing import BridgeTracer  # noqa: E402
+
+
+class RecordingPublisher(InlinePublisher):
+    """Inline publisher recording the options of each published task."""
+
+    def __init__(self, celery_app: Celery) -> None:
+        super().__init__(celery_app)
+        self.options: list[dict[str, Any]] = []
+
+    async def send(self, task_name: str, **options: Any) -> str:
+        self.options.append(options)
+        return await super().send(task_name, **options)
+
+
+def _tracer(**provider_options: Any) -> tuple[BridgeTracer, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(**provider_options)
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return BridgeTracer(tracer_provider=provider), exporter
+
+
+class TestBridgeTracer:
+    """Tests for BridgeTracer spans and trace context propagation."""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_submission_spans_and_headers(
+        self, celery_app: Celery, fastapi_app: FastAPI, lazy: bool
+    ) -> None:
+        """Test that submissions are traced and the context reaches the task."""
+        tracer, exporter = _tracer()
+        publisher = RecordingPublisher(celery_app)
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            publisher=publisher,
+            tracer=tracer,
+            lazy_task_routes=lazy,
+        )
+        client = TestClient(bridge.register_routes())
+        response = client.post("/test_app/add", json={"x": 1, "y": 2})
+        assert response.status_code == 200
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert ("celery_fastapi.validate" in spans) is lazy
+        assert ("celery_fastapi.build_message" in spans) is not lazy
+        assert ("celery_fastapi.parse" in spans) is lazy
+        publish = spans["publish test_app.add"]
+        assert publish.attributes is not None
+        assert publish.attributes["messaging.destination.name"] == "celery"
+        assert publish.attributes["messaging.message.id"] == response.json()["task_id"]
+
+        traceparent = publisher.options[0]["headers"]["traceparent"]
+        assert traceparent.split("-")[1] == f"{publish.context.trace_id:032x}"
+        assert traceparent.split("-")[2] == f"{publish.context.span_id:016x}"
+
+    def test_batch_and_backend_spans(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test the batch publish span and result backend read spans."""
+        tracer, exporter = _tracer()
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, tracer=tracer)
+        client = TestClient(bridge.register_routes())
+        celery_app.backend.store_result("trace-1", 3, states.SUCCESS)
+
+        client.post("/test_app/add/batch", json=[{"x": 1, "y": 2}] * 2)
+        client.get("/tasks/trace-1")
+
+        names = [span.name for span in exporter.get_finished_spans()]
+        assert names.count("celery_fastapi.validate") == 2
+        assert "publish batch" in names
+        assert "backend get_task_meta" in names
+
+    def test_existing_headers_are_kept(self) -> None:
+        """Test that injection copies the options and keeps user headers."""
+        tracer, _ = _tracer()
+        options = {"queue": "celery", "headers": {"tenant": "a"}}
+        with tracer.span("test"):
+            injected = tracer.inject(options)
+        assert injected["headers"]["tenant"] == "a"
+        assert "traceparent" in injected["headers"]
+        assert options["headers"] == {"tenant": "a"}
+
+    def test_unsampled_requests_record_nothing(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that a sampler dropping every trace exports no spans."""
+        tracer, exporter = _tracer(sampler=ALWAYS_OFF)
+        bridge = CeleryFastAPIBridge(celery_app, fastapi_app, tracer=tracer)
+        client = TestClient(bridge.register_routes())
+        assert client.post("/test_app/add", json={"x": 1, "y": 2}).status_code == 200
+        assert exporter.get_finished_spans() == ()
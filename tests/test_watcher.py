@@ -0,0 +1,198 @@
+"""Tests for task progress watching, SSE and WebSocket endpoints."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from celery import Celery, states
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from celery_fastapi import CeleryFastAPIBridge
+from celery_fastapi.results import ResultFetcher
+from celery_fastapi.watcher import TaskWatcher
+
+
+class TestTaskWatcher:
+    """Tests for TaskWatcher."""
+
+    async def test_delivers_changes_until_terminal(self, celery_app: Celery) -> None:
+        """Test that only changes are pushed and terminal states end the watch."""
+        celery_app.backend.store_result("watch-1", {"done": 1}, "PROGRESS")
+        watcher = TaskWatcher(ResultFetcher(celery_app), interval=0.01)
+        subscription = watcher.subscribe("watch-1")
+
+        first = await subscription.get(timeout=5)
+        assert first is not None
+        assert first["status"] == "PROGRESS"
+        # Unchanged meta is not pushed again
+        assert await subscription.get(timeout=0.05) is None
+
+        celery_app.backend.store_result("watch-1", 3, states.SUCCESS)
+        last = await subscription.get(timeout=5)
+        assert last is not None
+        assert last["status"] == states.SUCCESS
+        assert watcher.subscription_count == 0
+        assert watcher.watched_task_count == 0
+        await watcher.close()
+
+    async def test_shared_polling(
+        self, celery_app: Celery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that all subscribers share one backend read per interval."""
+        fetcher = ResultFetcher(celery_app)
+        calls: list[list[str]] = []
+        original = fetcher.get_many_meta
+
+        async def get_many_meta(task_ids: list[str]):  # type: ignore[no-untyped-def]
+            calls.append(sorted(task_ids))
+            return await original(task_ids)
+
+        monkeypatch.setattr(fetcher, "get_many_meta", get_many_meta)
+        celery_app.backend.store_result("watch-2", None, states.STARTED)
+        celery_app.backend.store_result("watch-3", None, states.STARTED)
+        watcher = TaskWatcher(fetcher, interval=60)
+        subscriptions = [watcher.subscribe("watch-2") for _ in range(3)]
+        subscriptions.append(watcher.subscribe("watch-3"))
+
+        for subscription in subscriptions:
+            assert await subscription.get(timeout=5) is not None
+        assert calls == [["watch-2", "watch-3"]]
+        assert watcher.watched_task_count == 2
+        await watcher.close()
+        await fetcher.close()
+
+    async def test_max_subscriptions(self, celery_app: Celery) -> None:
+        """Test that subscribing beyond the limit raises OverflowError."""
+        watcher = TaskWatcher(ResultFetcher(celery_app), max_subscriptions=1)
+        subscription = watcher.subscribe("watch-4")
+        with pytest.raises(OverflowError):
+            watcher.subscribe("watch-5")
+
+        subscription.close()
+        assert watcher.subscription_count == 0
+        watcher.subscribe("watch-5")
+        await watcher.close()
+
+    async def test_wait(self, celery_app: Celery) -> None:
+        """Test that concurrent waiters are all woken by one state change."""
+        celery_app.backend.store_result("wait-1", None, states.STARTED)
+        watcher = TaskWatcher(ResultFetcher(celery_app), interval=0.01)
+        timer = threading.Timer(
+            0.1,
+            celery_app.backend.store_result,
+            args=("wait-1", 4, states.SUCCESS),
+        )
+        timer.start()
+        metas = await asyncio.gather(*(watcher.wait("wait-1", 5) for _ in range(20)))
+        await watcher.close()
+
+        assert all(meta is not None and meta["result"] == 4 for meta in metas)
+        assert watcher.subscription_count == 0
+
+    async def test_wait_timeout(self, celery_app: Celery) -> None:
+        """Test that wait returns the unready meta after the timeout."""
+        celery_app.backend.store_result("wait-2", None, states.STARTED)
+        watcher = TaskWatcher(ResultFetcher(celery_app), interval=0.01)
+        meta = await watcher.wait("wait-2", 0.1)
+        await watcher.close()
+
+        assert meta is not None
+        assert meta["status"] == states.STARTED
+        assert watcher.subscription_count == 0
+
+
+class TestLongPoll:
+    """Tests for long-polling the result endpoint."""
+
+    def test_result_long_poll(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that a waiting request returns once the task succeeds."""
+        celery_app.backend.store_result("poll-1", None, states.STARTED)
+        timer = threading.Timer(
+            0.2,
+            celery_app.backend.store_result,
+            args=("poll-1", {"total": 5}, states.SUCCESS),
+        )
+        timer.start()
+        response = client.get("/tasks/poll-1/result", params={"timeout": 5})
+        assert response.status_code == 200
+        assert response.json() == {"total": 5}
+
+    def test_result_long_poll_busy(
+        self, celery_app: Celery, fastapi_app: FastAPI
+    ) -> None:
+        """Test that waiters beyond the cap are rejected with 503."""
+        celery_app.backend.store_result("poll-2", None, states.STARTED)
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            task_watcher=TaskWatcher(ResultFetcher(celery_app), max_subscriptions=0),
+        )
+        client = TestClient(bridge.register_routes())
+        response = client.get("/tasks/poll-2/result", params={"timeout": 1})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+        # Requests that do not wait are unaffected
+        assert client.get("/tasks/poll-2/result").status_code == 202
+
+
+class TestProgressEndpoints:
+    """Tests for the SSE and WebSocket progress endpoints."""
+
+    def test_sse_streams_until_terminal(
+        self, celery_app: Celery, client: TestClient
+    ) -> None:
+        """Test that the SSE stream reports progress and ends on success."""
+        celery_app.backend.store_result("sse-1", {"done": 1}, "PROGRESS")
+        timer = threading.Timer(
+            0.3,
+            celery_app.backend.store_result,
+            args=("sse-1", 9, states.SUCCESS),
+        )
+        timer.start()
+        with client.stream("GET", "/tasks/sse-1/events") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = response.read().decode()
+
+        events = [
+            json.loads(line.removeprefix("data: "))
+            for line in body.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert "event: status" in body
+        assert [event["state"] for event in events] == ["PROGRESS", "SUCCESS"]
+        assert events[0]["info"] == {"done": 1}
+        assert events[-1]["result"] == 9
+
+    def test_sse_timeout(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that the SSE stream closes after the timeout."""
+        celery_app.backend.store_result("sse-2", None, states.STARTED)
+        response = client.get("/tasks/sse-2/events", params={"timeout": 0.2})
+        assert response.status_code == 200
+        assert response.text.count("event: status") == 1
+
+    def test_sse_overflow(self, celery_app: Celery, fastapi_app: FastAPI) -> None:
+        """Test that the SSE endpoint returns 503 when subscriptions are exhausted."""
+        bridge = CeleryFastAPIBridge(
+            celery_app,
+            fastapi_app,
+            task_watcher=TaskWatcher(ResultFetcher(celery_app), max_subscriptions=0),
+        )
+        client = TestClient(bridge.register_routes())
+        response = client.get("/tasks/sse-3/events")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+
+    def test_websocket_failure(self, celery_app: Celery, client: TestClient) -> None:
+        """Test that the WebSocket pushes the failed state and closes."""
+        celery_app.backend.store_result("ws-1", ValueError("boom"), states.FAILURE)
+        with client.websocket_connect("/tasks/ws-1/ws") as websocket:
+            message = websocket.receive_json()
+            closed = websocket.receive()
+
+        assert message["state"] == "FAILURE"
+        assert message["info"] == {"error": "boom"}
+        assert closed["type"] == "websocket.close"
+        assert closed["code"] == 1000